@@ -0,0 +1,239 @@
+"""
+Performance benchmarks for the projection engine and the rendering builders.
+
+Times calculate_projections across horizon lengths, campaign counts and tier
+counts, array-only project(), the batch, scenario comparison, period and cohort engines, and the table
+page and figure builders the Streamlit components use. Inputs are generated from fixed seeds so
+runs are comparable. Results are saved as JSON baselines; compare mode re-runs
+the suite and exits non-zero when any benchmark is slower than its baseline by
+more than the threshold.
+
+Usage:
+    python src/benchmark.py run -o benchmarks/baseline.json
+    python src/benchmark.py compare benchmarks/baseline.json --threshold 0.25
+    python src/benchmark.py run -o /tmp/bench.json --filter projection.campaigns
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from models.campaign import MarketingCampaign
+from models.subscription import SubscriptionTier
+from services.projection_service import ProjectionService
+
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25  # Allowed slowdown vs. the baseline before compare fails
+BENCHMARK_SEED = 1234
+PERIOD_START_DATE = "2025-01-01"
+
+
+def make_service(campaigns: int = 3, tiers: int = 3, seed: int = BENCHMARK_SEED) -> ProjectionService:
+    """A service with deterministic random campaigns and evenly split tiers."""
+    rng = np.random.default_rng(seed)
+    service = ProjectionService.from_config({'enable_churn': True, 'churn_rate': 0.03})
+    if tiers != len(service.subscriptions):
+        service.subscriptions = [
+            SubscriptionTier(
+                name=f"Tier {idx + 1}",
+                monthly_price=float(rng.uniform(1, 50)),
+                features=[],
+                distribution_percentage=1 / tiers
+            )
+            for idx in range(tiers)
+        ]
+    service.campaigns = [
+        MarketingCampaign(
+            name=f"Campaign {idx + 1}",
+            campaign_id=f"camp_{idx + 1}",
+            start_month=int(rng.integers(1, 13)),
+            duration_months=int(rng.integers(1, 13)),
+            budget=float(rng.uniform(1000, 50000)),
+            expected_reach=int(rng.integers(1000, 1000000)),
+            reach_to_download_rate=float(rng.uniform(0.01, 0.1)),
+            download_to_active_rate=float(rng.uniform(0.1, 0.5)),
+            active_to_subscriber_rate=float(rng.uniform(0.1, 1.0))
+        )
+        for idx in range(campaigns)
+    ]
+    return service
+
+
+def cold_projection(service: ProjectionService, months: int, as_frame: bool = True) -> Callable[[], object]:
+    """Full calculate_projections, or project() without as_frame, without reusing the previous call's months."""
+    def run():
+        service._state = None
+        return service.calculate_projections(months) if as_frame else service.project(months)
+    return run
+
+
+def long_frame(points: int) -> Tuple[pd.DataFrame, ProjectionService]:
+    """A calculate_projections-shaped frame with `points` rows built from a daily run."""
+    service = make_service()
+    months = int(np.ceil(points / 28))
+    period = service.calculate_period_projections(months, "day", start_date=PERIOD_START_DATE)
+    frame = period.iloc[:points].reset_index(drop=True)
+    frame['month'] = np.arange(1, len(frame) + 1)
+    return frame, service
+
+
+def benchmarks() -> Iterator[Tuple[str, Callable[[], object]]]:
+    """Yield (name, callable) for every benchmark; setup runs here, outside the timings."""
+    from components.charts import _build_revenue_figure, _build_users_figure
+    from components.data_table import build_table_page
+    from services.scenario_service import compare_scenarios
+
+    service = make_service()
+    for months in (12, 24, 36):
+        yield f"projection.horizon[months={months}]", cold_projection(service, months)
+
+    yield "projection.result[months=36]", cold_projection(service, 36, as_frame=False)
+
+    for campaigns in (0, 10, 100, 1000):
+        yield f"projection.campaigns[n={campaigns}]", cold_projection(make_service(campaigns=campaigns), 36)
+
+    for tiers in (3, 10, 40):
+        tiered = make_service(tiers=tiers)
+        yield f"projection.tiers[n={tiers}]", cold_projection(tiered, 36)
+        yield f"projection.tier_frame[n={tiers}]", (
+            lambda tiered=tiered, frame=tiered.calculate_projections(36): tiered.calculate_tier_projections(frame)
+        )
+
+    rng = np.random.default_rng(BENCHMARK_SEED)
+    for scenarios in (1, 100, 10000):
+        growth_rates = rng.uniform(0.01, 0.15, scenarios)
+        yield f"projection.batch[n={scenarios}]", (
+            lambda growth_rates=growth_rates: service.calculate_projections_batch(36, growth_rates=growth_rates)
+        )
+
+    yield "projection.scenario_comparison[presets=3]", lambda: compare_scenarios(service, months=36)
+
+    for granularity, months in (("week", 120), ("day", 120), ("day", 600)):
+        yield f"projection.period[{granularity},months={months}]", (
+            lambda granularity=granularity, months=months: service.calculate_period_projections(
+                months, granularity, start_date=PERIOD_START_DATE, dtype="float32"
+            )
+        )
+
+    cohort = make_service()
+    cohort.update(churn_model="cohort")
+    yield "projection.cohort[months=36]", cold_projection(cohort, 36)
+    yield "projection.cohort_period[day,months=120]", (
+        lambda: cohort.calculate_period_projections(120, "day", start_date=PERIOD_START_DATE)
+    )
+
+    for points in (36, 10000):
+        if points == 36:
+            frame, owner = service.calculate_projections(36), service
+        else:
+            frame, owner = long_frame(points)
+        tiers = owner.calculate_tier_projections(frame)
+        yield f"table.page[rows={points}]", lambda frame=frame, tiers=tiers: build_table_page(frame, tiers)
+        yield f"figure.revenue[points={points}]", (
+            lambda frame=frame, tiers=tiers, owner=owner: _build_revenue_figure(frame, tiers, owner)
+        )
+        yield f"figure.users[points={points}]", (
+            lambda frame=frame, tiers=tiers, owner=owner: _build_users_figure(frame, tiers, owner)
+        )
+
+
+def time_callable(function: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Per-call seconds over `repeat` runs of an auto-sized loop (at least 0.2 s each)."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'number': number,
+        'repeat': repeat
+    }
+
+
+def run_suite(repeat: int = DEFAULT_REPEAT, name_filter: Optional[str] = None) -> Dict[str, object]:
+    results = {}
+    for name, function in benchmarks():
+        if name_filter and name_filter not in name:
+            continue
+        function()  # Warm imports and caches outside the timings
+        results[name] = time_callable(function, repeat)
+        print(f"{name:<45} {results[name]['min'] * 1e3:>10.3f} ms", file=sys.stderr)
+
+    return {
+        'metadata': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'machine': platform.machine()
+        },
+        'results': results
+    }
+
+
+def compare(baseline: Dict[str, object], current: Dict[str, object],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, float, float, float]]:
+    """Return (name, baseline s, current s, ratio) for benchmarks slower than 1 + threshold."""
+    regressions = []
+    for name, result in current['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            continue
+        ratio = result['min'] / previous['min']
+        if ratio > 1 + threshold:
+            regressions.append((name, previous['min'], result['min'], ratio))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark projection and rendering performance.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the suite and save a JSON baseline")
+    run_parser.add_argument("-o", "--output", required=True, help="Baseline file to write")
+
+    compare_parser = subparsers.add_parser("compare", help="Run the suite and compare with a baseline")
+    compare_parser.add_argument("baseline", help="Baseline file written by 'run'")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="Allowed relative slowdown (default: %(default)s)")
+    compare_parser.add_argument("-o", "--output", help="Also save the new results here")
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark")
+        sub.add_argument("--filter", dest="name_filter", help="Only run benchmarks whose name contains this")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.command == "compare":
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+
+    current = run_suite(repeat=args.repeat, name_filter=args.name_filter)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(current, handle, indent=2)
+
+    if baseline is None:
+        return 0
+
+    regressions = compare(baseline, current, args.threshold)
+    for name, previous, latest, ratio in regressions:
+        print(f"REGRESSION {name}: {previous * 1e3:.3f} ms -> {latest * 1e3:.3f} ms ({ratio:.2f}x)", file=sys.stderr)
+    missing = sorted(set(baseline['results']) - set(current['results']))
+    if missing and not args.name_filter:
+        print(f"Not in this run: {', '.join(missing)}", file=sys.stderr)
+    print(f"{len(regressions)} of {len(current['results'])} benchmarks regressed "
+          f"by more than {args.threshold:.0%}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Headless batch runner for projection configs.
+
+Reads configs in the ProjectionService.to_config() layout, with optional "id" and
+"months" keys, from a directory of .json/.jsonl files, a single .jsonl file or a
+JSONL stream on stdin. The configs are evaluated in parallel and all results are
+written to one CSV, JSONL or Parquet file with a row per config, month and tier.
+This module must not import streamlit or plotly so that scheduler invocations
+start quickly.
+
+Usage:
+    python src/cli.py configs/ -o results.csv
+    cat configs.jsonl | python src/cli.py - -o results.parquet --workers 8
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import pandas as pd
+from services.projection_service import ProjectionService
+
+OUTPUT_FORMATS = ("csv", "jsonl", "parquet")
+
+
+class ConfigParseError(ValueError):
+    """A config file or JSONL line that is not a JSON object; reported for its id only."""
+
+
+ConfigItem = Tuple[str, Union[Dict[str, Any], ConfigParseError]]
+
+
+def iter_configs(source: str) -> Iterator[ConfigItem]:
+    """
+    Yield (config_id, config) pairs from a directory, a JSON/JSONL file or '-' for stdin.
+
+    Malformed JSON and payloads that are not objects yield a ConfigParseError
+    in place of the config, so one bad entry fails only its own id.
+    """
+    if source == "-":
+        yield from _iter_jsonl(sys.stdin, "stdin")
+        return
+
+    path = Path(source)
+    files = sorted(p for p in path.iterdir() if p.suffix in (".json", ".jsonl")) if path.is_dir() else [path]
+    for file in files:
+        with open(file, encoding="utf-8") as handle:
+            if file.suffix == ".json":
+                yield _parse_config(handle.read(), file.stem)
+            else:
+                yield from _iter_jsonl(handle, file.stem)
+
+
+def _iter_jsonl(lines, prefix: str) -> Iterator[ConfigItem]:
+    for line_number, line in enumerate(lines, start=1):
+        if line.strip():
+            yield _parse_config(line, f"{prefix}:{line_number}")
+
+
+def _parse_config(text: str, default_id: str) -> ConfigItem:
+    try:
+        config = json.loads(text)
+    except json.JSONDecodeError as e:
+        return default_id, ConfigParseError(f"Invalid JSON: {e}")
+    if not isinstance(config, dict):
+        return default_id, ConfigParseError(f"Expected a JSON object, got {type(config).__name__}")
+    return str(config.get("id", default_id)), config
+
+
+def run_config(item: ConfigItem) -> Tuple[str, Optional[pd.DataFrame], Optional[str]]:
+    """Project one config, returning (config_id, projections, error)."""
+    config_id, config = item
+    if isinstance(config, ConfigParseError):
+        return config_id, None, str(config)
+    try:
+        service = ProjectionService.from_config(config)
+        result = service.project(months=config.get("months", 12))
+        projections = result.to_pandas()
+        tier_projections = result.tier_frame()
+    except Exception as e:
+        return config_id, None, str(e)
+
+    # One long row per (month, tier) with the monthly totals alongside
+    tier_projections = tier_projections.reset_index()
+    tier_projections['tier'] = tier_projections['tier'].astype(str)
+    results = projections.merge(tier_projections, on='month')
+    results.insert(0, "config_id", config_id)
+    return config_id, results, None
+
+
+def write_results(frames: List[pd.DataFrame], output: str, output_format: str) -> None:
+    """Write all projections as one long table with a row per config, month and tier."""
+    results = pd.concat(frames, ignore_index=True, sort=False)
+    if output_format == "csv":
+        results.to_csv(output, index=False)
+    elif output_format == "jsonl":
+        results.to_json(output, orient="records", lines=True)
+    else:
+        results.to_parquet(output, index=False)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run revenue projections for a batch of configs.")
+    parser.add_argument("source", help="Directory of .json/.jsonl configs, a .jsonl file, or '-' for stdin")
+    parser.add_argument("-o", "--output", required=True, help="Output file (.csv, .jsonl or .parquet)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, help="Output format (default: from extension)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    args = parser.parse_args(argv)
+
+    output_format = args.format or Path(args.output).suffix.lstrip(".")
+    if output_format not in OUTPUT_FORMATS:
+        parser.error(f"Cannot infer output format from '{args.output}'; use --format")
+
+    configs = list(iter_configs(args.source))
+    if args.workers > 1 and len(configs) > 1:
+        chunksize = max(1, len(configs) // (args.workers * 4))
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            results = list(executor.map(run_config, configs, chunksize=chunksize))
+    else:
+        results = [run_config(item) for item in configs]
+
+    frames = [projections for _, projections, _ in results if projections is not None]
+    errors = [(config_id, error) for config_id, _, error in results if error is not None]
+    for config_id, error in errors:
+        print(f"{config_id}: {error}", file=sys.stderr)
+
+    if frames:
+        write_results(frames, args.output, output_format)
+    print(f"Projected {len(frames)} of {len(configs)} configs -> {args.output}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,31 @@
 import streamlit as st
 import plotly.graph_objects as go
-from models.campaign import MarketingCampaign
-from typing import List
+from models.campaign_table import CampaignTable
+from services.projection_service import ProjectionService
+from utils.utils import session_memo
+from config.constants import PANEL_DEPENDENCIES
 
-def display_campaign_timeline(campaigns: List[MarketingCampaign]):
+def display_campaign_timeline(projection_service: ProjectionService):
+    campaigns = projection_service.campaigns
     if not campaigns:
         st.info("No campaigns have been set yet.")
         return
-        
+    
+    # Rebuild only after campaign edits, not tier or growth changes
+    fig = session_memo(
+        "campaign_timeline",
+        projection_service.dependency_version(PANEL_DEPENDENCIES["campaign_timeline"]),
+        lambda: _build_timeline_figure(campaigns)
+    )
+    st.plotly_chart(fig, use_container_width=True, key="campaign_timeline")
+    
+    intervals = campaigns.intervals
+    concurrency = intervals.concurrency(intervals.last_month)
+    busiest = int(concurrency.argmax())
+    if concurrency[busiest] > 1:
+        st.caption(f"Up to {concurrency[busiest]} campaigns run at once, first in month {busiest + 1}")
+
+def _build_timeline_figure(campaigns: CampaignTable) -> go.Figure:
     fig = go.Figure()
     
     colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
@@ -48,7 +66,7 @@ def display_campaign_timeline(campaigns: List[MarketingCampaign]):
             tickmode='linear',
             tick0=1,
             dtick=1,
-            range=[0, 13]
+            range=[0, max(13, campaigns.intervals.last_month + 1)]
         ),
         yaxis=dict(
             title="",
@@ -57,4 +75,4 @@ def display_campaign_timeline(campaigns: List[MarketingCampaign]):
         barmode='overlay'
     )
     
-    st.plotly_chart(fig, use_container_width=True) 
\ No newline at end of file
+    return fig 
\ No newline at end of file
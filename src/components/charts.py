@@ -1,7 +1,17 @@
+import copy
+import math
+from functools import lru_cache
+import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 from services.projection_service import ProjectionService
-from config.constants import CHART_COLORS
+from models.projection_results import MonteCarloResult, SensitivityResult, ScenarioComparison
+from config.constants import (
+    CHART_COLORS, CHART_RENDER_MODES, CHART_WEBGL_THRESHOLD, CHART_MAX_POINTS, CHART_MAX_TICKS,
+    SENSITIVITY_TOP_PARAMETERS
+)
+from utils.utils import session_memo
+from utils.downsampling import lttb_indices
 
 def get_tier_color(tier_name: str) -> str:
     """Return a consistent color for each subscription tier"""
@@ -11,22 +21,43 @@ def get_campaign_color(campaign_index: int) -> str:
     """Return a consistent color for each campaign"""
     return CHART_COLORS['campaign_colors'][campaign_index % len(CHART_COLORS['campaign_colors'])]
 
-def plot_revenue_chart(projections, projection_service: ProjectionService, key=None):
-    fig = go.Figure()
+def display_flat_churn_caption(projection_service: ProjectionService, subject: str):
+    """Note that a panel built on the batch engine ignores the cohort retention curves."""
+    if projection_service.enable_churn and projection_service.churn_model == "cohort":
+        st.caption(f"{subject} apply the monthly churn rate as a flat rate rather than cohort retention.")
+
+def plot_revenue_chart(projections, tier_projections, projection_service: ProjectionService, key=None,
+                       render_mode: str = "auto"):
+    fig = session_memo(
+        "revenue_chart",
+        (projection_service.version, id(projections), render_mode),
+        lambda: _build_revenue_figure(projections, tier_projections, projection_service, render_mode)
+    )
+    st.plotly_chart(fig, use_container_width=True, key=key)
+
+def _build_revenue_figure(projections, tier_projections, projection_service: ProjectionService,
+                          render_mode: str = "auto") -> dict:
+    tiers = projection_service.subscriptions
+    months = projections['month'].to_numpy()
+    webgl = use_webgl(len(months), render_mode)
+    indices = lttb_indices(months, projections['total_revenue'].to_numpy(), CHART_MAX_POINTS)
     
-    for tier in projection_service.subscriptions:
-        column_name = f'revenue_{tier.name.lower()}'
-        fig.add_trace(go.Scatter(
-            x=projections['month'],
-            y=projections[column_name],
-            name=f"{tier.name} Revenue",
-            stackgroup='one',
-            line=dict(color=get_tier_color(tier.name))
-        ))
+    x = months[indices]
+    tier_revenue = _tier_series(tier_projections, 'revenue')[:, indices]
+    if webgl:
+        # WebGL traces cannot stack, so draw cumulative sums and show the tier value on hover
+        series = [
+            dict(x=x, y=stacked, customdata=revenue)
+            for stacked, revenue in zip(np.cumsum(tier_revenue, axis=0), tier_revenue)
+        ]
+    else:
+        series = [dict(x=x, y=revenue) for revenue in tier_revenue]
     
     # Add campaign indicators
-    campaign_colors = ['#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+    markers = []
     for i, campaign in enumerate(projection_service.campaigns):
+        if campaign.start_month > len(months):
+            continue
         color = get_campaign_color(i)
         
         # Calculate campaign revenue impact
@@ -39,7 +70,8 @@ def plot_revenue_chart(projections, projection_service: ProjectionService, key=N
         revenue_impact = campaign_impact * avg_revenue_per_user
         
         # Add campaign marker
-        fig.add_trace(go.Scatter(
+        markers.append(dict(
+            type='scatter',
             x=[campaign.start_month],
             y=[projections['total_revenue'].iloc[campaign.start_month - 1]],
             mode='markers',
@@ -58,50 +90,35 @@ def plot_revenue_chart(projections, projection_service: ProjectionService, key=N
             )
         ))
     
-    fig.update_layout(
-        title="Projected Revenue by Tier",
-        xaxis_title="Month",
-        yaxis_title="Revenue ($)",
-        showlegend=True,
-        xaxis=dict(
-            range=[0.5, 12.5],  # This keeps the chart centered and prevents shifting
-            tickmode='linear',
-            tick0=1,
-            dtick=1
-        )
+    skeleton = _figure_skeleton("revenue", tuple(tier.name for tier in tiers), webgl, len(months))
+    return _fill_skeleton(skeleton, series, markers)
+
+def plot_users_chart(projections, tier_projections, projection_service: ProjectionService, render_mode: str = "auto"):
+    fig = session_memo(
+        "users_chart",
+        (projection_service.version, id(projections), render_mode),
+        lambda: _build_users_figure(projections, tier_projections, projection_service, render_mode)
     )
-    
-    st.plotly_chart(fig, use_container_width=True, key=key)
+    st.plotly_chart(fig, use_container_width=True, key="users_chart")
 
-def plot_users_chart(projections, projection_service: ProjectionService):
-    fig = go.Figure()
+def _build_users_figure(projections, tier_projections, projection_service: ProjectionService,
+                        render_mode: str = "auto") -> dict:
+    tiers = projection_service.subscriptions
+    months = projections['month'].to_numpy()
+    webgl = use_webgl(len(months), render_mode)
+    indices = lttb_indices(months, projections['total_users'].to_numpy(), CHART_MAX_POINTS)
     
-    # Add individual tier lines
-    for tier in projection_service.subscriptions:
-        user_column = f'users_{tier.name.lower()}'
-        fig.add_trace(go.Scatter(
-            x=projections['month'],
-            y=projections[user_column],
-            name=f"{tier.name} Users",
-            mode='lines',
-            line=dict(color=get_tier_color(tier.name))
-        ))
-    
-    # Add total users line
-    fig.add_trace(go.Scatter(
-        x=projections['month'],
-        y=projections['total_users'],
-        name="Total Users",
-        mode='lines',
-        line=dict(
-            width=3,
-            dash='dot',
-            color=CHART_COLORS['text']  # Using theme's text color
-        ),
-    ))
+    # Individual tier lines followed by the total users line
+    x = months[indices]
+    tier_users = _tier_series(tier_projections, 'users')[:, indices]
+    series = [dict(x=x, y=users) for users in tier_users]
+    series.append(dict(x=x, y=projections['total_users'].to_numpy()[indices]))
     
     # Add campaign indicators with consistent colors
+    markers = []
     for i, campaign in enumerate(projection_service.campaigns):
+        if campaign.start_month > len(months):
+            continue
         color = get_campaign_color(i)
         
         campaign_impact = (campaign.expected_reach * 
@@ -109,7 +126,8 @@ def plot_users_chart(projections, projection_service: ProjectionService):
                          campaign.download_to_active_rate * 
                          campaign.active_to_subscriber_rate)
         
-        fig.add_trace(go.Scatter(
+        markers.append(dict(
+            type='scatter',
             x=[campaign.start_month],
             y=[projections['total_users'].iloc[campaign.start_month - 1]],
             mode='markers',
@@ -128,17 +146,201 @@ def plot_users_chart(projections, projection_service: ProjectionService):
             )
         ))
     
+    skeleton = _figure_skeleton("users", tuple(tier.name for tier in tiers), webgl, len(months))
+    return _fill_skeleton(skeleton, series, markers)
+
+def _tier_series(tier_projections, column: str) -> np.ndarray:
+    """One (tiers, months) array from a (month, tier) indexed tier projection column."""
+    return tier_projections[column].unstack('tier').to_numpy().T
+
+def use_webgl(points: int, render_mode: str = "auto") -> bool:
+    """Resolve a render mode to WebGL (Scattergl) or SVG (Scatter) traces."""
+    if render_mode not in CHART_RENDER_MODES:
+        raise ValueError(f"Render mode must be one of {', '.join(CHART_RENDER_MODES)}")
+    if render_mode == "auto":
+        return points > CHART_WEBGL_THRESHOLD
+    return render_mode == "webgl"
+
+@lru_cache(maxsize=32)
+def _figure_skeleton(kind: str, tier_names: tuple, webgl: bool, months: int) -> dict:
+    """Trace styling and layout for a chart; only the data arrays change between renders."""
+    trace_type = 'scattergl' if webgl else 'scatter'
+    
+    if kind == "revenue":
+        traces = []
+        for idx, name in enumerate(tier_names):
+            trace = dict(type=trace_type, name=f"{name} Revenue", line=dict(color=get_tier_color(name)))
+            if webgl:
+                trace.update(
+                    mode='lines',
+                    fill='tozeroy' if idx == 0 else 'tonexty',
+                    hovertemplate=f"{name} Revenue: %{{customdata:$,.2f}}<extra></extra>"
+                )
+            else:
+                trace.update(stackgroup='one')
+            traces.append(trace)
+        title, yaxis_title = "Projected Revenue by Tier", "Revenue ($)"
+    else:
+        traces = [
+            dict(type=trace_type, name=f"{name} Users", mode='lines', line=dict(color=get_tier_color(name)))
+            for name in tier_names
+        ]
+        traces.append(dict(
+            type=trace_type,
+            name="Total Users",
+            mode='lines',
+            line=dict(
+                width=3,
+                dash='dot',
+                color=CHART_COLORS['text']  # Using theme's text color
+            )
+        ))
+        title, yaxis_title = "User Growth Projection", "Number of Users"
+    
+    layout = dict(
+        title=title,
+        xaxis_title="Month",
+        yaxis_title=yaxis_title,
+        showlegend=True,
+        xaxis=dict(
+            range=[0.5, months + 0.5],  # This keeps the chart centered and prevents shifting
+            tickmode='linear',
+            tick0=1,
+            dtick=max(1, math.ceil(months / CHART_MAX_TICKS))
+        )
+    )
+    return dict(data=traces, layout=layout)
+
+def _fill_skeleton(skeleton: dict, series: list, extra_traces: list) -> dict:
+    """Copy a cached skeleton, swapping in this render's data arrays."""
+    data = [dict(trace, **arrays) for trace, arrays in zip(skeleton['data'], series)]
+    return dict(data=data + extra_traces, layout=copy.deepcopy(skeleton['layout']))
+
+def plot_fan_chart(simulation: MonteCarloResult, metric: str = "revenue", key=None, render_mode: str = "auto"):
+    """Draw the outer percentiles as a shaded fan band around the median."""
+    lower, upper = min(simulation.percentiles), max(simulation.percentiles)
+    if metric == "revenue":
+        title, label = "Monte Carlo Revenue Projection", "Revenue ($)"
+    else:
+        title, label = "Monte Carlo User Growth Projection", "Number of Users"
+    
+    months = len(simulation.months)
+    scatter = go.Scattergl if use_webgl(months, render_mode) else go.Scatter
+    reference = simulation.band(metric, 50) if 50 in simulation.percentiles else simulation.band(metric, upper)
+    indices = lttb_indices(simulation.months, reference, CHART_MAX_POINTS)
+    x = simulation.months[indices]
+    
+    fig = go.Figure()
+    fig.add_trace(scatter(
+        x=x,
+        y=simulation.band(metric, upper)[indices],
+        name=f"P{upper:g}",
+        mode='lines',
+        line=dict(width=0),
+        showlegend=False
+    ))
+    fig.add_trace(scatter(
+        x=x,
+        y=simulation.band(metric, lower)[indices],
+        name=f"P{lower:g}–P{upper:g} Band",
+        mode='lines',
+        line=dict(width=0),
+        fill='tonexty',
+        fillcolor=CHART_COLORS['band']
+    ))
+    if 50 in simulation.percentiles:
+        fig.add_trace(scatter(
+            x=x,
+            y=simulation.band(metric, 50)[indices],
+            name="Median (P50)",
+            mode='lines',
+            line=dict(width=3, color=CHART_COLORS['primary'])
+        ))
+    
     fig.update_layout(
-        title="User Growth Projection",
+        title=f"{title} ({simulation.paths:,} paths)",
         xaxis_title="Month",
-        yaxis_title="Number of Users",
+        yaxis_title=label,
         showlegend=True,
+        hovermode='x unified',
         xaxis=dict(
-            range=[0.5, 12.5],  # This keeps the chart centered and prevents shifting
+            range=[0.5, months + 0.5],
             tickmode='linear',
             tick0=1,
-            dtick=1
+            dtick=max(1, math.ceil(months / CHART_MAX_TICKS))
         )
     )
     
-    st.plotly_chart(fig, use_container_width=True, key="users_chart") 
\ No newline at end of file
+    st.plotly_chart(fig, use_container_width=True, key=key or f"fan_chart_{metric}")
+
+def plot_tornado_chart(sensitivity: SensitivityResult, metric: str = "revenue", key=None):
+    """Horizontal bars of the % change in a Month-N metric with each input moved down and up."""
+    labels = {"revenue": "Month {months} Revenue", "arr": "Month {months} ARR", "users": "Month {months} Users"}
+    idx = sensitivity.metrics.index(metric)
+    base = sensitivity.base[idx]
+    low = (sensitivity.low[:, idx] / base - 1) * 100 if base else np.zeros(len(sensitivity.parameters))
+    high = (sensitivity.high[:, idx] / base - 1) * 100 if base else np.zeros(len(sensitivity.parameters))
+    
+    # Largest swing at the top; plotly draws the first category at the bottom
+    order = np.argsort(-np.abs(high - low), kind='stable')[:SENSITIVITY_TOP_PARAMETERS][::-1]
+    parameters = [sensitivity.parameters[i] for i in order]
+    step = sensitivity.step * 100
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=parameters,
+        x=low[order],
+        orientation='h',
+        name=f"Input −{step:g}%",
+        marker_color=CHART_COLORS['decrease'],
+        hovertemplate="%{y}: %{x:+.2f}%<extra></extra>"
+    ))
+    fig.add_trace(go.Bar(
+        y=parameters,
+        x=high[order],
+        orientation='h',
+        name=f"Input +{step:g}%",
+        marker_color=CHART_COLORS['increase'],
+        hovertemplate="%{y}: %{x:+.2f}%<extra></extra>"
+    ))
+    
+    fig.update_layout(
+        title=f"Sensitivity of {labels[metric].format(months=sensitivity.months)}",
+        xaxis_title="Change vs. Base (%)",
+        barmode='overlay',
+        showlegend=True,
+        height=max(300, 40 * len(parameters) + 120)
+    )
+    
+    st.plotly_chart(fig, use_container_width=True, key=key or f"tornado_chart_{metric}")
+
+def plot_scenario_chart(comparison: ScenarioComparison, metric: str = "revenue", baseline: str = None, key=None):
+    """One line per growth scenario, with the baseline drawn thicker."""
+    values = comparison.total_revenue if metric == "revenue" else comparison.total_users
+    colors = CHART_COLORS['scenario_colors']
+    
+    fig = go.Figure()
+    for idx, name in enumerate(comparison.names):
+        is_baseline = name == baseline
+        fig.add_trace(go.Scatter(
+            x=comparison.months,
+            y=values[idx],
+            name=f"{name} (baseline)" if is_baseline else name,
+            mode='lines',
+            line=dict(color=colors[idx % len(colors)], width=4 if is_baseline else 2),
+            hovertemplate=(
+                f"{name}<br>Month %{{x}}<br>" +
+                ("Revenue: $%{y:,.2f}" if metric == "revenue" else "Users: %{y:,.0f}") +
+                "<extra></extra>"
+            )
+        ))
+    
+    fig.update_layout(
+        title="Monthly Revenue by Scenario" if metric == "revenue" else "Active Users by Scenario",
+        xaxis_title="Month",
+        yaxis_title="Revenue ($)" if metric == "revenue" else "Users",
+        hovermode='x unified',
+        showlegend=True
+    )
+    
+    st.plotly_chart(fig, use_container_width=True, key=key or f"scenario_chart_{metric}")
@@ -1,12 +1,46 @@
+import math
 import streamlit as st
 import pandas as pd
-from services.projection_service import ProjectionService
+from config.constants import TABLE_PAGE_SIZE, TABLE_ROW_HEIGHT, TABLE_HEADER_HEIGHT
 
-def display_projections_table(projections: pd.DataFrame, projection_service: ProjectionService):
+@st.fragment
+def display_projections_table(projections: pd.DataFrame, tier_projections: pd.DataFrame):
     st.subheader("Monthly Projections")
     
-    display_df = projections.copy()
+    # Only the visible page is renamed and serialized; columns stay numeric
+    page_count = max(1, math.ceil(len(projections) / TABLE_PAGE_SIZE))
+    page = 1
+    if page_count > 1:
+        page = st.number_input(
+            f"Page (of {page_count})",
+            min_value=1,
+            max_value=page_count,
+            value=1,
+            key="projections_table_page"
+        )
+    display_df = build_table_page(projections, tier_projections, page)
     
+    # Calculate height based on number of rows plus the header
+    height = (len(display_df) * TABLE_ROW_HEIGHT) + TABLE_HEADER_HEIGHT
+    
+    st.dataframe(
+        display_df,
+        use_container_width=True,
+        hide_index=True,
+        height=height,
+        column_config=_column_config(display_df.columns),
+        key="projections_table"
+    )
+
+def build_table_page(projections: pd.DataFrame, tier_projections: pd.DataFrame, page: int = 1) -> pd.DataFrame:
+    """One page of projections with per-tier columns and display column names."""
+    start = (page - 1) * TABLE_PAGE_SIZE
+    page_df = projections.iloc[start:start + TABLE_PAGE_SIZE]
+    page_tiers = tier_projections.loc[page_df['month'].iloc[0]:page_df['month'].iloc[-1]]
+    page_df = page_df.join(_tier_columns(page_tiers), on='month')
+    return page_df.rename(columns=_column_renames())
+
+def _column_renames() -> dict:
     # Rename columns for better readability
     column_renames = {
         'month': 'Month',
@@ -19,31 +53,26 @@ def display_projections_table(projections: pd.DataFrame, projection_service: Pro
         'total_revenue': 'Total Monthly Revenue'
     }
     
-    for tier in projection_service.subscriptions:
-        column_renames.update({
-            f'users_{tier.name.lower()}': f'{tier.name} Plan Users',
-            f'revenue_{tier.name.lower()}': f'{tier.name} Plan Revenue'
-        })
-    
-    display_df = display_df.rename(columns=column_renames)
-    
-    # Format numeric columns
-    for col in display_df.columns:
+    return column_renames
+
+def _tier_columns(tier_projections: pd.DataFrame) -> pd.DataFrame:
+    # Pivot the (month, tier) rows into users and revenue columns for each tier
+    users = tier_projections['users'].unstack('tier')
+    revenue = tier_projections['revenue'].unstack('tier')
+    columns = {}
+    for tier in users.columns:
+        columns[f'{tier} Plan Users'] = users[tier]
+        columns[f'{tier} Plan Revenue'] = revenue[tier]
+    return pd.DataFrame(columns)
+
+def _column_config(columns) -> dict:
+    # Format numeric columns in the browser so they still sort as numbers
+    column_config = {}
+    for col in columns:
         if 'Revenue' in col:
-            display_df[col] = display_df[col].apply(lambda x: f"${x:,.2f}")
+            column_config[col] = st.column_config.NumberColumn(col, format="$%.2f")
         elif 'Rate (%)' in col or 'Growth (%)' in col:
-            display_df[col] = display_df[col].apply(lambda x: f"{x:.2f}%")
+            column_config[col] = st.column_config.NumberColumn(col, format="%.2f%%")
         elif 'Users' in col or 'Growth' in col:
-            display_df[col] = display_df[col].apply(lambda x: f"{int(x):,}")
-    
-    # Calculate height based on number of rows plus some padding for header
-    # Using 35 pixels per row and adding 100 pixels for header and padding
-    height = (len(display_df) * 35) + 37
-    
-    st.dataframe(
-        display_df,
-        use_container_width=True,
-        hide_index=True,
-        height=height,
-        key="projections_table"
-    ) 
\ No newline at end of file
+            column_config[col] = st.column_config.NumberColumn(col, format="%d")
+    return column_config
@@ -0,0 +1,50 @@
+import plotly.graph_objects as go
+import pandas as pd
+import streamlit as st
+from typing import Optional
+from utils.profiling import RerunProfiler
+from config.constants import CHART_COLORS
+
+def display_timing_panel(profiler: RerunProfiler, cache_stats: Optional[dict] = None):
+    if not profiler.history:
+        return
+    
+    with st.expander("⏱️ Rerun Timings", expanded=False):
+        latest = profiler.history[-1]
+        
+        fig = go.Figure(go.Bar(
+            x=[stage.duration_ms for stage in latest.stages],
+            y=[stage.stage for stage in latest.stages],
+            base=[stage.start_ms for stage in latest.stages],
+            orientation='h',
+            marker=dict(color=CHART_COLORS['primary']),
+            hovertemplate="<b>%{y}</b><br>Start: %{base:.1f} ms<br>Duration: %{x:.1f} ms<extra></extra>"
+        ))
+        fig.update_layout(
+            title=f"Last Rerun Waterfall ({latest.total_ms:,.1f} ms total)",
+            xaxis_title="Time since rerun start (ms)",
+            yaxis=dict(autorange='reversed'),
+            height=100 + len(latest.stages) * 30,
+            showlegend=False
+        )
+        st.plotly_chart(fig, use_container_width=True, key="timing_waterfall")
+        
+        history = pd.DataFrame([
+            {
+                'Started': profile.started_at,
+                **{stage.stage: stage.duration_ms for stage in profile.stages},
+                'Total': profile.total_ms
+            }
+            for profile in reversed(profiler.history)
+        ])
+        st.caption(f"Stage durations (ms) for the last {len(history)} reruns")
+        st.dataframe(history.round(2), use_container_width=True, hide_index=True)
+        
+        if cache_stats is not None:
+            caption = (f"Projection cache: {cache_stats['hit_rate']:.0%} hit rate in this process "
+                       f"({cache_stats['entries']} entries)")
+            disk = cache_stats.get('disk')
+            if disk is not None:
+                caption += (f"; shared disk cache: {disk['hit_rate']:.0%} hit rate across processes "
+                            f"({disk['entries']} entries, {disk['bytes'] / 1024 ** 2:,.1f} MB)")
+            st.caption(caption)
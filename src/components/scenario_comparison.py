@@ -0,0 +1,25 @@
+import streamlit as st
+from services.projection_service import ProjectionService
+from services.scenario_service import compare_scenarios
+from components.metrics import display_scenario_metrics
+from components.charts import plot_scenario_chart, display_flat_churn_caption
+from utils.utils import session_memo
+from config.constants import PANEL_DEPENDENCIES
+
+@st.fragment
+def display_scenario_comparison(projection_service: ProjectionService):
+    # All scenarios come from one batched projection; changing the baseline reruns only this panel
+    comparison = session_memo(
+        "scenario_comparison",
+        projection_service.dependency_version(PANEL_DEPENDENCIES["scenario_comparison"]),
+        lambda: compare_scenarios(projection_service, months=12)
+    )
+    
+    names = list(comparison.names)
+    default = names.index(projection_service.growth_scenario) if projection_service.growth_scenario in names else 0
+    baseline = st.selectbox("Baseline Scenario", options=names, index=default, key="scenario_baseline")
+    display_flat_churn_caption(projection_service, "Scenarios")
+    
+    display_scenario_metrics(comparison, baseline)
+    plot_scenario_chart(comparison, "revenue", baseline)
+    plot_scenario_chart(comparison, "users", baseline)
@@ -1,8 +1,12 @@
+import functools
+import numpy as np
 import streamlit as st
-from models.subscription import SubscriptionTier
 from models.campaign import MarketingCampaign
+from models.simulation import SimulationConfig
+from models.optimization import OptimizationConfig
 from services.projection_service import ProjectionService
-from utils.utils import get_image_base64
+from services.optimizer_service import optimize_campaigns
+from utils.utils import get_image_base64, in_fragment_rerun
 from config.constants import (
     SUBSCRIPTION_TIERS, GROWTH_SCENARIOS, LOGO_WIDTH,
     CAMPAIGN_START_MONTH_MIN, CAMPAIGN_START_MONTH_MAX, CAMPAIGN_START_MONTH_DEFAULT,
@@ -13,9 +17,36 @@ from config.constants import (
     DOWNLOAD_TO_ACTIVE_MIN, DOWNLOAD_TO_ACTIVE_MAX, DOWNLOAD_TO_ACTIVE_DEFAULT,
     ACTIVE_TO_SUBSCRIBER_MIN, ACTIVE_TO_SUBSCRIBER_MAX, ACTIVE_TO_SUBSCRIBER_DEFAULT,
     CUSTOM_GROWTH_RATE_MIN, CUSTOM_GROWTH_RATE_MAX, CUSTOM_GROWTH_RATE_DEFAULT,
-    CHURN_RATE_MIN, CHURN_RATE_MAX, DEFAULT_CHURN_RATE
+    CHURN_RATE_MIN, CHURN_RATE_MAX, DEFAULT_CHURN_RATE, CHURN_MODELS,
+    MONTE_CARLO_PATHS_MIN, MONTE_CARLO_PATHS_MAX, MONTE_CARLO_PATHS_DEFAULT, MONTE_CARLO_PATHS_STEP,
+    MONTE_CARLO_SPREAD_MIN, MONTE_CARLO_SPREAD_MAX, MONTE_CARLO_SPREAD_DEFAULT,
+    PANEL_DEPENDENCIES
 )
 
+# Fields read by any main-area panel; a sidebar change to one of them reruns the app
+_PANEL_FIELDS = frozenset().union(*PANEL_DEPENDENCIES.values())
+
+def _sidebar_section(render):
+    """
+    Run a sidebar section as a fragment.
+    
+    Widget changes rerun only the section. When a fragment rerun changes a field
+    a main-area panel reads, the whole app reruns so those panels update; other
+    interactions, like browsing campaigns or editing a draft campaign, stay local.
+    """
+    @st.fragment
+    @functools.wraps(render)
+    def section(projection_service: ProjectionService):
+        before = projection_service.dependency_version(_PANEL_FIELDS)
+        render(projection_service)
+        if in_fragment_rerun() and projection_service.dependency_version(_PANEL_FIELDS) != before:
+            st.rerun()
+    return section
+
+def _queue_message(kind: str, message: str):
+    # Keep campaign notices across the app rerun that follows a campaign change
+    st.session_state.setdefault("campaign_messages", []).append((kind, message))
+
 def render_sidebar(projection_service: ProjectionService):
     with st.sidebar:
         # Add logo with rounded style
@@ -63,195 +94,328 @@ def render_sidebar(projection_service: ProjectionService):
         
         st.header("Configuration")
         
-        # Growth Scenario Selection in an expander
-        with st.expander("📈 Growth Scenario", expanded=True):
-            scenario_options = list(GROWTH_SCENARIOS.keys()) + ["Custom"]
-            selected_scenario_display = st.selectbox(
-                "Select Scenario",
-                options=scenario_options
+        # Each section is a fragment; see _sidebar_section
+        _growth_section(projection_service)
+        _tiers_section(projection_service)
+        _marketing_section(projection_service)
+        if projection_service.campaigns:
+            _optimizer_section(projection_service)
+        _simulation_section(projection_service)
+
+@_sidebar_section
+def _growth_section(projection_service: ProjectionService):
+    # Growth Scenario Selection in an expander
+    with st.expander("📈 Growth Scenario", expanded=True):
+        scenario_options = list(GROWTH_SCENARIOS.keys()) + ["Custom"]
+        selected_scenario_display = st.selectbox(
+            "Select Scenario",
+            options=scenario_options
+        )
+        
+        if selected_scenario_display == "Custom":
+            custom_growth_rate = st.number_input(
+                "Custom Monthly Growth Rate (%)",
+                min_value=CUSTOM_GROWTH_RATE_MIN,
+                max_value=CUSTOM_GROWTH_RATE_MAX,
+                value=CUSTOM_GROWTH_RATE_DEFAULT,
+                help="Enter a monthly growth rate between 1% and 200%"
             )
+            projection_service.update(growth_scenario="Custom", custom_growth_rate=custom_growth_rate)
             
-            if selected_scenario_display == "Custom":
-                custom_growth_rate = st.number_input(
-                    "Custom Monthly Growth Rate (%)",
-                    min_value=CUSTOM_GROWTH_RATE_MIN,
-                    max_value=CUSTOM_GROWTH_RATE_MAX,
-                    value=CUSTOM_GROWTH_RATE_DEFAULT,
-                    help="Enter a monthly growth rate between 1% and 200%"
-                )
-                projection_service.growth_scenario = "Custom"
-                projection_service.custom_growth_rate = custom_growth_rate
-            else:
-                projection_service.growth_scenario = selected_scenario_display
-            
-            # Add churn rate checkbox and slider
-            enable_churn = st.checkbox(
-                "Include Churn Rate",
-                value=projection_service.enable_churn,
-                help="Enable to model monthly subscriber churn"
+            # Keep custom rates for the scenario comparison view
+            name_col, save_col = st.columns([2, 1], vertical_alignment="bottom")
+            with name_col:
+                scenario_name = st.text_input("Scenario Name", value=f"Custom ({custom_growth_rate:g}% monthly)")
+            with save_col:
+                if st.button("Save", use_container_width=True, key="save_scenario"):
+                    try:
+                        projection_service.save_scenario(scenario_name, custom_growth_rate / 100)
+                    except ValueError as e:
+                        st.error(str(e))
+        else:
+            projection_service.update(growth_scenario=selected_scenario_display)
+        
+        if projection_service.saved_scenarios:
+            st.caption("Saved for comparison: " + ", ".join(projection_service.saved_scenarios))
+        
+        # Add churn rate checkbox and slider
+        enable_churn = st.checkbox(
+            "Include Churn Rate",
+            value=projection_service.enable_churn,
+            help="Enable to model monthly subscriber churn"
+        )
+        
+        if enable_churn:
+            churn_model = st.radio(
+                "Churn Model",
+                options=list(CHURN_MODELS),
+                format_func={"flat": "Flat Rate", "cohort": "Cohort Retention"}.get,
+                horizontal=True,
+                help="Cohort retention decays each month's new users along a per-tier retention curve"
             )
+            projection_service.update(churn_model=churn_model)
             
-            if enable_churn:
-                churn_rate = st.slider(
-                    "Monthly Churn Rate (%)",
-                    min_value=CHURN_RATE_MIN,
-                    max_value=CHURN_RATE_MAX,
-                    value=DEFAULT_CHURN_RATE,
-                    step=0.1,
-                    help="Percentage of users who cancel their subscription each month"
-                )
-                projection_service.churn_rate = churn_rate / 100
-            else:
-                projection_service.churn_rate = 0.0
+            churn_rate = st.slider(
+                "Monthly Churn Rate (%)",
+                min_value=CHURN_RATE_MIN,
+                max_value=CHURN_RATE_MAX,
+                value=DEFAULT_CHURN_RATE,
+                step=0.1,
+                help="Percentage of users who cancel their subscription each month; "
+                     "also used by the Monte Carlo and sensitivity scenarios"
+            )
+            projection_service.update(churn_rate=churn_rate / 100)
             
-            projection_service.enable_churn = enable_churn
-        
-        # Subscription Tiers in an expander
-        with st.expander("💳 Subscription Tiers", expanded=True):
-            for tier_name, tier_data in SUBSCRIPTION_TIERS.items():
-                st.write(f"### {tier_name} Plan")
-                
-                price_col, dist_col = st.columns(2)
-                with price_col:
-                    price = st.number_input(
-                        "Price ($)",
-                        min_value=0.0,
-                        max_value=100.0,
-                        value=tier_data["price"],
-                        key=f"price_{tier_name}"
+            if churn_model == "cohort":
+                for tier in projection_service.subscriptions:
+                    curve = projection_service.retention_curve(tier)
+                    st.caption(
+                        f"{tier.name}: {curve.initial_churn:.0%} month-1 churn easing to "
+                        f"{curve.long_term_churn:.0%} monthly"
                     )
-                with dist_col:
-                    distribution = st.number_input(
-                        "Distribution (%)",
-                        min_value=0.0,
-                        max_value=100.0,
-                        value=tier_data["default_distribution"] * 100,
-                        key=f"dist_{tier_name}"
-                    )
-                
-                projection_service.subscriptions.append(
-                    SubscriptionTier(
-                        name=tier_name,
-                        monthly_price=price,
-                        features=tier_data["features"],
-                        distribution_percentage=distribution / 100
-                    )
-                )
+        else:
+            projection_service.update(churn_rate=0.0)
         
-        # Marketing Campaign in an expander
-        with st.expander("📢 Marketing", expanded=True):
-            st.write("### Campaign Settings")
+        projection_service.update(enable_churn=enable_churn)
+
+@_sidebar_section
+def _tiers_section(projection_service: ProjectionService):
+    # Subscription Tiers in an expander
+    with st.expander("💳 Subscription Tiers", expanded=True):
+        for tier_name, tier_data in SUBSCRIPTION_TIERS.items():
+            st.write(f"### {tier_name} Plan")
             
-            # Campaign timing
-            col1, col2 = st.columns(2)
-            with col1:
-                start_month = st.number_input(
-                    "Start Month",
-                    min_value=CAMPAIGN_START_MONTH_MIN,
-                    max_value=CAMPAIGN_START_MONTH_MAX,
-                    value=CAMPAIGN_START_MONTH_DEFAULT,
-                    help="Campaign start month (1-12)"
+            price_col, dist_col = st.columns(2)
+            with price_col:
+                price = st.number_input(
+                    "Price ($)",
+                    min_value=0.0,
+                    max_value=100.0,
+                    value=tier_data["price"],
+                    key=f"price_{tier_name}"
                 )
-            with col2:
-                duration = st.number_input(
-                    "Duration (months)",
-                    min_value=CAMPAIGN_DURATION_MIN,
-                    max_value=CAMPAIGN_DURATION_MAX,
-                    value=CAMPAIGN_DURATION_DEFAULT,
-                    help=(
-                        "Specify the number of months over which the campaign will run. "
-                        "The total expected new users from the campaign will be evenly distributed "
-                        "across these months. For example, if the campaign is expected to bring in "
-                        "200 new users and the duration is set to 3 months, approximately 67 users "
-                        "will be added each month. This setting helps in planning the timing and "
-                        "impact of user growth due to marketing efforts."
-                    )
+            with dist_col:
+                distribution = st.number_input(
+                    "Distribution (%)",
+                    min_value=0.0,
+                    max_value=100.0,
+                    value=tier_data["default_distribution"] * 100,
+                    key=f"dist_{tier_name}"
                 )
             
-            # Campaign metrics
-            reach = st.number_input(
-                "Expected Reach",
-                min_value=CAMPAIGN_REACH_MIN,
-                max_value=CAMPAIGN_REACH_MAX,
-                value=CAMPAIGN_REACH_DEFAULT,
-                step=CAMPAIGN_REACH_STEP,
-                help="Expected number of people the campaign will reach"
+            projection_service.set_tier(
+                name=tier_name,
+                monthly_price=price,
+                features=tier_data["features"],
+                distribution_percentage=distribution / 100
             )
-            
-            budget = st.number_input(
-                "Campaign Budget ($)",
-                min_value=CAMPAIGN_BUDGET_MIN,
-                max_value=CAMPAIGN_BUDGET_MAX,
-                value=CAMPAIGN_BUDGET_DEFAULT,
-                step=CAMPAIGN_BUDGET_STEP,
-                help="Total campaign budget"
+
+@_sidebar_section
+def _marketing_section(projection_service: ProjectionService):
+    # Marketing Campaign in an expander
+    with st.expander("📢 Marketing", expanded=True):
+        st.write("### Campaign Settings")
+        
+        # Campaign timing
+        col1, col2 = st.columns(2)
+        with col1:
+            start_month = st.number_input(
+                "Start Month",
+                min_value=CAMPAIGN_START_MONTH_MIN,
+                max_value=CAMPAIGN_START_MONTH_MAX,
+                value=CAMPAIGN_START_MONTH_DEFAULT,
+                help="Campaign start month (1-12)"
             )
-            
-            # Conversion rates
-            st.write("### Conversion Rates")
-            reach_to_download = st.slider(
-                "Reach to Download Rate (%)",
-                min_value=REACH_TO_DOWNLOAD_MIN,
-                max_value=REACH_TO_DOWNLOAD_MAX,
-                value=REACH_TO_DOWNLOAD_DEFAULT,
-                help="Percentage of reached users who will download"
+        with col2:
+            duration = st.number_input(
+                "Duration (months)",
+                min_value=CAMPAIGN_DURATION_MIN,
+                max_value=CAMPAIGN_DURATION_MAX,
+                value=CAMPAIGN_DURATION_DEFAULT,
+                help=(
+                    "Specify the number of months over which the campaign will run. "
+                    "The total expected new users from the campaign will be evenly distributed "
+                    "across these months. For example, if the campaign is expected to bring in "
+                    "200 new users and the duration is set to 3 months, approximately 67 users "
+                    "will be added each month. This setting helps in planning the timing and "
+                    "impact of user growth due to marketing efforts."
+                )
             )
-            
-            download_to_active = st.slider(
-                "Download to Active Rate (%)",
-                min_value=DOWNLOAD_TO_ACTIVE_MIN,
-                max_value=DOWNLOAD_TO_ACTIVE_MAX,
-                value=DOWNLOAD_TO_ACTIVE_DEFAULT,
-                help="Percentage of downloads that become active users"
+        
+        # Campaign metrics
+        reach = st.number_input(
+            "Expected Reach",
+            min_value=CAMPAIGN_REACH_MIN,
+            max_value=CAMPAIGN_REACH_MAX,
+            value=CAMPAIGN_REACH_DEFAULT,
+            step=CAMPAIGN_REACH_STEP,
+            help="Expected number of people the campaign will reach"
+        )
+        
+        budget = st.number_input(
+            "Campaign Budget ($)",
+            min_value=CAMPAIGN_BUDGET_MIN,
+            max_value=CAMPAIGN_BUDGET_MAX,
+            value=CAMPAIGN_BUDGET_DEFAULT,
+            step=CAMPAIGN_BUDGET_STEP,
+            help="Total campaign budget"
+        )
+        
+        # Conversion rates
+        st.write("### Conversion Rates")
+        reach_to_download = st.slider(
+            "Reach to Download Rate (%)",
+            min_value=REACH_TO_DOWNLOAD_MIN,
+            max_value=REACH_TO_DOWNLOAD_MAX,
+            value=REACH_TO_DOWNLOAD_DEFAULT,
+            help="Percentage of reached users who will download"
+        )
+        
+        download_to_active = st.slider(
+            "Download to Active Rate (%)",
+            min_value=DOWNLOAD_TO_ACTIVE_MIN,
+            max_value=DOWNLOAD_TO_ACTIVE_MAX,
+            value=DOWNLOAD_TO_ACTIVE_DEFAULT,
+            help="Percentage of downloads that become active users"
+        )
+        
+        st.write("")  # Add vertical space
+        
+        # Show existing campaigns
+        if projection_service.campaigns:
+            st.write("### Active Campaigns")
+            overlap_counts = projection_service.campaigns.intervals.overlap_counts()
+            if overlap_counts.any():
+                st.caption(
+                    f"{np.count_nonzero(overlap_counts)} of {len(overlap_counts)} campaigns "
+                    f"run at the same time as another campaign"
+                )
+            selected_campaign = st.selectbox(
+                "Select Campaign",
+                options=[f"Campaign {idx + 1}" for idx in range(len(projection_service.campaigns))],
+                key="campaign_selector"
             )
             
-            st.write("")  # Add vertical space
-            
-            # Show existing campaigns
-            if projection_service.campaigns:
-                st.write("### Active Campaigns")
-                selected_campaign = st.selectbox(
-                    "Select Campaign",
-                    options=[f"Campaign {idx + 1}" for idx in range(len(projection_service.campaigns))],
-                    key="campaign_selector"
-                )
+            if selected_campaign:
+                idx = int(selected_campaign.split()[-1]) - 1
+                campaign = projection_service.campaigns[idx]
                 
-                if selected_campaign:
-                    idx = int(selected_campaign.split()[-1]) - 1
-                    campaign = projection_service.campaigns[idx]
+                with st.container(border=True):
+                    st.write(f"**Start Month:** {campaign.start_month}")
+                    st.write(f"**Duration:** {campaign.duration_months} months")
+                    st.write(f"**Budget:** ${campaign.budget:,.2f}")
+                    st.write(f"**Expected Reach:** {campaign.expected_reach:,}")
                     
-                    with st.expander("Campaign Details", expanded=True):
-                        st.write(f"**Start Month:** {campaign.start_month}")
-                        st.write(f"**Duration:** {campaign.duration_months} months")
-                        st.write(f"**Budget:** ${campaign.budget:,.2f}")
-                        st.write(f"**Expected Reach:** {campaign.expected_reach:,}")
-                        
-                        if st.button("Delete Campaign", type="error", key=f"delete_{campaign.campaign_id}"):
-                            projection_service.campaigns.remove(campaign)
-                            st.success(f"{selected_campaign} deleted!")
-                            st.rerun()
+                    if st.button("Delete Campaign", type="secondary", key=f"delete_{campaign.campaign_id}"):
+                        projection_service.remove_campaign(campaign)
+                        _queue_message("success", f"{selected_campaign} deleted!")
+                        st.rerun()
+        
+        # Show notices queued before the app reran for the last campaign change
+        for kind, message in st.session_state.pop("campaign_messages", []):
+            getattr(st, kind)(message)
+        
+        # Add Set Campaign button
+        if st.button("Add New Campaign", type="primary", use_container_width=True):
+            campaign = MarketingCampaign(
+                name=f"Campaign {len(projection_service.campaigns) + 1}",
+                campaign_id=f"camp_{len(projection_service.campaigns) + 1}",
+                start_month=start_month,
+                duration_months=duration,
+                budget=budget,
+                expected_reach=reach,
+                reach_to_download_rate=reach_to_download / 100,
+                download_to_active_rate=download_to_active / 100,
+                active_to_subscriber_rate=1.0
+            )
             
-            # Add Set Campaign button
-            if st.button("Add New Campaign", type="primary", use_container_width=True):
-                campaign = MarketingCampaign(
-                    name=f"Campaign {len(projection_service.campaigns) + 1}",
-                    campaign_id=f"camp_{len(projection_service.campaigns) + 1}",
-                    start_month=start_month,
-                    duration_months=duration,
-                    budget=budget,
-                    expected_reach=reach,
-                    reach_to_download_rate=reach_to_download / 100,
-                    download_to_active_rate=download_to_active / 100,
-                    active_to_subscriber_rate=1.0
+            # Check for campaign overlap
+            overlapping = projection_service.campaigns.intervals.overlaps(campaign.start_month, campaign.duration_months)
+            if overlapping.size:
+                months = ", ".join(map(str, np.unique(projection_service.campaigns.start_month[overlapping])))
+                _queue_message(
+                    "warning",
+                    f"⚠️ Campaign overlaps with {overlapping.size} existing campaign(s) starting in month(s) {months}"
                 )
-                
-                # Check for campaign overlap
-                has_overlap = False
-                for existing_campaign in projection_service.campaigns:
-                    if (campaign.start_month <= existing_campaign.start_month + existing_campaign.duration_months and
-                        campaign.start_month + campaign.duration_months >= existing_campaign.start_month):
-                        has_overlap = True
-                        st.warning(f"⚠️ Campaign overlaps with existing campaign starting in month {existing_campaign.start_month}")
-                
-                projection_service.campaigns.append(campaign)
-                st.success(f"✅ Campaign {len(projection_service.campaigns)} has been added!")
+            
+            projection_service.add_campaign(campaign)
+            _queue_message("success", f"✅ Campaign {len(projection_service.campaigns)} has been added!")
+
+@_sidebar_section
+def _optimizer_section(projection_service: ProjectionService):
+    # Campaign schedule optimizer in an expander
+    with st.expander("🎯 Campaign Optimizer", expanded=False):
+        total_budget = st.number_input(
+            "Total Budget ($)",
+            min_value=CAMPAIGN_BUDGET_STEP,
+            value=float(projection_service.campaigns.budget.sum()) or CAMPAIGN_BUDGET_DEFAULT,
+            step=CAMPAIGN_BUDGET_STEP,
+            help="Budget to split across the campaigns above; reach scales with each campaign's budget"
+        )
+        objective = st.selectbox(
+            "Objective",
+            options=["revenue", "roi"],
+            format_func={"revenue": "Month 12 Revenue", "roi": "Cumulative ROI"}.get,
+            help="Maximize revenue in the final month, or cumulative revenue uplift per dollar spent"
+        )
+        
+        if st.button("Optimize Schedule", use_container_width=True):
+            with st.spinner("Searching campaign schedules..."):
+                st.session_state.optimization = (
+                    projection_service.version,
+                    optimize_campaigns(
+                        projection_service,
+                        OptimizationConfig(total_budget=total_budget, objective=objective)
+                    )
+                )
+        
+        # Only offer results computed for the current campaigns and assumptions
+        version, result = st.session_state.get("optimization", (None, None))
+        if result is not None and version == projection_service.version:
+            label = "Month 12 Revenue" if result.objective == "revenue" else "Cumulative ROI"
+            value = f"${result.value:,.2f}" if result.objective == "revenue" else f"{result.value:.2f}x"
+            st.metric(label, value, f"{result.improvement * 100:+.1f}% vs. current")
+            st.caption(f"{result.evaluations:,} schedules evaluated over {len(result.history)} generations")
+            for idx, name in enumerate(projection_service.campaigns.name):
+                st.write(
+                    f"**{name}:** month {result.start_months[idx]}, "
+                    f"{result.duration_months[idx]} months, ${result.budgets[idx]:,.0f}"
+                )
+            
+            if st.button("Apply Schedule", type="primary", use_container_width=True):
+                projection_service.update(campaigns=result.to_table(projection_service.campaigns))
+                del st.session_state.optimization
+                st.rerun()
+
+@_sidebar_section
+def _simulation_section(projection_service: ProjectionService):
+    # Monte Carlo simulation in an expander
+    with st.expander("🎲 Monte Carlo Simulation", expanded=False):
+        enable_simulation = st.checkbox(
+            "Show Uncertainty Bands",
+            value=False,
+            help="Simulate growth, churn and conversion rates as distributions and show P5/P50/P95 bands"
+        )
+        
+        if enable_simulation:
+            paths = st.number_input(
+                "Simulated Paths",
+                min_value=MONTE_CARLO_PATHS_MIN,
+                max_value=MONTE_CARLO_PATHS_MAX,
+                value=MONTE_CARLO_PATHS_DEFAULT,
+                step=MONTE_CARLO_PATHS_STEP,
+                help="Number of simulated projection paths"
+            )
+            spread = st.slider(
+                "Rate Uncertainty (%)",
+                min_value=MONTE_CARLO_SPREAD_MIN,
+                max_value=MONTE_CARLO_SPREAD_MAX,
+                value=MONTE_CARLO_SPREAD_DEFAULT,
+                step=1.0,
+                help="Relative standard deviation applied around each rate's point estimate"
+            )
+            projection_service.update(
+                simulation_config=SimulationConfig.with_spread(spread / 100, paths=paths)
+            )
+        else:
+            projection_service.update(simulation_config=None)
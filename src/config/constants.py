@@ -37,7 +37,7 @@ DEFAULT_CAMPAIGN_PARAMS = {
 DEFAULT_CAC = 50.0  # Default Customer Acquisition Cost
 DEFAULT_CHURN_RATE = 0.05  # 5% monthly churn
 DEFAULT_INITIAL_USERS = 100
-MAX_PROJECTION_MONTHS = 36
+MAX_PROJECTION_MONTHS = 600  # 50 years for every engine, about 18,000 daily steps
 
 # Sidebar UI Constants
 LOGO_WIDTH = 100
@@ -61,6 +61,9 @@ CAMPAIGN_BUDGET_MAX = 100000.0
 CAMPAIGN_BUDGET_DEFAULT = 2500.0
 CAMPAIGN_BUDGET_STEP = 100.0
 
+CAMPAIGN_OVERLAP_MAX_PAIRS = 10_000_000  # About 160 MB of row pairs from overlapping_pairs()
+CAMPAIGN_OVERLAP_CHUNK_PAIRS = 1_000_000  # Pairs per chunk yielded by iter_overlapping_pairs()
+
 # Conversion Rate Constants
 REACH_TO_DOWNLOAD_MIN = 0.1
 REACH_TO_DOWNLOAD_MAX = 10.0
@@ -85,6 +88,101 @@ CHURN_RATE_MIN = 0.0
 CHURN_RATE_MAX = 15.0
 DEFAULT_CHURN_RATE = 0.0
 
+# Cohort Retention Constants
+CHURN_MODELS = ("flat", "cohort")  # One churn rate, or per-tier retention curves by cohort age
+COHORT_RETENTION_DEFAULTS = {
+    "Basic": {"initial_churn": 0.30, "long_term_churn": 0.06, "decay": 0.6},
+    "Standard": {"initial_churn": 0.20, "long_term_churn": 0.04, "decay": 0.6},
+    "Premium": {"initial_churn": 0.12, "long_term_churn": 0.02, "decay": 0.6}
+}
+COHORT_FFT_MIN_PERIODS = 128  # Below this many periods the convolution is a direct matrix product
+
+# Projection Cache Constants
+PROJECTION_CACHE_MAX_ENTRIES = 128
+PROJECTION_CACHE_MAX_BYTES = 64 * 1024 * 1024
+PROJECTION_CACHE_TTL_SECONDS = 3600
+DISK_CACHE_DIR = ".cache"  # Shared on-disk projection cache, relative to the working directory
+DISK_CACHE_DIR_ENV_VAR = "REVENUE_PROJECTION_CACHE_DIR"  # Overrides DISK_CACHE_DIR; empty disables it
+DISK_CACHE_MAX_ENTRIES = 10000
+DISK_CACHE_MAX_BYTES = 512 * 1024 * 1024
+DISK_CACHE_TTL_SECONDS = 7 * 24 * 3600
+DISK_CACHE_BUSY_TIMEOUT_SECONDS = 5.0  # How long a writer waits for another process's lock
+DISK_CACHE_FLUSH_READS = 64  # Reads buffered before hit counts and read times are written back
+DISK_CACHE_FORMAT_VERSION = 2  # Bump when projection columns or semantics change
+
+# Chart Rendering Constants
+CHART_RENDER_MODES = ("auto", "svg", "webgl")
+CHART_WEBGL_THRESHOLD = 500  # Points per series above which "auto" switches to WebGL
+CHART_MAX_POINTS = 2000  # Series longer than this are downsampled with LTTB
+CHART_MAX_TICKS = 24
+
+# Projection Table Constants
+TABLE_PAGE_SIZE = 60  # Rows sent to the browser per page
+TABLE_ROW_HEIGHT = 35
+TABLE_HEADER_HEIGHT = 37
+
+# App Panel Constants
+# ProjectionService fields that feed calculate_projections; edits to these
+# invalidate results, and every panel set below derives from this one.
+PROJECTION_FIELDS = frozenset({
+    "subscriptions", "campaigns", "growth_scenario",
+    "custom_growth_rate", "enable_churn", "churn_rate", "churn_model"
+})
+# ProjectionService fields each main-area panel reads. Sidebar sections run as
+# fragments and rerun the whole app only after changing one of these fields;
+# panels rebuild their output only when their own fields changed.
+PANEL_DEPENDENCIES = {
+    "projections": PROJECTION_FIELDS,
+    "campaign_timeline": frozenset({"campaigns"}),
+    # Scenarios replace the selected growth rate and always apply churn as a flat rate
+    "scenario_comparison": (
+        PROJECTION_FIELDS - {"growth_scenario", "custom_growth_rate", "churn_model"}
+    ) | {"saved_scenarios"},
+    "monte_carlo": PROJECTION_FIELDS | {"simulation_config"}
+}
+
+# Result Store Constants
+RESULT_STORE_PARTITION_SIZE = 1000  # Scenarios per partition directory
+RESULT_STORE_FORMATS = ("ipc", "parquet")
+
+# Profiling Constants
+PROFILE_HISTORY_LENGTH = 20  # Reruns kept for the timing panel
+PROFILE_LOG_ENV_VAR = "REVENUE_PROJECTION_TIMING_LOG"  # Path of the JSON-lines timing log
+PROFILE_DEBUG_ENV_VAR = "REVENUE_PROJECTION_DEBUG"  # Set to 1 to always show the timing panel
+PROFILE_DEBUG_QUERY_PARAM = "debug"  # Or open the app with ?debug=1
+
+# Monte Carlo Simulation Constants
+MONTE_CARLO_PATHS_MIN = 1000
+MONTE_CARLO_PATHS_MAX = 500000
+MONTE_CARLO_PATHS_DEFAULT = 20000
+MONTE_CARLO_PATHS_STEP = 1000
+MONTE_CARLO_CHUNK_SIZE = 10000  # Paths per RNG stream; fixed so results do not depend on worker count
+MONTE_CARLO_DEFAULT_SEED = 42
+MONTE_CARLO_PERCENTILES = (5, 50, 95)
+MONTE_CARLO_SPREAD_MIN = 0.0
+MONTE_CARLO_SPREAD_MAX = 100.0
+MONTE_CARLO_SPREAD_DEFAULT = 20.0  # Relative spread (%) around each point estimate
+
+# Period Projection Constants
+PROJECTION_GRANULARITIES = ("day", "week", "month")
+PROJECTION_STREAM_CHUNK_SIZE = 4096  # Periods per chunk yielded by iter_projections
+PROJECTION_DTYPES = ("float64", "float32")
+
+# Sensitivity Analysis Constants
+SENSITIVITY_STEP = 0.10  # Relative perturbation applied to each input in both directions
+SENSITIVITY_TOP_PARAMETERS = 15  # Bars shown in the tornado chart
+
+# Campaign Optimizer Constants
+OPTIMIZER_OBJECTIVES = ("revenue", "roi")
+OPTIMIZER_POPULATION = 256  # Schedules evaluated per generation
+OPTIMIZER_MAX_GENERATIONS = 40
+OPTIMIZER_ELITE_FRACTION = 0.125  # Best share of each generation kept as parents
+OPTIMIZER_PATIENCE = 6  # Generations without improvement before stopping early
+OPTIMIZER_TOLERANCE = 1e-4  # Relative improvement that counts as progress
+OPTIMIZER_DEFAULT_SEED = 42
+OPTIMIZER_PARALLEL_MIN_POPULATION = 4096  # Smaller generations score faster in-process than a pool starts
+OPTIMIZER_MIN_BUDGET_SHARE = 0.01  # Least share of the total budget each campaign keeps
+
 # Chart Color Constants
 CHART_COLORS = {
     # Tier Colors
@@ -97,7 +195,11 @@ CHART_COLORS = {
     'background': '#0E1117',
     'secondary_background': '#1F2128',
     'text': '#FAFAFA',
+    'band': 'rgba(83, 88, 255, 0.25)',
+    'decrease': '#FF6F61',
+    'increase': '#2CA02C',
     
     # Campaign Colors
-    'campaign_colors': ['#FF7F0E', '#2CA02C', '#D62728', '#9467BD', '#17BECF']
+    'campaign_colors': ['#FF7F0E', '#2CA02C', '#D62728', '#9467BD', '#17BECF'],
+    'scenario_colors': ['#5358FF', '#FF6F61', '#2CA02C', '#FFC857', '#9467BD', '#17BECF', '#E377C2']
 }
\ No newline at end of file
@@ -1,35 +1,127 @@
+import os
 import streamlit as st
 from services.projection_service import ProjectionService
-from components.sidebar import render_sidebar
-from components.metrics import display_metrics
-from components.charts import plot_revenue_chart, plot_users_chart
-from components.data_table import display_projections_table
+from services.simulation_service import run_monte_carlo
+from services.sensitivity_service import run_sensitivity
+from services.cache_service import projection_cache
+from utils.utils import session_memo
+from utils.profiling import RerunProfiler
+from config.constants import (
+    PROFILE_LOG_ENV_VAR, PROFILE_DEBUG_ENV_VAR, PROFILE_DEBUG_QUERY_PARAM, PANEL_DEPENDENCIES
+)
+
+@st.fragment
+def display_sensitivity_panel(projection_service: ProjectionService):
+    from components.charts import plot_tornado_chart, display_flat_churn_caption
+    
+    # Switching the metric reruns only this panel
+    with st.expander("📊 Sensitivity Analysis"):
+        sensitivity = session_memo(
+            "sensitivity",
+            projection_service.version,
+            lambda: run_sensitivity(projection_service, months=12)
+        )
+        metric = st.radio(
+            "Metric",
+            options=["revenue", "arr", "users"],
+            format_func={"revenue": "Revenue", "arr": "ARR", "users": "Users"}.get,
+            horizontal=True,
+            key="sensitivity_metric"
+        )
+        display_flat_churn_caption(projection_service, "Sensitivity scenarios")
+        plot_tornado_chart(sensitivity, metric)
 
 def main():
+    # Components pull in plotly; import them when the page renders, not with this module
+    from components.sidebar import render_sidebar
+    from components.metrics import display_metrics
+    from components.charts import (
+        plot_revenue_chart, plot_users_chart, plot_fan_chart, display_flat_churn_caption
+    )
+    from components.data_table import display_projections_table
+    from components.campaign_timeline import display_campaign_timeline
+    from components.scenario_comparison import display_scenario_comparison
+    from components.profiling_panel import display_timing_panel
+    
     st.set_page_config(page_title="Revenue Projection Tool", layout="wide")
     st.title("Revenue Projection Tool")
     
-    projection_service = ProjectionService()
+    if "profiler" not in st.session_state:
+        st.session_state.profiler = RerunProfiler(log_path=os.environ.get(PROFILE_LOG_ENV_VAR))
+    profiler = st.session_state.profiler
+    profiler.start()
+    
+    # Keep one service per session so campaigns and edits survive reruns
+    if "projection_service" not in st.session_state:
+        st.session_state.projection_service = ProjectionService()
+    projection_service = st.session_state.projection_service
     
-    # Render sidebar
-    render_sidebar(projection_service)
+    # Render sidebar; its sections are fragments that rerun the app only when
+    # they change a field one of the panels below reads
+    with profiler.span("render_sidebar"):
+        render_sidebar(projection_service)
     
     try:
-        # Calculate projections
-        projections = projection_service.calculate_projections(months=12)
+        # Calculate projections only when their inputs changed
+        with profiler.span("calculate_projections"):
+            if projection_service.is_dirty or "projection_result" not in st.session_state:
+                result = projection_cache.get_or_compute(projection_service, months=12)
+                st.session_state.projection_result = result
+                st.session_state.projections = result.to_pandas()
+                st.session_state.tier_projections = result.tier_frame()
+                projection_service.clear_dirty()
+            result = st.session_state.projection_result
+            projections = st.session_state.projections
+            tier_projections = st.session_state.tier_projections
         
-        # Display metrics
-        display_metrics(projections)
+        # Display metrics and charts for the selected scenario, or every scenario side by side
+        if st.toggle("Compare Growth Scenarios", key="compare_scenarios"):
+            with profiler.span("scenario_comparison"):
+                display_scenario_comparison(projection_service)
+        else:
+            with profiler.span("display_metrics"):
+                display_metrics(result)
+            
+            with profiler.span("plot_revenue_chart"):
+                plot_revenue_chart(projections, tier_projections, projection_service)
+            with profiler.span("plot_users_chart"):
+                plot_users_chart(projections, tier_projections, projection_service)
         
-        # Display charts
-        plot_revenue_chart(projections, projection_service)
-        plot_users_chart(projections, projection_service)
+        # Display campaign schedule
+        with profiler.span("campaign_timeline"):
+            display_campaign_timeline(projection_service)
+        
+        # Display which inputs drive Month 12 revenue, ARR and users
+        with profiler.span("sensitivity"):
+            display_sensitivity_panel(projection_service)
+        
+        # Display Monte Carlo fan charts
+        if projection_service.simulation_config is not None:
+            with profiler.span("monte_carlo"), st.spinner("Running Monte Carlo simulation..."):
+                simulation = session_memo(
+                    "monte_carlo",
+                    projection_service.dependency_version(PANEL_DEPENDENCIES["monte_carlo"]),
+                    lambda: run_monte_carlo(
+                        projection_service,
+                        months=12,
+                        config=projection_service.simulation_config
+                    )
+                )
+                display_flat_churn_caption(projection_service, "Simulated paths")
+                plot_fan_chart(simulation, "revenue")
+                plot_fan_chart(simulation, "users")
         
         # Display data table
-        display_projections_table(projections, projection_service)
+        with profiler.span("display_projections_table"):
+            display_projections_table(projections, tier_projections)
         
     except Exception as e:
         st.error(f"Error calculating projections: {str(e)}")
+    finally:
+        profiler.finish()
+    
+    if os.environ.get(PROFILE_DEBUG_ENV_VAR) == "1" or st.query_params.get(PROFILE_DEBUG_QUERY_PARAM) == "1":
+        display_timing_panel(profiler, projection_cache.stats)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -21,4 +21,22 @@ class MarketingCampaign(BaseModel):
     def validate_duration(cls, v):
         if not 1 <= v <= 12:
             raise ValueError("Duration must be between 1 and 12 months")
-        return v 
\ No newline at end of file
+        return v
+    
+    @validator('budget')
+    def validate_budget(cls, v):
+        if v < 0:
+            raise ValueError("Budget must not be negative")
+        return v
+    
+    @validator('expected_reach')
+    def validate_expected_reach(cls, v):
+        if v < 0:
+            raise ValueError("Expected reach must not be negative")
+        return v
+    
+    @validator('reach_to_download_rate', 'download_to_active_rate', 'active_to_subscriber_rate')
+    def validate_conversion_rate(cls, v):
+        if not 0 <= v <= 1:
+            raise ValueError("Conversion rates must be between 0 and 1")
+        return v
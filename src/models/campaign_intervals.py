@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+import numpy as np
+from config.constants import CAMPAIGN_OVERLAP_MAX_PAIRS, CAMPAIGN_OVERLAP_CHUNK_PAIRS
+
+
+@dataclass(frozen=True)
+class CampaignIntervalIndex:
+    """
+    Campaigns as half-open month intervals [start_month, start_month + duration_months).
+
+    Intervals are kept sorted by start month, so overlap and active-campaign
+    queries are binary searches over the sorted starts instead of pairwise
+    comparisons. Back-to-back campaigns, where one ends in the month before the
+    next starts, do not overlap. Queries return row positions in the original
+    campaign order.
+    """
+    starts: np.ndarray  # (campaigns,) first active month
+    ends: np.ndarray    # (campaigns,) first month after the campaign
+    order: np.ndarray   # (campaigns,) row positions sorted by start month
+
+    @classmethod
+    def from_arrays(cls, start_months, duration_months) -> "CampaignIntervalIndex":
+        starts = np.asarray(start_months, dtype=np.int64)
+        ends = starts + np.asarray(duration_months, dtype=np.int64)
+        return cls(starts=starts, ends=ends, order=np.argsort(starts, kind='stable'))
+
+    def __len__(self) -> int:
+        return self.starts.shape[0]
+
+    @property
+    def last_month(self) -> int:
+        """Last month any campaign is active, or 0 without campaigns."""
+        return int(self.ends.max()) - 1 if len(self) else 0
+
+    def overlaps(self, start_month: int, duration_months: int) -> np.ndarray:
+        """Rows of the campaigns sharing a month with [start_month, start_month + duration_months)."""
+        # Only campaigns starting before the candidate ends can overlap it
+        candidates = self.order[:np.searchsorted(self.starts[self.order], start_month + duration_months)]
+        return np.sort(candidates[self.ends[candidates] > start_month])
+
+    def overlapping_pairs(
+        self, max_pairs: Optional[int] = CAMPAIGN_OVERLAP_MAX_PAIRS
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Every overlapping pair (i, j) of rows with i < j, in one pass.
+
+        Walking campaigns by start month, a campaign overlaps exactly the later
+        starters that begin before it ends, which is a contiguous run of the
+        sorted starts found with one searchsorted. Cost is O(n log n + pairs),
+        and a dense plan has O(n ** 2) pairs, so more than max_pairs raises
+        instead of allocating them; pass None to lift the limit. Use
+        iter_overlapping_pairs() to stream the pairs in bounded chunks, or
+        overlap_counts() when only the number per campaign is needed.
+        """
+        counts = self._partner_counts()
+        total = int(counts.sum())
+        if max_pairs is not None and total > max_pairs:
+            raise ValueError(
+                f"{total:,} overlapping campaign pairs exceed max_pairs={max_pairs:,}; use "
+                "iter_overlapping_pairs() to stream them or overlap_counts() for counts per campaign"
+            )
+        return self._pairs(np.arange(len(self)), counts)
+
+    def iter_overlapping_pairs(
+        self, chunk_size: int = CAMPAIGN_OVERLAP_CHUNK_PAIRS
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        The pairs of overlapping_pairs() as (left, right) chunks of about chunk_size pairs.
+
+        Each chunk holds whole runs of partners, so a chunk exceeds chunk_size
+        only when one campaign alone overlaps more campaigns than that.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        counts = self._partner_counts()
+        cumulative = np.cumsum(counts)
+        start = 0
+        while start < len(self):
+            emitted = cumulative[start - 1] if start else 0
+            stop = max(start + 1, int(np.searchsorted(cumulative, emitted + chunk_size, side='right')))
+            if cumulative[stop - 1] > emitted:
+                yield self._pairs(np.arange(start, stop), counts[start:stop])
+            start = stop
+
+    def _partner_counts(self) -> np.ndarray:
+        """Number of later starters each campaign overlaps, by position in start order."""
+        sorted_starts = self.starts[self.order]
+        run_ends = np.searchsorted(sorted_starts, self.ends[self.order], side='left')
+        return np.maximum(run_ends - np.arange(len(self)) - 1, 0)
+
+    def _pairs(self, positions: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Row pairs for the campaigns at the given start-order positions and their partner counts."""
+        first = np.repeat(positions, counts)
+        # Position of each partner within its run, counted from 1
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+        left, right = self.order[first], self.order[first + offsets]
+        return np.minimum(left, right), np.maximum(left, right)
+
+    def overlap_counts(self) -> np.ndarray:
+        """How many other campaigns each row overlaps, in O(n log n) without listing the pairs."""
+        starting_before_end = np.searchsorted(np.sort(self.starts), self.ends, side='left')
+        ended_by_start = np.searchsorted(np.sort(self.ends), self.starts, side='right')
+        return starting_before_end - ended_by_start - 1
+
+    def active_in(self, month: int) -> np.ndarray:
+        """Rows of the campaigns running in the given month."""
+        candidates = self.order[:np.searchsorted(self.starts[self.order], month, side='right')]
+        return np.sort(candidates[self.ends[candidates] > month])
+
+    def concurrency(self, months: int) -> np.ndarray:
+        """Number of campaigns running in each of months 1..months, shape (months,)."""
+        starts = np.clip(self.starts - 1, 0, months)
+        ends = np.clip(self.ends - 1, 0, months)
+        diff = np.bincount(starts, minlength=months + 1) - np.bincount(ends, minlength=months + 1)
+        return np.cumsum(diff[:months])
@@ -0,0 +1,194 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+import numpy as np
+from models.campaign import MarketingCampaign
+from models.campaign_intervals import CampaignIntervalIndex
+from config.constants import (
+    CAMPAIGN_START_MONTH_MIN, CAMPAIGN_START_MONTH_MAX,
+    CAMPAIGN_DURATION_MIN, CAMPAIGN_DURATION_MAX
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+TEXT_COLUMNS = ('name', 'campaign_id')
+INTEGER_COLUMNS = ('start_month', 'duration_months', 'expected_reach')
+FLOAT_COLUMNS = ('budget', 'reach_to_download_rate', 'download_to_active_rate', 'active_to_subscriber_rate')
+COLUMNS = TEXT_COLUMNS + INTEGER_COLUMNS + FLOAT_COLUMNS
+RATE_COLUMNS = ('reach_to_download_rate', 'download_to_active_rate', 'active_to_subscriber_rate')
+
+
+class CampaignValidationError(ValueError):
+    """Raised with every (row, field, message) problem found while loading a campaign table."""
+
+    def __init__(self, errors: List[Tuple[int, str, str]]):
+        self.errors = errors
+        preview = "; ".join(f"row {row}: {field} {message}" for row, field, message in errors[:5])
+        more = f" (and {len(errors) - 5} more)" if len(errors) > 5 else ""
+        super().__init__(f"{len(errors)} invalid campaign values: {preview}{more}")
+
+
+def _empty(dtype) -> np.ndarray:
+    return np.empty(0, dtype=dtype)
+
+
+@dataclass(eq=False)
+class CampaignTable:
+    """
+    Struct-of-arrays campaign plan with one NumPy column per MarketingCampaign field.
+
+    Behaves like a list of campaigns for the sidebar (len, iteration, indexing,
+    append, remove), where each item is a MarketingCampaign view built without
+    re-validation. The projection engine reads the columns directly.
+    """
+    name: np.ndarray = field(default_factory=lambda: _empty(object))
+    campaign_id: np.ndarray = field(default_factory=lambda: _empty(object))
+    start_month: np.ndarray = field(default_factory=lambda: _empty(np.int64))
+    duration_months: np.ndarray = field(default_factory=lambda: _empty(np.int64))
+    expected_reach: np.ndarray = field(default_factory=lambda: _empty(np.int64))
+    budget: np.ndarray = field(default_factory=lambda: _empty(float))
+    reach_to_download_rate: np.ndarray = field(default_factory=lambda: _empty(float))
+    download_to_active_rate: np.ndarray = field(default_factory=lambda: _empty(float))
+    active_to_subscriber_rate: np.ndarray = field(default_factory=lambda: _empty(float))
+
+    @classmethod
+    def from_frame(cls, frame: "pd.DataFrame") -> "CampaignTable":
+        """Build and validate a table from a DataFrame with one column per campaign field."""
+        import pandas as pd
+
+        missing = [column for column in COLUMNS if column not in frame.columns]
+        if missing:
+            raise ValueError(f"Missing campaign columns: {', '.join(missing)}")
+
+        columns: Dict[str, np.ndarray] = {}
+        errors: List[Tuple[int, str, str]] = []
+        for column in TEXT_COLUMNS:
+            columns[column] = frame[column].astype(str).to_numpy(dtype=object)
+
+        for column in INTEGER_COLUMNS + FLOAT_COLUMNS:
+            values = pd.to_numeric(frame[column], errors='coerce').to_numpy(dtype=float)
+            invalid = ~np.isfinite(values)
+            errors.extend((int(row), column, "must be a number") for row in np.flatnonzero(invalid))
+            if column in INTEGER_COLUMNS:
+                fractional = ~invalid & (values != np.round(values))
+                errors.extend((int(row), column, "must be a whole number") for row in np.flatnonzero(fractional))
+                values = np.where(invalid, 0, values).astype(np.int64)
+            columns[column] = values
+
+        table = cls(**columns)
+        flagged = {(row, column) for row, column, _ in errors}
+        errors.extend(error for error in table.validate() if error[:2] not in flagged)
+        if errors:
+            raise CampaignValidationError(sorted(errors))
+        return table
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "CampaignTable":
+        """Build and validate a table from dicts in the MarketingCampaign layout."""
+        records = list(records)
+        if not records:
+            return cls()
+        import pandas as pd
+
+        frame = pd.DataFrame.from_records(records, columns=list(COLUMNS))
+        return cls.from_frame(frame)
+
+    @classmethod
+    def from_campaigns(cls, campaigns: Sequence[MarketingCampaign]) -> "CampaignTable":
+        """Build a table from already-validated campaign objects."""
+        return cls(**{
+            column: np.array([getattr(campaign, column) for campaign in campaigns], dtype=dtype)
+            for column, dtype in _column_dtypes().items()
+        })
+
+    @classmethod
+    def coerce(cls, campaigns: Union["CampaignTable", Sequence[MarketingCampaign]]) -> "CampaignTable":
+        if isinstance(campaigns, cls):
+            return campaigns
+        return cls.from_campaigns(list(campaigns))
+
+    def validate(self) -> List[Tuple[int, str, str]]:
+        """Vectorized MarketingCampaign rules; returns (row, field, message) for each failure."""
+        checks = [
+            ('start_month',
+             (self.start_month < CAMPAIGN_START_MONTH_MIN) | (self.start_month > CAMPAIGN_START_MONTH_MAX),
+             f"must be between {CAMPAIGN_START_MONTH_MIN} and {CAMPAIGN_START_MONTH_MAX}"),
+            ('duration_months',
+             (self.duration_months < CAMPAIGN_DURATION_MIN) | (self.duration_months > CAMPAIGN_DURATION_MAX),
+             f"must be between {CAMPAIGN_DURATION_MIN} and {CAMPAIGN_DURATION_MAX} months"),
+            ('budget', self.budget < 0, "must not be negative"),
+            ('expected_reach', self.expected_reach < 0, "must not be negative"),
+        ]
+        checks.extend(
+            (column, (getattr(self, column) < 0) | (getattr(self, column) > 1), "must be between 0 and 1")
+            for column in RATE_COLUMNS
+        )
+        return [
+            (int(row), column, message)
+            for column, invalid, message in checks
+            for row in np.flatnonzero(invalid)
+        ]
+
+    @property
+    def new_users(self) -> np.ndarray:
+        """Total users each campaign brings in over its whole duration."""
+        return (self.expected_reach * self.reach_to_download_rate *
+                self.download_to_active_rate * self.active_to_subscriber_rate)
+
+    @property
+    def intervals(self) -> CampaignIntervalIndex:
+        """Interval index over the campaigns' active months, built for the current rows."""
+        return CampaignIntervalIndex.from_arrays(self.start_month, self.duration_months)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Plain Python records in the MarketingCampaign.model_dump() layout."""
+        columns = {column: getattr(self, column).tolist() for column in COLUMNS}
+        return [dict(zip(COLUMNS, values)) for values in zip(*columns.values())]
+
+    def append(self, campaign: MarketingCampaign) -> None:
+        for column in COLUMNS:
+            setattr(self, column, np.append(getattr(self, column), getattr(campaign, column)))
+
+    def remove(self, campaign: MarketingCampaign) -> None:
+        """Remove the first row whose values match campaign."""
+        matches = np.ones(len(self), dtype=bool)
+        for column in COLUMNS:
+            matches &= getattr(self, column) == getattr(campaign, column)
+        rows = np.flatnonzero(matches)
+        if rows.size == 0:
+            raise ValueError("Campaign is not in the table")
+        for column in COLUMNS:
+            setattr(self, column, np.delete(getattr(self, column), rows[0]))
+
+    def __len__(self) -> int:
+        return self.start_month.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CampaignTable(**{column: getattr(self, column)[index] for column in COLUMNS})
+        return MarketingCampaign.model_construct(**{
+            column: getattr(self, column)[index].item() if column not in TEXT_COLUMNS
+            else getattr(self, column)[index]
+            for column in COLUMNS
+        })
+
+    def __iter__(self) -> Iterator[MarketingCampaign]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CampaignTable):
+            try:
+                other = CampaignTable.coerce(other)
+            except (TypeError, AttributeError):
+                return NotImplemented
+        return len(self) == len(other) and all(
+            np.array_equal(getattr(self, column), getattr(other, column)) for column in COLUMNS
+        )
+
+
+def _column_dtypes() -> Dict[str, Any]:
+    dtypes: Dict[str, Any] = {column: object for column in TEXT_COLUMNS}
+    dtypes.update({column: np.int64 for column in INTEGER_COLUMNS})
+    dtypes.update({column: float for column in FLOAT_COLUMNS})
+    return dtypes
@@ -0,0 +1,47 @@
+from pydantic import BaseModel, validator
+from typing import Optional
+from config.constants import (
+    OPTIMIZER_OBJECTIVES,
+    OPTIMIZER_POPULATION,
+    OPTIMIZER_MAX_GENERATIONS,
+    OPTIMIZER_ELITE_FRACTION,
+    OPTIMIZER_PATIENCE,
+    OPTIMIZER_TOLERANCE,
+    OPTIMIZER_DEFAULT_SEED
+)
+
+
+class OptimizationConfig(BaseModel):
+    total_budget: float
+    objective: str = "revenue"  # Month-N revenue, or cumulative ROI on the spend
+    population: int = OPTIMIZER_POPULATION
+    max_generations: int = OPTIMIZER_MAX_GENERATIONS
+    elite_fraction: float = OPTIMIZER_ELITE_FRACTION
+    patience: int = OPTIMIZER_PATIENCE
+    tolerance: float = OPTIMIZER_TOLERANCE
+    seed: int = OPTIMIZER_DEFAULT_SEED
+    workers: Optional[int] = None  # None runs in-process for small populations, else on every core
+
+    @validator('total_budget')
+    def validate_budget(cls, v):
+        if v <= 0:
+            raise ValueError("Total budget must be positive")
+        return v
+
+    @validator('objective')
+    def validate_objective(cls, v):
+        if v not in OPTIMIZER_OBJECTIVES:
+            raise ValueError(f"Objective must be one of {', '.join(OPTIMIZER_OBJECTIVES)}")
+        return v
+
+    @validator('population', 'max_generations', 'patience')
+    def validate_positive(cls, v):
+        if v < 1:
+            raise ValueError("Population, generations and patience must be at least 1")
+        return v
+
+    @validator('elite_fraction')
+    def validate_elite_fraction(cls, v):
+        if not 0 < v < 1:
+            raise ValueError("Elite fraction must be between 0 and 1")
+        return v
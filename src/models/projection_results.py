@@ -0,0 +1,302 @@
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Tuple
+import numpy as np
+from models.tier_matrix import TierMatrix
+from models.campaign_table import CampaignTable
+
+if TYPE_CHECKING:
+    # pandas and pyarrow are imported on first use so headless callers that
+    # only read arrays never pay for them
+    import pandas as pd
+    import pyarrow as pa
+
+# Monthly series of a ProjectionResult, in calculate_projections column order
+PROJECTION_COLUMNS = (
+    'month', 'base_users', 'campaign_users', 'total_users',
+    'organic_growth_rate', 'campaign_growth_rate', 'growth_rate', 'total_revenue'
+)
+
+
+@dataclass(frozen=True)
+class ProjectionResult:
+    """
+    One projection as contiguous monthly arrays with its tier and campaign metadata.
+
+    to_pandas() and tier_frame() build the calculate_projections and
+    calculate_tier_projections layouts on demand; aggregates can be read from
+    the arrays without constructing a DataFrame.
+    """
+    month: np.ndarray                 # (months,) 1-based
+    base_users: np.ndarray            # (months,)
+    campaign_users: np.ndarray        # (months,)
+    total_users: np.ndarray           # (months,)
+    organic_growth_rate: np.ndarray   # (months,) percent
+    campaign_growth_rate: np.ndarray  # (months,) percent
+    growth_rate: np.ndarray           # (months,) percent
+    total_revenue: np.ndarray         # (months,)
+    tiers: TierMatrix                 # Prices and user shares per tier and month
+    campaign_names: Tuple[str, ...]
+
+    @property
+    def months(self) -> int:
+        return self.month.shape[0]
+
+    @property
+    def tier_names(self) -> Tuple[str, ...]:
+        return self.tiers.names
+
+    @property
+    def tier_users(self) -> np.ndarray:
+        """Users per tier, shape (tiers, months)."""
+        return self.tiers.project(self.total_users)[0]
+
+    @property
+    def tier_revenue(self) -> np.ndarray:
+        """Revenue per tier, shape (tiers, months)."""
+        return self.tiers.project(self.total_users)[1]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self.to_arrays().values())
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """The monthly series in the calculate_projections layout."""
+        import pandas as pd
+
+        return pd.DataFrame({column: getattr(self, column) for column in PROJECTION_COLUMNS})
+
+    def tier_frame(self) -> "pd.DataFrame":
+        """Per-tier price, users and revenue in the calculate_tier_projections layout."""
+        return self.tiers.to_frame(self.total_users)
+
+    def to_arrow(self) -> "pa.Table":
+        """The monthly series as an Arrow table with the tier and campaign names in its metadata."""
+        import pyarrow as pa
+
+        return pa.table(
+            {column: getattr(self, column) for column in PROJECTION_COLUMNS},
+            metadata={
+                'tiers': json.dumps(self.tier_names),
+                'campaigns': json.dumps(self.campaign_names)
+            }
+        )
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Every field as a plain NumPy array, for np.savez-style storage without pickling."""
+        arrays = {column: getattr(self, column) for column in PROJECTION_COLUMNS}
+        arrays.update(
+            tier_names=np.array(self.tier_names, dtype=str),
+            tier_prices=self.tiers.prices,
+            tier_distribution=np.ascontiguousarray(self.tiers.distribution),
+            campaign_names=np.array(self.campaign_names, dtype=str)
+        )
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "ProjectionResult":
+        """Inverse of to_arrays."""
+        return cls(
+            **{column: np.asarray(arrays[column]) for column in PROJECTION_COLUMNS},
+            tiers=TierMatrix(
+                names=tuple(str(name) for name in arrays['tier_names']),
+                prices=np.asarray(arrays['tier_prices']),
+                distribution=np.asarray(arrays['tier_distribution'])
+            ),
+            campaign_names=tuple(str(name) for name in arrays['campaign_names'])
+        )
+
+
+@dataclass(frozen=True)
+class BatchProjectionResult:
+    """Columnar projections for N scenarios over the same months and tiers."""
+    months: np.ndarray              # (months,)
+    tier_names: Tuple[str, ...]
+    growth_rates: np.ndarray        # (N,) gross monthly growth rate
+    churn_rates: np.ndarray         # (N,) monthly churn rate
+    tier_prices: np.ndarray         # (N, tiers, months)
+    tier_distributions: np.ndarray  # (N, tiers)
+    base_users: np.ndarray          # (N, months)
+    campaign_users: np.ndarray      # (N, months)
+    total_users: np.ndarray         # (N, months)
+    total_revenue: np.ndarray       # (N, months)
+    initial_users: float
+
+    @property
+    def n_scenarios(self) -> int:
+        return self.total_users.shape[0]
+
+    @property
+    def tier_users(self) -> np.ndarray:
+        """Users per tier, shape (N, tiers, months)."""
+        return self.total_users[:, None, :] * self.tier_distributions[:, :, None]
+
+    @property
+    def tier_revenue(self) -> np.ndarray:
+        """Revenue per tier, shape (N, tiers, months)."""
+        return self.tier_users * self.tier_prices
+
+    def to_frame(self, scenario: int) -> "pd.DataFrame":
+        """Materialize one scenario in the same layout as calculate_projections."""
+        import pandas as pd
+        from services.projection_kernel import growth_rate_breakdown
+
+        base_users = self.base_users[scenario]
+        campaign_users = self.campaign_users[scenario]
+        total_users = self.total_users[scenario]
+        organic_growth_rate, campaign_growth_rate, growth_rate = growth_rate_breakdown(
+            base_users, campaign_users, total_users, self.initial_users
+        )
+        return pd.DataFrame({
+            'month': self.months,
+            'base_users': base_users,
+            'campaign_users': campaign_users,
+            'total_users': total_users,
+            'organic_growth_rate': organic_growth_rate,
+            'campaign_growth_rate': campaign_growth_rate,
+            'growth_rate': growth_rate,
+            'total_revenue': self.total_revenue[scenario]
+        })
+
+    def tier_frame(self, scenario: int) -> "pd.DataFrame":
+        """Materialize one scenario in the same layout as calculate_tier_projections."""
+        return self.tier_matrix(scenario).to_frame(self.total_users[scenario])
+
+    def tier_matrix(self, scenario: int) -> TierMatrix:
+        prices = self.tier_prices[scenario]
+        return TierMatrix(
+            names=self.tier_names,
+            prices=prices,
+            distribution=np.broadcast_to(self.tier_distributions[scenario][:, None], prices.shape)
+        )
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    """Per-month percentile bands of users and revenue across simulated paths."""
+    months: np.ndarray               # (months,)
+    percentiles: Tuple[float, ...]   # e.g. (5, 50, 95)
+    users: np.ndarray                # (percentiles, months)
+    revenue: np.ndarray              # (percentiles, months)
+    paths: int
+    seed: int
+
+    def band(self, metric: str, percentile: float) -> np.ndarray:
+        """Return one percentile series of 'users' or 'revenue'."""
+        return getattr(self, metric)[self.percentiles.index(percentile)]
+
+    def to_frame(self) -> "pd.DataFrame":
+        import pandas as pd
+
+        columns = {'month': self.months}
+        for metric in ('users', 'revenue'):
+            for idx, percentile in enumerate(self.percentiles):
+                columns[f'{metric}_p{percentile:g}'] = getattr(self, metric)[idx]
+        return pd.DataFrame(columns)
+
+
+@dataclass(frozen=True)
+class SensitivityResult:
+    """Month-N metrics with each input perturbed down and up by a relative step."""
+    months: int
+    step: float
+    parameters: Tuple[str, ...]
+    groups: Tuple[str, ...]          # growth, churn, tier or campaign
+    base_values: np.ndarray          # (parameters,)
+    metrics: Tuple[str, ...]         # ('revenue', 'arr', 'users')
+    base: np.ndarray                 # (metrics,)
+    low: np.ndarray                  # (parameters, metrics) with the input at (1 - step) x base
+    high: np.ndarray                 # (parameters, metrics) with the input at (1 + step) x base
+
+    @property
+    def elasticities(self) -> np.ndarray:
+        """Central-difference elasticity: % change in each metric per 1% change in the input."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.base > 0, (self.high - self.low) / (2 * self.step * self.base), 0.0)
+
+    def to_frame(self) -> "pd.DataFrame":
+        """One row per input, sorted by the swing in Month-N revenue."""
+        import pandas as pd
+
+        columns = {
+            'parameter': self.parameters,
+            'group': self.groups,
+            'base_value': self.base_values
+        }
+        elasticities = self.elasticities
+        for idx, metric in enumerate(self.metrics):
+            columns[f'{metric}_low'] = self.low[:, idx]
+            columns[f'{metric}_high'] = self.high[:, idx]
+            columns[f'{metric}_elasticity'] = elasticities[:, idx]
+
+        frame = pd.DataFrame(columns)
+        swing = np.abs(self.high[:, 0] - self.low[:, 0])
+        return frame.iloc[np.argsort(-swing, kind='stable')].reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class OptimizationResult:
+    """Best campaign schedule found by the optimizer and how the search went."""
+    objective: str
+    value: float                     # Objective of the best schedule
+    baseline_value: float            # Objective of the schedule the search started from
+    start_months: np.ndarray         # (campaigns,)
+    duration_months: np.ndarray      # (campaigns,)
+    budgets: np.ndarray              # (campaigns,)
+    history: np.ndarray              # (generations,) best objective after each generation
+    evaluations: int
+    converged: bool                  # Stopped early because the best value stopped improving
+
+    @property
+    def improvement(self) -> float:
+        """Relative gain of the best schedule over the starting schedule."""
+        if self.baseline_value == 0:
+            return 0.0
+        return (self.value - self.baseline_value) / abs(self.baseline_value)
+
+    def to_table(self, campaigns: CampaignTable) -> CampaignTable:
+        """Apply the schedule to the candidate campaigns, scaling reach with each budget."""
+        return CampaignTable(
+            name=campaigns.name.copy(),
+            campaign_id=campaigns.campaign_id.copy(),
+            start_month=self.start_months.astype(np.int64),
+            duration_months=self.duration_months.astype(np.int64),
+            expected_reach=np.round(campaigns.expected_reach * self.budgets / campaigns.budget).astype(np.int64),
+            budget=self.budgets.astype(float),
+            reach_to_download_rate=campaigns.reach_to_download_rate.copy(),
+            download_to_active_rate=campaigns.download_to_active_rate.copy(),
+            active_to_subscriber_rate=campaigns.active_to_subscriber_rate.copy()
+        )
+
+
+@dataclass(frozen=True)
+class ScenarioComparison:
+    """Projections for several growth scenarios that share every other input."""
+    names: Tuple[str, ...]
+    growth_rates: np.ndarray         # (scenarios,) gross monthly growth rate
+    months: np.ndarray               # (months,)
+    total_users: np.ndarray          # (scenarios, months)
+    total_revenue: np.ndarray        # (scenarios, months)
+
+    def index(self, name: str) -> int:
+        if name not in self.names:
+            raise ValueError(f"Unknown scenario '{name}'")
+        return self.names.index(name)
+
+    def summary(self, baseline: str) -> "pd.DataFrame":
+        """Headline metrics per scenario with their relative change from the baseline."""
+        import pandas as pd
+
+        metrics = {
+            'total_revenue': self.total_revenue.sum(axis=1),
+            'final_revenue': self.total_revenue[:, -1],
+            'arr': self.total_revenue[:, -1] * 12,
+            'final_users': self.total_users[:, -1]
+        }
+        base = self.index(baseline)
+        columns = {'scenario': self.names, 'growth_rate': self.growth_rates}
+        for metric, values in metrics.items():
+            columns[metric] = values
+            with np.errstate(divide='ignore', invalid='ignore'):
+                columns[f'{metric}_delta'] = np.where(values[base] != 0, values / values[base] - 1, 0.0)
+        return pd.DataFrame(columns)
@@ -0,0 +1,52 @@
+from pydantic import BaseModel, validator
+from typing import List, Optional
+import numpy as np
+
+
+class RetentionCurve(BaseModel):
+    """
+    Share of a monthly cohort still subscribed by age.
+
+    Churn starts at initial_churn in the first month after acquisition and its
+    excess over long_term_churn shrinks by `decay` every month. A measured
+    `survival` curve (retention after 1, 2, ... months) overrides the
+    parametric shape for the ages it covers, and long_term_churn continues it.
+    """
+    initial_churn: float = 0.25
+    long_term_churn: float = 0.03
+    decay: float = 0.6
+    survival: Optional[List[float]] = None
+
+    @validator('initial_churn', 'long_term_churn', 'decay')
+    def validate_rate(cls, v):
+        if not 0 <= v <= 1:
+            raise ValueError("Churn rates and decay must be between 0 and 1")
+        return v
+
+    @validator('survival')
+    def validate_survival(cls, v):
+        if v is not None:
+            if any(not 0 <= value <= 1 for value in v):
+                raise ValueError("Survival values must be between 0 and 1")
+            if any(later > earlier for earlier, later in zip(v, v[1:])):
+                raise ValueError("Survival values cannot increase with age")
+        return v
+
+    def monthly_churn(self, months: int) -> np.ndarray:
+        """Churn rate in each month of a cohort's life, months 1..months."""
+        excess = self.initial_churn - self.long_term_churn
+        return self.long_term_churn + excess * self.decay ** np.arange(months)
+
+    def survival_at(self, ages_in_months: np.ndarray) -> np.ndarray:
+        """Retention at (possibly fractional) ages in months; 1.0 at age 0."""
+        ages_in_months = np.asarray(ages_in_months, dtype=float)
+        horizon = int(np.ceil(ages_in_months.max(initial=0.0)))
+        log_retention = np.log1p(-np.minimum(self.monthly_churn(horizon), 1 - 1e-12))
+        if self.survival:
+            measured = np.maximum(np.asarray(self.survival[:horizon], dtype=float), 1e-300)
+            previous = np.concatenate([[1.0], measured[:-1]])
+            log_retention[:len(measured)] = np.log(measured / previous)
+
+        # Piecewise log-linear within each month so daily ages interpolate smoothly
+        knots = np.concatenate([[0.0], np.cumsum(log_retention)])
+        return np.exp(np.interp(ages_in_months, np.arange(horizon + 1), knots))
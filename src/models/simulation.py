@@ -0,0 +1,76 @@
+from pydantic import BaseModel, validator
+from typing import Optional
+import numpy as np
+from config.constants import (
+    MONTE_CARLO_PATHS_DEFAULT,
+    MONTE_CARLO_CHUNK_SIZE,
+    MONTE_CARLO_DEFAULT_SEED,
+    MONTE_CARLO_SPREAD_DEFAULT
+)
+
+DISTRIBUTION_KINDS = ("fixed", "normal", "uniform", "triangular", "lognormal")
+
+
+class RateDistribution(BaseModel):
+    """Distribution of a rate around its point estimate; spread is relative to the estimate."""
+    kind: str = "normal"
+    spread: float = MONTE_CARLO_SPREAD_DEFAULT / 100
+    lower: float = 0.0
+    upper: float = 1.0
+
+    @validator('kind')
+    def validate_kind(cls, v):
+        if v not in DISTRIBUTION_KINDS:
+            raise ValueError(f"Distribution must be one of {', '.join(DISTRIBUTION_KINDS)}")
+        return v
+
+    @validator('spread')
+    def validate_spread(cls, v):
+        if v < 0:
+            raise ValueError("Spread cannot be negative")
+        return v
+
+    def sample(self, rng: np.random.Generator, point, size) -> np.ndarray:
+        """Draw samples centred on point (scalar or array broadcastable to size)."""
+        point = np.broadcast_to(np.asarray(point, dtype=float), size)
+        if self.kind == "fixed" or self.spread == 0:
+            draws = point.copy()
+        elif self.kind == "normal":
+            draws = rng.normal(point, self.spread * np.abs(point))
+        elif self.kind == "uniform":
+            draws = point * rng.uniform(1 - self.spread, 1 + self.spread, size)
+        elif self.kind == "triangular":
+            draws = point * rng.triangular(1 - self.spread, 1.0, 1 + self.spread, size)
+        else:
+            draws = point * rng.lognormal(0.0, self.spread, size)
+        return np.clip(draws, self.lower, self.upper)
+
+
+class SimulationConfig(BaseModel):
+    paths: int = MONTE_CARLO_PATHS_DEFAULT
+    seed: int = MONTE_CARLO_DEFAULT_SEED
+    workers: Optional[int] = None  # None uses every available core
+    chunk_size: int = MONTE_CARLO_CHUNK_SIZE
+    growth_rate: RateDistribution = RateDistribution(upper=2.0)
+    churn_rate: RateDistribution = RateDistribution()
+    reach_to_download_rate: RateDistribution = RateDistribution()
+    download_to_active_rate: RateDistribution = RateDistribution()
+    active_to_subscriber_rate: RateDistribution = RateDistribution()
+
+    @validator('paths', 'chunk_size')
+    def validate_positive(cls, v):
+        if v < 1:
+            raise ValueError("Paths and chunk size must be at least 1")
+        return v
+
+    @classmethod
+    def with_spread(cls, spread: float, **kwargs) -> "SimulationConfig":
+        """Build a config that applies the same relative spread to every rate."""
+        return cls(
+            growth_rate=RateDistribution(spread=spread, upper=2.0),
+            churn_rate=RateDistribution(spread=spread),
+            reach_to_download_rate=RateDistribution(spread=spread),
+            download_to_active_rate=RateDistribution(spread=spread),
+            active_to_subscriber_rate=RateDistribution(spread=spread),
+            **kwargs
+        )
@@ -1,20 +1,48 @@
 from pydantic import BaseModel, validator
-from typing import List
+from typing import List, Optional
+from models.retention import RetentionCurve
+from config.constants import MAX_PROJECTION_MONTHS
+
+class PriceChange(BaseModel):
+    start_month: int
+    monthly_price: float
+
+    @validator('start_month')
+    def validate_start_month(cls, v):
+        # Changes later than a given projection's horizon simply never apply
+        if not 1 <= v <= MAX_PROJECTION_MONTHS:
+            raise ValueError(f"Price change month must be between 1 and {MAX_PROJECTION_MONTHS}")
+        return v
+
+    @validator('monthly_price')
+    def validate_price(cls, v):
+        if not 0 <= v <= 100:
+            raise ValueError("Price must be between 0 and 100")
+        return v
 
 class SubscriptionTier(BaseModel):
     name: str
     monthly_price: float
     features: List[str]
     distribution_percentage: float
-    
+    price_schedule: List[PriceChange] = []  # Price changes applied from their start month on
+    retention: Optional[RetentionCurve] = None  # Cohort retention; defaults by tier name when None
+
     @validator('monthly_price')
     def validate_price(cls, v):
         if not 0 <= v <= 100:
             raise ValueError("Price must be between 0 and 100")
         return v
-    
+
     @validator('distribution_percentage')
     def validate_distribution(cls, v):
         if not 0 <= v <= 1:
             raise ValueError("Distribution must be between 0 and 1")
-        return v 
\ No newline at end of file
+        return v
+
+    @validator('price_schedule')
+    def validate_price_schedule(cls, v):
+        months = [change.start_month for change in v]
+        if len(set(months)) != len(months):
+            raise ValueError("Price schedule months must be unique")
+        return sorted(v, key=lambda change: change.start_month)
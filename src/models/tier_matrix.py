@@ -0,0 +1,72 @@
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Sequence, Tuple
+import numpy as np
+from models.subscription import SubscriptionTier
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass(frozen=True)
+class TierMatrix:
+    """
+    Subscription tiers as (tiers, months) price and distribution matrices.
+
+    Row t holds tier t's monthly price schedule and share of users, so per-tier
+    users and revenue for a whole projection are one broadcast multiply
+    against the total users series.
+    """
+    names: Tuple[str, ...]
+    prices: np.ndarray        # (tiers, months)
+    distribution: np.ndarray  # (tiers, months)
+
+    @classmethod
+    def from_tiers(cls, tiers: Sequence[SubscriptionTier], months: int) -> "TierMatrix":
+        """Expand each tier's launch price and price_schedule into a monthly price row."""
+        prices = np.repeat(np.array([[tier.monthly_price] for tier in tiers], dtype=float), months, axis=1)
+        for row, tier in enumerate(tiers):
+            for change in tier.price_schedule:
+                prices[row, change.start_month - 1:] = change.monthly_price
+
+        distribution = np.array([[tier.distribution_percentage] for tier in tiers], dtype=float)
+        return cls(
+            names=tuple(tier.name for tier in tiers),
+            prices=prices,
+            distribution=np.broadcast_to(distribution, prices.shape)
+        )
+
+    def with_users(self, tier_users: np.ndarray, total_users: np.ndarray) -> "TierMatrix":
+        """Copy with time-varying shares so project(total_users) returns tier_users."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distribution = np.where(total_users > 0, tier_users / total_users, self.distribution)
+        return replace(self, distribution=distribution)
+
+    @property
+    def months(self) -> int:
+        return self.prices.shape[1]
+
+    @property
+    def revenue_per_user(self) -> np.ndarray:
+        """Blended monthly revenue per user, shape (months,)."""
+        return np.einsum('tm,tm->m', self.distribution, self.prices)
+
+    def project(self, total_users: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Users and revenue per tier for a (months,) total users series, each (tiers, months)."""
+        users = self.distribution * total_users
+        return users, users * self.prices
+
+    def to_frame(self, total_users: np.ndarray) -> "pd.DataFrame":
+        """Long projection with one row per (month, tier) and price, users and revenue columns."""
+        import pandas as pd
+
+        users, revenue = self.project(total_users)
+        index = pd.MultiIndex.from_product(
+            [np.arange(1, self.months + 1), pd.CategoricalIndex(self.names, categories=self.names)],
+            names=['month', 'tier']
+        )
+        # Transpose so rows run month-major, matching the index order
+        return pd.DataFrame({
+            'price': self.prices.T.ravel(),
+            'users': users.T.ravel(),
+            'revenue': revenue.T.ravel()
+        }, index=index)
@@ -0,0 +1,415 @@
+import io
+import os
+import sqlite3
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+import numpy as np
+from models.projection_results import ProjectionResult
+from services.projection_service import ProjectionService
+from config.constants import (
+    PROJECTION_CACHE_MAX_ENTRIES,
+    PROJECTION_CACHE_MAX_BYTES,
+    PROJECTION_CACHE_TTL_SECONDS,
+    DISK_CACHE_DIR,
+    DISK_CACHE_DIR_ENV_VAR,
+    DISK_CACHE_MAX_ENTRIES,
+    DISK_CACHE_MAX_BYTES,
+    DISK_CACHE_TTL_SECONDS,
+    DISK_CACHE_BUSY_TIMEOUT_SECONDS,
+    DISK_CACHE_FLUSH_READS,
+    DISK_CACHE_FORMAT_VERSION
+)
+
+
+@dataclass
+class _CacheEntry:
+    value: ProjectionResult
+    size: int
+    created_at: float
+
+
+class ProjectionCache:
+    """
+    Bounded LRU cache of projection results keyed by ProjectionService.config_hash.
+
+    Entries are evicted when they exceed the age limit, or least-recently-used
+    first once the entry count or total byte size passes its bound. Cached
+    results are shared between callers and their arrays must not be mutated in place.
+
+    With a backing DiskProjectionCache, memory misses fall through to the disk
+    cache shared by all server processes, and computed results are written to both.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = PROJECTION_CACHE_MAX_ENTRIES,
+        max_bytes: int = PROJECTION_CACHE_MAX_BYTES,
+        ttl_seconds: float = PROJECTION_CACHE_TTL_SECONDS,
+        backing: Optional["DiskProjectionCache"] = None
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.backing = backing
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ProjectionResult]:
+        """Return the cached result for key, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key: str, value: ProjectionResult) -> None:
+        """Store a result and evict entries until the cache is within its bounds."""
+        size = value.nbytes
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = _CacheEntry(value=value, size=size, created_at=time.monotonic())
+            self._total_bytes += size
+            self._evict()
+
+    def get_or_compute(self, projection_service: ProjectionService, months: int = 12) -> ProjectionResult:
+        """Return the cached projection for the service's config, computing it on a miss."""
+        key = projection_service.config_hash(months)
+        projections = self.get(key)
+        if projections is not None:
+            return projections
+
+        if self.backing is not None:
+            projections = self.backing.get(key)
+        if projections is None:
+            projections = projection_service.project(months=months)
+            if self.backing is not None:
+                self.backing.put(key, projections)
+        self.put(key, projections)
+        return projections
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        requests = self.hits + self.misses
+        stats = {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self._total_bytes
+        }
+        if self.backing is not None:
+            stats['disk'] = self.backing.stats
+        return stats
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return time.monotonic() - entry.created_at > self.ttl_seconds
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+
+    def _evict(self) -> None:
+        for key in [key for key, entry in self._entries.items() if self._is_expired(entry)]:
+            self._remove(key)
+            self.evictions += 1
+
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+
+class DiskProjectionCache:
+    """
+    Projection results in a SQLite database shared by every process on the host.
+
+    Entries are keyed by ProjectionService.config_hash and stored as the .npz
+    archive of ProjectionResult.to_arrays(), so they survive restarts and need
+    no pickling. The database runs in WAL mode and reads are plain SELECTs that
+    take no write lock, so readers never block or wait on each other. Writers
+    from several server processes serialize on SQLite's lock, waiting up to
+    busy_timeout seconds.
+
+    Entries older than ttl_seconds are ignored and purged; once the entry count
+    or total size passes its bound, least-recently-read entries are evicted
+    first. Read times and hit/miss counts are buffered per process and written
+    back with the next put, stats call or every flush_reads reads, so recency
+    and the shared counters lag by at most that many reads per process.
+
+    The directory and database are created on first use. Disk errors (a full or
+    read-only volume, a corrupt file) never fail a projection: they count as
+    misses or skipped writes and are tallied in stats.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DISK_CACHE_MAX_ENTRIES,
+        max_bytes: int = DISK_CACHE_MAX_BYTES,
+        ttl_seconds: float = DISK_CACHE_TTL_SECONDS,
+        busy_timeout: float = DISK_CACHE_BUSY_TIMEOUT_SECONDS,
+        flush_reads: int = DISK_CACHE_FLUSH_READS
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.busy_timeout = busy_timeout
+        self.flush_reads = flush_reads
+        self.errors = 0
+        self._local = threading.local()  # SQLite connections are per thread
+        self._lock = threading.Lock()
+        self._created = False
+        # Reads not yet written back: counter increments and last read time per key
+        self._pending_counts: Dict[str, int] = {}
+        self._pending_reads: Dict[str, float] = {}
+
+    @classmethod
+    def default(cls) -> Optional["DiskProjectionCache"]:
+        """
+        The cache under DISK_CACHE_DIR_ENV_VAR, or DISK_CACHE_DIR when it is unset.
+
+        Returns None when the variable is set to an empty string, leaving the
+        memory cache on its own. Nothing touches the disk until the first read
+        or write; an unusable directory then shows up as errors in stats.
+        """
+        directory = os.environ.get(DISK_CACHE_DIR_ENV_VAR, DISK_CACHE_DIR)
+        if not directory:
+            return None
+        return cls(os.path.join(directory, "projections.sqlite3"))
+
+    def get(self, key: str) -> Optional[ProjectionResult]:
+        """Return the stored result for key, or None on a miss, expired entry or disk error."""
+        key = self._versioned(key)
+        now = time.time()
+        try:
+            # Autocommit SELECT: a WAL snapshot read that never takes the write lock
+            row = self._connection().execute(
+                "SELECT value FROM projections WHERE key = ? AND created_at >= ?",
+                (key, now - self.ttl_seconds)
+            ).fetchone()
+        except (OSError, sqlite3.Error):
+            self.errors += 1
+            return None
+
+        self._record_read(key if row is not None else None, now)
+        if row is None:
+            return None
+        try:
+            return _from_npz(row[0])
+        except (zipfile.BadZipFile, KeyError, ValueError):
+            self.errors += 1
+            return None
+
+    def put(self, key: str, value: ProjectionResult) -> None:
+        """Store a result, then purge expired entries and evict until within bounds."""
+        blob = _to_npz(value)
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            with self._transaction() as connection:
+                self._write_reads(connection)
+                connection.execute(
+                    "INSERT OR REPLACE INTO projections VALUES (?, ?, ?, ?, ?)",
+                    (self._versioned(key), blob, len(blob), now, now)
+                )
+                self._evict(connection, now)
+        except (OSError, sqlite3.Error):
+            self.errors += 1
+
+    def flush(self) -> None:
+        """Write buffered read times and hit/miss counts back to the database."""
+        if not self._pending_counts:
+            return
+        try:
+            with self._transaction() as connection:
+                self._write_reads(connection)
+        except (OSError, sqlite3.Error):
+            self.errors += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending_counts.clear()
+            self._pending_reads.clear()
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM projections")
+            connection.execute("DELETE FROM counters")
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Counts across every process using the database, plus this process's disk errors."""
+        self.flush()
+        try:
+            connection = self._connection()
+            counters = dict(connection.execute("SELECT name, value FROM counters").fetchall())
+            entries, total_bytes = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM projections"
+            ).fetchone()
+        except (OSError, sqlite3.Error):
+            self.errors += 1
+            counters, entries, total_bytes = {}, 0, 0
+
+        hits, misses = counters.get('hits', 0), counters.get('misses', 0)
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'evictions': counters.get('evictions', 0),
+            'entries': entries,
+            'bytes': total_bytes,
+            'errors': self.errors
+        }
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit mode; _transaction issues BEGIN IMMEDIATE itself
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        if not self._created:
+            self._create(connection)
+            self._created = True
+        return connection
+
+    def _create(self, connection: sqlite3.Connection) -> None:
+        # Check with a plain read first so opening an existing cache takes no write lock
+        tables = connection.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ('projections', 'counters')"
+        ).fetchone()[0]
+        if tables == 2:
+            return
+        with _Transaction(connection):
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS projections (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS projections_accessed ON projections (accessed_at)")
+            connection.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._connection())
+
+    def _record_read(self, key: Optional[str], now: float) -> None:
+        """Buffer a hit on key (or a miss when None), writing back every flush_reads reads."""
+        with self._lock:
+            counter = 'hits' if key is not None else 'misses'
+            self._pending_counts[counter] = self._pending_counts.get(counter, 0) + 1
+            if key is not None:
+                self._pending_reads[key] = now
+            buffered = sum(self._pending_counts.values())
+        if buffered >= self.flush_reads:
+            self.flush()
+
+    def _write_reads(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            counts, self._pending_counts = self._pending_counts, {}
+            reads, self._pending_reads = self._pending_reads, {}
+        connection.executemany(
+            "UPDATE projections SET accessed_at = MAX(accessed_at, ?) WHERE key = ?",
+            [(read_at, key) for key, read_at in reads.items()]
+        )
+        for name, amount in counts.items():
+            self._count(connection, name, amount)
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        evicted = connection.execute(
+            "DELETE FROM projections WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+
+        entries, total_bytes = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM projections"
+        ).fetchone()
+        if entries > self.max_entries or total_bytes > self.max_bytes:
+            # Walk entries from least recently read, dropping them until both bounds hold
+            stale = []
+            for key, size in connection.execute("SELECT key, size FROM projections ORDER BY accessed_at"):
+                if entries <= self.max_entries and total_bytes <= self.max_bytes:
+                    break
+                stale.append((key,))
+                entries -= 1
+                total_bytes -= size
+            connection.executemany("DELETE FROM projections WHERE key = ?", stale)
+            evicted += len(stale)
+
+        if evicted:
+            self._count(connection, 'evictions', evicted)
+
+    @staticmethod
+    def _count(connection: sqlite3.Connection, name: str, amount: int = 1) -> None:
+        connection.execute(
+            "INSERT INTO counters VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount)
+        )
+
+    @staticmethod
+    def _versioned(key: str) -> str:
+        # Results written by an older projection format are never read back
+        return f"{DISK_CACHE_FORMAT_VERSION}:{key}"
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back on error, so writers take the lock up front."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.connection.execute("ROLLBACK" if exc_type is not None else "COMMIT")
+
+
+def _to_npz(result: ProjectionResult) -> bytes:
+    buffer = io.BytesIO()
+    np.savez(buffer, **result.to_arrays())
+    return buffer.getvalue()
+
+
+def _from_npz(blob: bytes) -> ProjectionResult:
+    with np.load(io.BytesIO(blob), allow_pickle=False) as archive:
+        return ProjectionResult.from_arrays({name: archive[name] for name in archive.files})
+
+
+# Process-wide cache shared by the Streamlit app and headless callers, backed by
+# the on-disk cache shared across server processes and restarts
+projection_cache = ProjectionCache(backing=DiskProjectionCache.default())
@@ -0,0 +1,193 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+from models.optimization import OptimizationConfig
+from models.projection_results import OptimizationResult
+from services.projection_kernel import batch_cumulative_campaign_users
+from services.projection_service import ProjectionService
+from config.constants import (
+    CAMPAIGN_START_MONTH_MIN, CAMPAIGN_START_MONTH_MAX,
+    CAMPAIGN_DURATION_MIN, CAMPAIGN_DURATION_MAX,
+    OPTIMIZER_PARALLEL_MIN_POPULATION, OPTIMIZER_MIN_BUDGET_SHARE
+)
+
+
+@dataclass(frozen=True)
+class _Evaluator:
+    """Scores campaign schedules; holds everything that does not change during a search."""
+    months: int
+    objective: str
+    baseline_revenue: np.ndarray     # (months,) revenue with no campaigns
+    revenue_response: np.ndarray     # (months, months) ProjectionService.revenue_response
+    reach_per_dollar: np.ndarray     # (campaigns,)
+    conversion_rate: np.ndarray      # (campaigns,) reach to subscriber
+
+    def __call__(self, schedules: tuple) -> np.ndarray:
+        """Objective for (start_months, duration_months, budgets), each shape (schedules, campaigns)."""
+        start_months, duration_months, budgets = schedules
+        new_users = budgets * self.reach_per_dollar * self.conversion_rate
+        campaign_users = batch_cumulative_campaign_users(start_months, duration_months, new_users, self.months)
+        revenue = self.baseline_revenue + campaign_users @ self.revenue_response
+
+        if self.objective == "revenue":
+            return revenue[:, -1]
+        spend = budgets.sum(axis=1)
+        uplift = revenue.sum(axis=1) - self.baseline_revenue.sum()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(spend > 0, (uplift - spend) / spend, 0.0)
+
+
+def optimize_campaigns(
+    projection_service: ProjectionService,
+    config: OptimizationConfig,
+    months: int = 12
+) -> OptimizationResult:
+    """
+    Search start months, durations and budget splits of the service's campaigns.
+
+    Each campaign keeps its funnel rates and planned cost per reach, so its
+    reach scales with the budget it is given; part of the total budget may stay
+    unspent, but every campaign keeps at least OPTIMIZER_MIN_BUDGET_SHARE of it
+    so a later run can still move budget back to it. An evolutionary search
+    keeps the best schedules of each generation as parents for mutated
+    children, scoring every generation as one batched projection, and stops
+    once the best value has not improved for config.patience generations.
+    Generations are split across worker processes only when config.workers
+    asks for them or the population reaches OPTIMIZER_PARALLEL_MIN_POPULATION;
+    below that a process pool costs more to start than it saves. Schedules are
+    scored through ProjectionService.revenue_response, so their revenue is what
+    project() returns under either churn model.
+    """
+    campaigns = projection_service.campaigns
+    if len(campaigns) == 0:
+        raise ValueError("Add at least one campaign to optimize")
+    if np.any(campaigns.budget <= 0):
+        raise ValueError("Every campaign needs a positive budget to price its reach")
+
+    baseline_revenue, revenue_response = projection_service.revenue_response(months)
+
+    evaluate = _Evaluator(
+        months=months,
+        objective=config.objective,
+        baseline_revenue=baseline_revenue,
+        revenue_response=revenue_response,
+        reach_per_dollar=campaigns.expected_reach / campaigns.budget,
+        conversion_rate=(campaigns.reach_to_download_rate * campaigns.download_to_active_rate *
+                         campaigns.active_to_subscriber_rate)
+    )
+
+    rng = np.random.default_rng(config.seed)
+    n_campaigns = len(campaigns)
+    n_elites = max(1, int(config.population * config.elite_fraction))
+    if config.workers is not None:
+        workers = config.workers
+    elif config.population >= OPTIMIZER_PARALLEL_MIN_POPULATION:
+        workers = os.cpu_count() or 1
+    else:
+        workers = 1
+    min_share = min(OPTIMIZER_MIN_BUDGET_SHARE, 0.5 / n_campaigns)
+
+    # Budget shares carry one extra slot for the unspent part of the budget
+    current_shares = np.append(campaigns.budget, max(0.0, config.total_budget - campaigns.budget.sum()))
+    current = (
+        campaigns.start_month[None].copy(),
+        campaigns.duration_months[None].copy(),
+        _floor_shares(current_shares[None] / current_shares.sum(), min_share)
+    )
+    random = (
+        rng.integers(CAMPAIGN_START_MONTH_MIN, CAMPAIGN_START_MONTH_MAX + 1, (config.population - 1, n_campaigns)),
+        rng.integers(CAMPAIGN_DURATION_MIN, CAMPAIGN_DURATION_MAX + 1, (config.population - 1, n_campaigns)),
+        _floor_shares(rng.dirichlet(np.ones(n_campaigns + 1), config.population - 1), min_share)
+    )
+    population = tuple(np.concatenate(pair) for pair in zip(current, random))
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        scores = _score(evaluate, population, config.total_budget, executor, workers)
+        baseline_value = float(scores[0])
+        evaluations = config.population
+        history = []
+        stale = 0
+
+        for _ in range(config.max_generations):
+            order = np.argsort(-scores, kind='stable')[:n_elites]
+            elites = tuple(values[order] for values in population)
+            elite_scores = scores[order]
+
+            best_value = float(elite_scores[0])
+            if history and best_value <= history[-1] + config.tolerance * abs(history[-1]):
+                stale += 1
+            else:
+                stale = 0
+            history.append(best_value)
+            if stale >= config.patience:
+                break
+
+            children = _mutate(rng, elites, config.population - n_elites, min_share)
+            child_scores = _score(evaluate, children, config.total_budget, executor, workers)
+            evaluations += config.population - n_elites
+
+            population = tuple(np.concatenate(pair) for pair in zip(elites, children))
+            scores = np.concatenate([elite_scores, child_scores])
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    best = int(np.argmax(scores))
+    return OptimizationResult(
+        objective=config.objective,
+        value=float(scores[best]),
+        baseline_value=baseline_value,
+        start_months=population[0][best],
+        duration_months=population[1][best],
+        budgets=population[2][best, :-1] * config.total_budget,
+        history=np.array(history),
+        evaluations=evaluations,
+        converged=stale >= config.patience
+    )
+
+
+def _score(evaluate: _Evaluator, population: tuple, total_budget: float,
+           executor: Optional[Executor], workers: int) -> np.ndarray:
+    """Score a population, splitting it into one batch per worker when a pool is available."""
+    start_months, duration_months, shares = population
+    budgets = shares[:, :-1] * total_budget
+    if executor is None:
+        return evaluate((start_months, duration_months, budgets))
+
+    batches = [
+        (start_months[rows], duration_months[rows], budgets[rows])
+        for rows in np.array_split(np.arange(start_months.shape[0]), workers)
+    ]
+    return np.concatenate(list(executor.map(evaluate, batches)))
+
+
+def _floor_shares(shares: np.ndarray, min_share: float) -> np.ndarray:
+    """
+    Raise every campaign's budget share to at least min_share.
+
+    The last column is the unspent budget and has no floor. The shortfall is
+    taken from the shares above their floor in proportion to their excess, so
+    shares that already meet the floor are returned unchanged.
+    """
+    floor = np.full(shares.shape[-1], min_share)
+    floor[-1] = 0.0
+    excess = np.maximum(shares, floor) - floor
+    return floor + excess * ((1 - floor.sum()) / excess.sum(axis=-1, keepdims=True))
+
+
+def _mutate(rng: np.random.Generator, parents: tuple, size: int, min_share: float) -> tuple:
+    """Children of randomly chosen parents with shifted timings and reweighted budget shares."""
+    start_months, duration_months, shares = parents
+    picks = rng.integers(0, start_months.shape[0], size)
+    start_months, duration_months, shares = start_months[picks], duration_months[picks], shares[picks]
+
+    shift = rng.integers(-2, 3, start_months.shape) * (rng.random(start_months.shape) < 0.3)
+    start_months = np.clip(start_months + shift, CAMPAIGN_START_MONTH_MIN, CAMPAIGN_START_MONTH_MAX)
+    shift = rng.integers(-2, 3, duration_months.shape) * (rng.random(duration_months.shape) < 0.3)
+    duration_months = np.clip(duration_months + shift, CAMPAIGN_DURATION_MIN, CAMPAIGN_DURATION_MAX)
+
+    shares = shares * rng.lognormal(0.0, 0.3, shares.shape)
+    return start_months, duration_months, _floor_shares(shares / shares.sum(axis=1, keepdims=True), min_share)
@@ -0,0 +1,362 @@
+from typing import TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    # Only the calendar helpers need pandas; it is imported when they run
+    import pandas as pd
+
+# Largest exponent allowed for a block's growth factors. exp(300) keeps both
+# the factors and their reciprocals far away from float64 overflow/underflow.
+_MAX_BLOCK_LOG_GROWTH = 300.0
+
+
+def compound_with_inflows(growth_rate, inflows, initial_users, period_fractions=None,
+                          dtype=float) -> np.ndarray:
+    """
+    Solve total[t] = (1 + growth_rate) * total[t - 1] + inflows[t] over whole arrays.
+
+    The recurrence is evaluated as cumulative growth factors with the inflows
+    folded in as a discounted cumulative sum. Long horizons are split into
+    blocks so the growth factors never overflow; each block is a handful of
+    array operations.
+
+    Args:
+        growth_rate: Net growth rate per period, scalar or shape (...,).
+        inflows: Users added each period, shape (..., periods).
+        initial_users: Users before the first period, scalar or shape (...,).
+        period_fractions: Optional length of each period in units of the rate's
+            period, shape (periods,); period t then grows by
+            (1 + growth_rate) ** period_fractions[t].
+        dtype: Storage dtype of the result. Blocks are computed in float64.
+
+    Returns:
+        Total users per period with the broadcast shape of the inputs.
+    """
+    inflows = np.asarray(inflows, dtype=float)
+    growth = 1.0 + np.asarray(growth_rate, dtype=float)[..., None]
+    carry = np.asarray(initial_users, dtype=float)[..., None]
+
+    if np.any(growth <= 0):
+        raise ValueError("Net growth rate must be greater than -100%")
+
+    periods = inflows.shape[-1]
+    shape = np.broadcast_shapes(growth.shape[:-1], carry.shape[:-1], inflows.shape[:-1]) + (periods,)
+    totals = np.empty(shape, dtype=dtype)
+    if periods == 0:
+        return totals
+
+    if period_fractions is None:
+        steps = np.arange(1, periods + 1, dtype=float)
+        longest_period = 1.0
+    else:
+        period_fractions = np.asarray(period_fractions, dtype=float)
+        steps = np.cumsum(period_fractions)
+        longest_period = float(np.max(period_fractions))
+
+    log_growth = np.log(growth)
+    max_log_growth = float(np.max(np.abs(log_growth))) * longest_period
+    if max_log_growth > 0:
+        block = int(max(1, min(periods, _MAX_BLOCK_LOG_GROWTH // max_log_growth)))
+    else:
+        block = periods
+
+    for start in range(0, periods, block):
+        stop = min(start + block, periods)
+        block_steps = steps[start:stop] - (steps[start - 1] if start else 0.0)
+        factors = np.exp(log_growth * block_steps)
+        discounted = np.cumsum(inflows[..., start:stop] / factors, axis=-1)
+        block_totals = factors * (carry + discounted)
+        totals[..., start:stop] = block_totals
+        carry = block_totals[..., -1:]
+
+    return totals
+
+
+def growth_rate_breakdown(base_users: np.ndarray, campaign_users: np.ndarray,
+                          total_users: np.ndarray, initial_users) -> tuple:
+    """
+    Split period-over-period growth into organic and campaign percentages.
+
+    Returns:
+        Tuple of (organic_growth_rate, campaign_growth_rate, growth_rate) in percent.
+    """
+    initial = np.asarray(initial_users, dtype=float)[..., None]
+    previous_total = np.concatenate(
+        [np.broadcast_to(initial, total_users.shape[:-1] + (1,)), total_users[..., :-1]],
+        axis=-1
+    )
+
+    organic_growth_rate = (base_users - previous_total) / previous_total * 100
+
+    new_campaign_users = np.diff(campaign_users, axis=-1, prepend=0.0)
+    campaign_growth_rate = np.where(
+        new_campaign_users > 0,
+        new_campaign_users / previous_total * 100,
+        0.0
+    )
+
+    return organic_growth_rate, campaign_growth_rate, organic_growth_rate + campaign_growth_rate
+
+
+def campaign_schedule(start_months, duration_months, periods: int) -> np.ndarray:
+    """
+    Cumulative share of each campaign's new users acquired by each period.
+
+    Each campaign's users arrive evenly over its duration; acquisition past the
+    horizon is dropped. Built from one difference array for all campaigns.
+
+    Returns:
+        Array of shape (campaigns, periods).
+    """
+    starts, stops, rates = _campaign_bounds(start_months, duration_months, periods)
+    rows = np.arange(starts.shape[0])
+
+    diff = np.zeros((starts.shape[0], periods + 1))
+    diff[rows, starts] += rates
+    diff[rows, stops] -= rates
+    return np.cumsum(np.cumsum(diff[:, :periods], axis=1, dtype=float), axis=1)
+
+
+def cumulative_campaign_users(start_months, duration_months, new_users, periods: int) -> np.ndarray:
+    """
+    Total cumulative campaign-driven users per period across all campaigns.
+
+    Every campaign's inflow lands in a single difference array, so the cost is
+    one pass over the campaigns plus two cumulative sums over the periods.
+    """
+    starts, stops, rates = _campaign_bounds(start_months, duration_months, periods)
+    monthly_users = np.asarray(new_users, dtype=float) * rates
+
+    diff = (np.bincount(starts, weights=monthly_users, minlength=periods + 1)
+            - np.bincount(stops, weights=monthly_users, minlength=periods + 1))
+    # bincount returns integers when there are no campaigns to weight
+    return np.cumsum(np.cumsum(diff[:periods], dtype=float))
+
+
+def _campaign_bounds(start_months, duration_months, periods: int) -> tuple:
+    """Zero-based [start, stop) indices clipped to the horizon and the per-period share."""
+    start_months = np.asarray(start_months, dtype=np.int64)
+    duration_months = np.asarray(duration_months, dtype=np.int64)
+
+    starts = np.clip(start_months - 1, 0, periods)
+    stops = np.clip(start_months - 1 + duration_months, 0, periods)
+    return starts, stops, 1.0 / duration_months
+
+
+def period_calendar(start_date, months: int, granularity: str) -> tuple:
+    """
+    Split a horizon of calendar months starting at start_date into periods.
+
+    Each day counts as 1 / (days in its projection month) of a month, so a
+    period's month fraction is the sum over its days and every projection
+    month adds up to exactly one month whatever the granularity.
+
+    Returns:
+        Tuple of (period start dates, zero-based projection month of each
+        period, month fraction of each period).
+    """
+    start, month_offsets = _month_offsets(start_date, months)
+    period_offsets = _period_offsets(month_offsets, granularity, 0, _period_count(month_offsets, granularity))
+    return _calendar_window(start, month_offsets, period_offsets, int(month_offsets[-1]))
+
+
+def iter_period_calendar(start_date, months: int, granularity: str, chunk_size: int):
+    """
+    Yield period_calendar's (dates, month index, month fractions) in chunks of chunk_size periods.
+
+    Only one chunk's days are materialized at a time, so memory is independent
+    of the horizon apart from one offset per month.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    start, month_offsets = _month_offsets(start_date, months)
+    days = int(month_offsets[-1])
+    periods = _period_count(month_offsets, granularity)
+    for first in range(0, periods, chunk_size):
+        last = min(first + chunk_size, periods)
+        period_offsets = _period_offsets(month_offsets, granularity, first, last + 1)
+        end = int(period_offsets[-1]) if last < periods else days
+        yield _calendar_window(start, month_offsets, period_offsets[:last - first], end)
+
+
+def _month_offsets(start_date, months: int) -> tuple:
+    """Normalized start date and the day offset of each month start, plus the horizon end."""
+    import pandas as pd
+
+    start = pd.Timestamp(start_date).normalize()
+    month_starts = pd.date_range(start, periods=months + 1, freq=pd.DateOffset(months=1))
+    return start, ((month_starts - start) // pd.Timedelta(days=1)).to_numpy()
+
+
+def _period_count(month_offsets: np.ndarray, granularity: str) -> int:
+    days = int(month_offsets[-1])
+    if granularity == "day":
+        return days
+    if granularity == "week":
+        return -(-days // 7)
+    if granularity == "month":
+        return len(month_offsets) - 1
+    raise ValueError(f"Unknown granularity '{granularity}'")
+
+
+def _period_offsets(month_offsets: np.ndarray, granularity: str, first: int, last: int) -> np.ndarray:
+    """Day offsets of periods first..last - 1, clipped to the periods that exist."""
+    last = min(last, _period_count(month_offsets, granularity))
+    if granularity == "day":
+        return np.arange(first, last)
+    if granularity == "week":
+        return np.arange(first, last) * 7
+    return month_offsets[first:last]
+
+
+def _calendar_window(start: "pd.Timestamp", month_offsets: np.ndarray, period_offsets: np.ndarray,
+                     end: int) -> tuple:
+    """Dates, month index and month fraction of consecutive periods whose last one ends at day `end`."""
+    month_lengths = np.diff(month_offsets)
+    days = np.arange(period_offsets[0], end)
+    day_month = np.searchsorted(month_offsets, days, side='right') - 1
+    day_fractions = 1.0 / month_lengths[day_month]
+
+    import pandas as pd
+
+    relative_offsets = period_offsets - period_offsets[0]
+    dates = start + pd.to_timedelta(period_offsets, unit="D")
+    return dates, day_month[relative_offsets], np.add.reduceat(day_fractions, relative_offsets)
+
+
+def periods_to_months(values: np.ndarray, month_index: np.ndarray, how: str = "last") -> np.ndarray:
+    """
+    Collapse (..., periods) values into (..., months) by projection month.
+
+    how='last' keeps each month's final period (stock values such as users),
+    how='sum' adds up its periods (flow values such as revenue).
+    """
+    boundaries = np.flatnonzero(np.diff(month_index, prepend=-1))
+    if how == "sum":
+        return np.add.reduceat(values, boundaries, axis=-1)
+    if how == "last":
+        return np.take(values, np.append(boundaries[1:], month_index.shape[0]) - 1, axis=-1)
+    raise ValueError("how must be 'last' or 'sum'")
+
+
+def period_campaign_users(monthly_campaign_users: np.ndarray, period_fractions: np.ndarray,
+                          elapsed_months: float = 0.0) -> tuple:
+    """
+    Campaign inflows and cumulative campaign users for sub-monthly periods.
+
+    Month m adds monthly_campaign_users[m] spread evenly over its days, so a
+    period's inflow is the share of each month it covers, including periods
+    that cross a month boundary. The reported cumulative users rise linearly
+    through each month to the monthly value, which never exceeds the inflows
+    already added, so base users stay non-negative while growth is.
+
+    Args:
+        monthly_campaign_users: Cumulative campaign users per month, shape (months,).
+        period_fractions: Length of each period in months, shape (periods,).
+        elapsed_months: Months elapsed before the first period, for later chunks.
+
+    Returns:
+        Tuple of (inflows, cumulative campaign users), each shape (periods,).
+    """
+    monthly_campaign_users = np.asarray(monthly_campaign_users, dtype=float)
+    bounds = elapsed_months + np.concatenate([[0.0], np.cumsum(period_fractions)])
+
+    # Integral of the monthly inflow step function from the start to each bound
+    month = np.clip(np.floor(bounds).astype(np.int64), 0, monthly_campaign_users.shape[0] - 1)
+    integrated = np.concatenate([[0.0], np.cumsum(monthly_campaign_users)])[month]
+    integrated += monthly_campaign_users[month] * (bounds - month)
+
+    cumulative = np.interp(
+        bounds[1:], np.arange(monthly_campaign_users.shape[0] + 1), np.concatenate([[0.0], monthly_campaign_users])
+    )
+    return np.diff(integrated), cumulative
+
+
+def batch_cumulative_campaign_users(start_months, duration_months, new_users, periods: int) -> np.ndarray:
+    """
+    Cumulative campaign-driven users for many campaign schedules at once.
+
+    Args:
+        start_months, duration_months, new_users: Shape (schedules, campaigns).
+        periods: Number of periods to project.
+
+    Returns:
+        Array of shape (schedules, periods).
+    """
+    starts, stops, rates = _campaign_bounds(start_months, duration_months, periods)
+    monthly_users = np.asarray(new_users, dtype=float) * rates
+    n_schedules = monthly_users.shape[0]
+
+    # Offset each schedule's difference array so one bincount fills them all
+    offsets = np.arange(n_schedules)[:, None] * (periods + 1)
+    size = n_schedules * (periods + 1)
+    diff = (np.bincount((starts + offsets).ravel(), weights=monthly_users.ravel(), minlength=size)
+            - np.bincount((stops + offsets).ravel(), weights=monthly_users.ravel(), minlength=size))
+    diff = diff.reshape(n_schedules, periods + 1)
+    return np.cumsum(np.cumsum(diff[:, :periods], axis=1, dtype=float), axis=1)
+
+
+def retention_convolve(acquisitions, survival, fft_min_periods: int = 128) -> np.ndarray:
+    """
+    Users still active from every earlier cohort: active[t] = sum_a acquisitions[t - a] * survival[a].
+
+    Short horizons multiply by the lower-triangular Toeplitz matrix of the
+    survival curve; from fft_min_periods on the convolution runs as a real FFT
+    in O(periods log periods).
+
+    Args:
+        acquisitions: Users acquired each period, shape (..., periods).
+        survival: Share of a cohort still active a periods after acquisition,
+            survival[..., 0] being the acquisition period, shape (..., periods).
+
+    Returns:
+        Active users with the broadcast shape of the inputs.
+    """
+    acquisitions = np.asarray(acquisitions, dtype=float)
+    survival = np.asarray(survival, dtype=float)
+    periods = acquisitions.shape[-1]
+
+    if periods < fft_min_periods:
+        ages = np.arange(periods)[:, None] - np.arange(periods)[None, :]
+        toeplitz = np.where(ages >= 0, survival[..., np.clip(ages, 0, None)], 0.0)
+        return np.einsum('...s,...ts->...t', acquisitions, toeplitz)
+
+    size = 1 << (2 * periods - 1).bit_length()
+    spectrum = np.fft.rfft(acquisitions, size) * np.fft.rfft(survival, size)
+    return np.fft.irfft(spectrum, size)[..., :periods]
+
+
+def renewal_acquisitions(growth_rates, inflows, survival, initial_active) -> np.ndarray:
+    """
+    Acquisitions when organic growth comes from the users still active.
+
+    Solves the renewal equation
+        acquisitions[t] = growth_rates[t] * active[t - 1] + inflows[t]
+        active[t] = sum_a acquisitions[t - a] * survival[a] + initial_active[t + 1]
+    one period at a time, since each period's acquisitions depend on every
+    earlier cohort. With survival (1 - c) ** a this is the flat churn model at
+    a net rate of growth - c.
+
+    Args:
+        growth_rates: Organic growth rate of each period, scalar or shape (periods,).
+        inflows: Campaign users added each period, shape (periods,).
+        survival: Blended survival curve, survival[0] being the acquisition
+            period, shape (periods,).
+        initial_active: Users of the initial cohort still active before the
+            first period and after each period, shape (periods + 1,).
+
+    Returns:
+        Users acquired each period, shape (periods,).
+    """
+    inflows = np.asarray(inflows, dtype=float)
+    periods = inflows.shape[0]
+    growth_rates = np.broadcast_to(np.asarray(growth_rates, dtype=float), (periods,))
+    initial_active = np.asarray(initial_active, dtype=float)
+    reversed_survival = np.ascontiguousarray(np.asarray(survival, dtype=float)[::-1])
+
+    acquisitions = np.empty(periods)
+    active = initial_active[0]
+    for t in range(periods):
+        acquisitions[t] = growth_rates[t] * active + inflows[t]
+        active = acquisitions[:t + 1] @ reversed_survival[periods - 1 - t:] + initial_active[t + 1]
+    return acquisitions
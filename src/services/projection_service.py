@@ -1,136 +1,688 @@
-import pandas as pd
-from typing import List, Dict, Optional
-from models.subscription import SubscriptionTier
+import hashlib
+import json
+from collections import Counter
+from dataclasses import dataclass
+import numpy as np
+from typing import TYPE_CHECKING, Any, Iterator, List, Dict, Optional, Sequence, Set
+from models.subscription import SubscriptionTier, PriceChange
 from models.campaign import MarketingCampaign
+from models.campaign_table import CampaignTable
+from models.projection_results import BatchProjectionResult, ProjectionResult
+from models.tier_matrix import TierMatrix
+from models.retention import RetentionCurve
+from models.simulation import SimulationConfig
+from services.projection_kernel import (
+    compound_with_inflows,
+    growth_rate_breakdown,
+    campaign_schedule,
+    cumulative_campaign_users,
+    period_calendar,
+    iter_period_calendar,
+    periods_to_months,
+    period_campaign_users,
+    retention_convolve,
+    renewal_acquisitions
+)
 from config.constants import (
+    SUBSCRIPTION_TIERS,
     GROWTH_SCENARIOS,
     DEFAULT_CHURN_RATE,
     DEFAULT_INITIAL_USERS,
-    MAX_PROJECTION_MONTHS
+    MAX_PROJECTION_MONTHS,
+    PROJECTION_GRANULARITIES,
+    PROJECTION_DTYPES,
+    PROJECTION_STREAM_CHUNK_SIZE,
+    CHURN_MODELS,
+    COHORT_RETENTION_DEFAULTS,
+    COHORT_FFT_MIN_PERIODS,
+    PROJECTION_FIELDS
 )
 
+if TYPE_CHECKING:
+    # Array-only callers (project, the batch engine) never import pandas
+    import pandas as pd
+
+@dataclass
+class _ProjectionState:
+    """User series from the last calculation and the inputs they were computed from."""
+    months: int
+    net_growth_rate: float
+    campaign_keys: Counter
+    campaign_users: np.ndarray
+    total_users: np.ndarray
+
+
 class ProjectionService:
     def __init__(self):
         self.subscriptions: List[SubscriptionTier] = []
-        self.campaigns: List[MarketingCampaign] = []
+        self.campaigns: CampaignTable = CampaignTable()
         self.growth_scenario: str = "Moderate (8% monthly)"
         self.custom_growth_rate: Optional[float] = None
         self.enable_churn: bool = False
         self.churn_rate: float = 0.0
+        self.churn_model: str = "flat"  # "cohort" applies each tier's retention curve instead of churn_rate
+        self.simulation_config: Optional[SimulationConfig] = None
+        self.saved_scenarios: Dict[str, float] = {}  # Named custom growth rates (decimals) for comparisons
+        self.recomputed_from_month: Optional[int] = None  # First month recomputed by the last call
+        self._state: Optional[_ProjectionState] = None
+        self.version: int = 0  # Bumped whenever a projection input changes
+        self.field_versions: Counter = Counter()  # Change count per field, for panels that read a subset
+        self.dirty_fields: Set[str] = set(PROJECTION_FIELDS)
+    
+    @property
+    def campaigns(self) -> CampaignTable:
+        return self._campaigns
+    
+    @campaigns.setter
+    def campaigns(self, campaigns) -> None:
+        """Accept a CampaignTable or any sequence of MarketingCampaign objects."""
+        self._campaigns = CampaignTable.coerce(campaigns)
+    
+    @property
+    def growth_rate(self) -> float:
+        """Gross monthly growth rate of the selected scenario, as a decimal."""
+        return self._get_growth_rate()
+    
+    @property
+    def net_growth_rate(self) -> float:
+        """Growth net of flat churn; the cohort model churns through retention curves instead."""
+        growth_rate = self._get_growth_rate()
+        if self.enable_churn and self.churn_model == "flat":
+            return growth_rate - self.churn_rate
+        return growth_rate
+    
+    @property
+    def is_dirty(self) -> bool:
+        """Whether any projection input changed since the last clear_dirty()."""
+        return bool(self.dirty_fields & PROJECTION_FIELDS)
+    
+    def update(self, **fields: Any) -> None:
+        """Set fields, marking only those whose value actually changed as dirty."""
+        for name, value in fields.items():
+            if not hasattr(self, name):
+                raise AttributeError(f"ProjectionService has no field '{name}'")
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                self._mark_dirty(name)
+    
+    def set_tier(self, name: str, monthly_price: float, distribution_percentage: float,
+                 features: List[str], price_schedule: Optional[List[PriceChange]] = None) -> None:
+        """
+        Add or update a tier, building a new SubscriptionTier only when it changed.
+        
+        A price_schedule of None keeps the tier's existing price changes.
+        """
+        index = next((idx for idx, tier in enumerate(self.subscriptions) if tier.name == name), None)
+        if index is not None:
+            tier = self.subscriptions[index]
+            if price_schedule is None:
+                price_schedule = tier.price_schedule
+            if (tier.monthly_price == monthly_price and
+                    tier.distribution_percentage == distribution_percentage and
+                    tier.features == features and
+                    tier.price_schedule == price_schedule):
+                return
+        
+        tier = SubscriptionTier(
+            name=name,
+            monthly_price=monthly_price,
+            features=features,
+            distribution_percentage=distribution_percentage,
+            price_schedule=price_schedule or [],
+            retention=self.subscriptions[index].retention if index is not None else None
+        )
+        if index is None:
+            self.subscriptions.append(tier)
+        else:
+            self.subscriptions[index] = tier
+        self._mark_dirty('subscriptions')
+    
+    def save_scenario(self, name: str, growth_rate: float) -> None:
+        """Save a named growth rate (decimal) to compare alongside the GROWTH_SCENARIOS presets."""
+        name = name.strip()
+        if not name:
+            raise ValueError("Scenario name must not be empty")
+        if name in GROWTH_SCENARIOS:
+            raise ValueError(f"'{name}' is a preset scenario")
+        self.update(saved_scenarios={**self.saved_scenarios, name: growth_rate})
+    
+    def add_campaign(self, campaign: MarketingCampaign) -> None:
+        self.campaigns.append(campaign)
+        self._mark_dirty('campaigns')
+    
+    def remove_campaign(self, campaign: MarketingCampaign) -> None:
+        self.campaigns.remove(campaign)
+        self._mark_dirty('campaigns')
+    
+    def clear_dirty(self) -> Set[str]:
+        """Return the fields changed since the last call and reset tracking."""
+        dirty, self.dirty_fields = self.dirty_fields, set()
+        return dirty
+    
+    def dependency_version(self, fields) -> tuple:
+        """Change counts of the given fields; an unchanged value means none of them changed."""
+        return tuple(self.field_versions[field] for field in sorted(fields))
+    
+    def _mark_dirty(self, field: str) -> None:
+        self.dirty_fields.add(field)
+        self.field_versions[field] += 1
+        if field in PROJECTION_FIELDS:
+            self.version += 1
     
-    def calculate_projections(self, months: int = 12) -> pd.DataFrame:
+    def calculate_projections(self, months: int = 12) -> "pd.DataFrame":
         """Calculate monthly revenue and user projections including campaign impacts."""
+        return self.project(months).to_pandas()
+    
+    def project(self, months: int = 12) -> ProjectionResult:
+        """
+        Monthly projection as NumPy arrays with its tier and campaign metadata.
+        
+        The same numbers as calculate_projections without building a DataFrame,
+        for callers that only read a few series or aggregates.
+        """
         self._validate_inputs(months)
         
-        # Initialize DataFrame
-        df = pd.DataFrame({
-            'month': range(1, months + 1),
-            'base_users': 0.0,
-            'campaign_users': 0.0,
-            'total_users': 0.0,
-            'organic_growth_rate': 0.0,
-            'campaign_growth_rate': 0.0,
-            'growth_rate': 0.0,
-            'total_revenue': 0.0
-        })
-        
-        # Get growth rate
-        growth_rate = self._get_growth_rate()
-        if self.enable_churn:
-            net_growth_rate = growth_rate - self.churn_rate
+        # Calculate campaign impacts and users, reusing months the last change cannot affect
+        campaign_users, total_users = self._project_users(months, self.net_growth_rate)
+        tiers = TierMatrix.from_tiers(self.subscriptions, months)
+        
+        # Cohort churn: every month's acquisitions decay along their tier's retention curve
+        if self._is_cohort():
+            tier_users, total_users, campaign_users = self._retained_users(campaign_users, np.arange(months + 1))
+            tiers = tiers.with_users(tier_users, total_users)
+        
+        base_users = total_users - campaign_users
+        organic_growth_rate, campaign_growth_rate, total_growth_rate = growth_rate_breakdown(
+            base_users, campaign_users, total_users, DEFAULT_INITIAL_USERS
+        )
+        
+        # Revenue from the blended (distribution x price schedule) revenue per user
+        revenue_per_user = tiers.revenue_per_user
+        
+        return ProjectionResult(
+            month=np.arange(1, months + 1),
+            base_users=base_users,
+            campaign_users=campaign_users,
+            total_users=total_users,
+            organic_growth_rate=organic_growth_rate,
+            campaign_growth_rate=campaign_growth_rate,
+            growth_rate=total_growth_rate,
+            total_revenue=total_users * revenue_per_user,
+            tiers=tiers,
+            campaign_names=tuple(self.campaigns.name)
+        )
+    
+    def calculate_period_projections(
+        self,
+        months: int = 12,
+        granularity: str = "day",
+        start_date=None,
+        dtype: str = "float64"
+    ) -> "pd.DataFrame":
+        """
+        Project users and revenue in day, week or month steps indexed by real dates.
+        
+        The horizon covers `months` calendar months from start_date (default: the
+        first of the current month); campaign start months count from there. A
+        period spanning a fraction f of a month grows by (1 + rate) ** f, gets
+        the campaign inflow of the days it covers and earns f of a month's
+        revenue at its own users, so 'month' granularity matches
+        calculate_projections exactly. Finer periods do not: rolled up with
+        resample_monthly, a month's revenue is its average users rather than its
+        closing users times the revenue per user, and campaign users compound
+        from the day they arrive instead of from the month end. Daily users at
+        each month end match the monthly model only without campaigns or at
+        zero net growth. campaign_users rises through each month to the monthly
+        value, so base_users stays non-negative. dtype='float32' halves the
+        memory of long runs. With the cohort churn model, retention curves are
+        sampled at each period's age in months.
+        """
+        import pandas as pd
+        
+        self._validate_period_inputs(months, granularity, dtype)
+        if start_date is None:
+            start_date = pd.Timestamp.today().to_period('M').to_timestamp()
+        dates, month_index, period_fractions = period_calendar(start_date, months, granularity)
+        
+        monthly_campaign_users = self._campaign_users(months)
+        campaign_inflows, campaign_users = period_campaign_users(monthly_campaign_users, period_fractions)
+        prices = TierMatrix.from_tiers(self.subscriptions, months).prices[:, month_index]
+        
+        if self._is_cohort():
+            ages = np.arange(len(dates) + 1) * period_fractions.mean()
+            tier_users, total_users, campaign_users = self._retained_users(campaign_inflows, ages, period_fractions)
+            total_revenue = np.einsum('tp,tp->p', tier_users, prices) * period_fractions
         else:
-            net_growth_rate = growth_rate
-        
-        # Initialize first month's base users with growth
-        df.loc[0, 'base_users'] = DEFAULT_INITIAL_USERS * (1 + net_growth_rate)
-        
-        # Calculate first month's organic growth rate based on DEFAULT_INITIAL_USERS
-        df.loc[0, 'organic_growth_rate'] = ((df.loc[0, 'base_users'] - DEFAULT_INITIAL_USERS) / DEFAULT_INITIAL_USERS) * 100
-        
-        # Calculate campaign impacts
-        self._add_campaign_impacts(df)
-        
-        # Calculate total users for first month
-        df.loc[0, 'total_users'] = df.loc[0, 'base_users'] + df.loc[0, 'campaign_users']
-        
-        # Calculate first month's campaign growth rate if there are campaign users
-        if df.loc[0, 'campaign_users'] > 0:
-            df.loc[0, 'campaign_growth_rate'] = (df.loc[0, 'campaign_users'] / DEFAULT_INITIAL_USERS) * 100
-        
-        # Calculate first month's total growth rate
-        df.loc[0, 'growth_rate'] = df.loc[0, 'organic_growth_rate'] + df.loc[0, 'campaign_growth_rate']
-        
-        # Calculate subsequent months
-        for month in range(1, months):
-            prev_total_users = df.loc[month-1, 'total_users']
-            
-            # Calculate new organic users based on previous month's total users
-            new_organic_users = prev_total_users * net_growth_rate
-            df.loc[month, 'base_users'] = prev_total_users + new_organic_users
-            
-            # Calculate total users for current month
-            df.loc[month, 'total_users'] = df.loc[month, 'base_users'] + df.loc[month, 'campaign_users']
-            
-            # Calculate growth rates
-            df.loc[month, 'organic_growth_rate'] = (new_organic_users / prev_total_users) * 100
-            
-            if df.loc[month, 'campaign_users'] > df.loc[month-1, 'campaign_users']:
-                new_campaign_users = df.loc[month, 'campaign_users'] - df.loc[month-1, 'campaign_users']
-                df.loc[month, 'campaign_growth_rate'] = (new_campaign_users / prev_total_users) * 100
-            
-            # Total growth rate is sum of organic and campaign growth
-            df.loc[month, 'growth_rate'] = df.loc[month, 'organic_growth_rate'] + df.loc[month, 'campaign_growth_rate']
-        
-        # Calculate subscription metrics
-        for tier in self.subscriptions:
-            df[f'users_{tier.name.lower()}'] = df['total_users'] * tier.distribution_percentage
-            df[f'revenue_{tier.name.lower()}'] = df[f'users_{tier.name.lower()}'] * tier.monthly_price
-        
-        df['total_revenue'] = sum(df[f'revenue_{tier.name.lower()}'] for tier in self.subscriptions)
-        
-        return df
+            total_users = compound_with_inflows(
+                self.net_growth_rate, campaign_inflows, DEFAULT_INITIAL_USERS,
+                period_fractions=period_fractions, dtype=dtype
+            )
+            distribution = np.array([tier.distribution_percentage for tier in self.subscriptions])
+            total_users = total_users.astype(dtype)
+            total_revenue = total_users * (distribution @ prices * period_fractions)
+        
+        return pd.DataFrame({
+            'month': (month_index + 1).astype(np.int32),
+            'base_users': (total_users - campaign_users).astype(dtype),
+            'campaign_users': campaign_users.astype(dtype),
+            'total_users': total_users.astype(dtype),
+            'total_revenue': total_revenue.astype(dtype)
+        }, index=pd.DatetimeIndex(dates, name='date'))
+    
+    def iter_projections(
+        self,
+        months: int = 12,
+        granularity: str = "day",
+        start_date=None,
+        chunk_size: int = PROJECTION_STREAM_CHUNK_SIZE,
+        dtype: str = "float64"
+    ) -> Iterator["pd.DataFrame"]:
+        """
+        Yield calculate_period_projections in chunks of at most chunk_size periods.
+        
+        Each chunk is computed only when requested, starting from the last
+        chunk's users, so memory stays at one chunk plus a few values per month
+        whatever the horizon, and closing the generator stops the computation.
+        Concatenated chunks match calculate_period_projections. The cohort churn
+        model needs every earlier cohort, so it computes the whole horizon up
+        front and only streams the output.
+        """
+        import pandas as pd
+        
+        self._validate_period_inputs(months, granularity, dtype)
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        if start_date is None:
+            start_date = pd.Timestamp.today().to_period('M').to_timestamp()
+        
+        if self._is_cohort():
+            projections = self.calculate_period_projections(months, granularity, start_date, dtype)
+            for start in range(0, len(projections), chunk_size):
+                yield projections.iloc[start:start + chunk_size]
+            return
+        
+        net_growth_rate = self.net_growth_rate
+        monthly_campaign_users = self._campaign_users(months)
+        distribution = np.array([tier.distribution_percentage for tier in self.subscriptions])
+        revenue_per_user = distribution @ TierMatrix.from_tiers(self.subscriptions, months).prices
+        
+        total_users = float(DEFAULT_INITIAL_USERS)
+        elapsed_months = 0.0
+        for dates, month_index, period_fractions in iter_period_calendar(start_date, months, granularity, chunk_size):
+            campaign_inflows, campaign_users = period_campaign_users(
+                monthly_campaign_users, period_fractions, elapsed_months
+            )
+            chunk_users = compound_with_inflows(
+                net_growth_rate, campaign_inflows, total_users, period_fractions=period_fractions
+            )
+            total_users = chunk_users[-1]
+            elapsed_months += float(period_fractions.sum())
+            yield pd.DataFrame({
+                'month': (month_index + 1).astype(np.int32),
+                'base_users': (chunk_users - campaign_users).astype(dtype),
+                'campaign_users': campaign_users.astype(dtype),
+                'total_users': chunk_users.astype(dtype),
+                'total_revenue': (chunk_users * revenue_per_user[month_index] * period_fractions).astype(dtype)
+            }, index=pd.DatetimeIndex(dates, name='date'))
+    
+    @staticmethod
+    def resample_monthly(period_projections: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        Collapse calculate_period_projections output to one row per projection month.
+        
+        User columns keep each month's last period and revenue is summed, indexed
+        by the date the month starts. Weekly periods count toward the month they
+        start in.
+        """
+        import pandas as pd
+        
+        month_index = period_projections['month'].to_numpy()
+        boundaries = np.flatnonzero(np.diff(month_index, prepend=-1))
+        columns = {'month': month_index[boundaries]}
+        for column in ('base_users', 'campaign_users', 'total_users'):
+            columns[column] = periods_to_months(period_projections[column].to_numpy(), month_index, 'last')
+        columns['total_revenue'] = periods_to_months(
+            period_projections['total_revenue'].to_numpy(), month_index, 'sum'
+        )
+        month_starts = pd.date_range(
+            period_projections.index[0], periods=len(boundaries), freq=pd.DateOffset(months=1), name='date'
+        )
+        return pd.DataFrame(columns, index=month_starts)
+    
+    def calculate_tier_projections(self, projections: "pd.DataFrame") -> "pd.DataFrame":
+        """Per-tier price, users and revenue for calculate_projections output, indexed by (month, tier)."""
+        total_users = projections['total_users'].to_numpy()
+        return self.tier_matrix(len(total_users)).to_frame(total_users)
+    
+    def tier_matrix(self, months: int = 12) -> TierMatrix:
+        """Tier prices and user shares; with cohort churn the shares follow each tier's retention."""
+        tiers = TierMatrix.from_tiers(self.subscriptions, months)
+        if self._is_cohort():
+            tier_users, total_users, _ = self._retained_users(self._campaign_users(months), np.arange(months + 1))
+            tiers = tiers.with_users(tier_users, total_users)
+        return tiers
+    
+    def revenue_response(self, months: int = 12) -> tuple:
+        """
+        Revenue without campaigns and its response to cumulative campaign users.
+        
+        Both churn models are linear in the cumulative campaign users C, and a
+        campaign user counted in month s adds the same users t - s months later
+        whenever s falls, so the revenue project() returns for any campaign
+        schedule is baseline + C @ response. Callers scoring many schedules,
+        like the optimizer, evaluate them all with one matrix product.
+        
+        Returns:
+            Tuple of (baseline revenue (months,), response (months, months)),
+            where response[s, t] is the month t revenue per campaign user
+            counted in month s.
+        """
+        self._validate_inputs(months)
+        tiers = TierMatrix.from_tiers(self.subscriptions, months)
+        impulse = np.zeros(months)
+        impulse[0] = 1.0
+        
+        if self._is_cohort():
+            ages = np.arange(months + 1)
+            baseline_users, _, _ = self._retained_users(np.zeros(months), ages)
+            impulse_users = self._retained_users(impulse, ages)[0] - baseline_users
+            baseline = (baseline_users * tiers.prices).sum(axis=0)
+            weighted_prices = tiers.prices
+        else:
+            baseline_users = compound_with_inflows(self.net_growth_rate, np.zeros(months), DEFAULT_INITIAL_USERS)
+            impulse_users = compound_with_inflows(self.net_growth_rate, impulse, 0.0)[None]
+            baseline = baseline_users * tiers.revenue_per_user
+            weighted_prices = tiers.revenue_per_user[None]
+        
+        # Users t - s months after the impulse, priced at month t
+        lags = np.arange(months)[None, :] - np.arange(months)[:, None]
+        lagged_users = impulse_users[:, np.maximum(lags, 0)]
+        response = np.where(lags >= 0, (lagged_users * weighted_prices[:, None, :]).sum(axis=0), 0.0)
+        return baseline, response
+    
+    def calculate_projections_batch(
+        self,
+        months: int = 12,
+        growth_rates: Optional[Sequence[float]] = None,
+        churn_rates: Optional[Sequence[float]] = None,
+        tier_prices: Optional[Sequence] = None,
+        tier_distributions: Optional[Sequence] = None,
+        campaign_users: Optional[Sequence] = None
+    ) -> BatchProjectionResult:
+        """
+        Calculate projections for N scenarios in one broadcast operation.
+        
+        Every argument is columnar: scalars or 1-D arrays of length N for the rates
+        (decimals; churn is always the flat model), (tiers,) or (N, tiers) arrays for
+        distributions and prices in the
+        order of self.subscriptions, where prices may also be (N, tiers, months)
+        schedules, and (months,) or (N, months) cumulative campaign users. Arguments
+        left as None take the service's current configuration.
+        """
+        self._validate_inputs(months)
+        n_tiers = len(self.subscriptions)
+        
+        if growth_rates is None:
+            growth_rates = self._get_growth_rate()
+        if churn_rates is None:
+            churn_rates = self.churn_rate if self.enable_churn else 0.0
+        if tier_prices is None:
+            tier_prices = TierMatrix.from_tiers(self.subscriptions, months).prices[None]
+        if tier_distributions is None:
+            tier_distributions = [tier.distribution_percentage for tier in self.subscriptions]
+        if campaign_users is None:
+            campaign_users = self._campaign_users(months)
+        
+        growth_rates = np.atleast_1d(np.asarray(growth_rates, dtype=float))
+        churn_rates = np.atleast_1d(np.asarray(churn_rates, dtype=float))
+        tier_prices = np.asarray(tier_prices, dtype=float)
+        if tier_prices.ndim < 3:
+            tier_prices = np.atleast_2d(tier_prices)[:, :, None]
+        tier_distributions = np.atleast_2d(np.asarray(tier_distributions, dtype=float))
+        campaign_users = np.atleast_2d(np.asarray(campaign_users, dtype=float))
+        
+        if tier_prices.shape[1] != n_tiers or tier_distributions.shape[-1] != n_tiers:
+            raise ValueError(f"Tier prices and distributions must have {n_tiers} columns")
+        if tier_prices.shape[2] not in (1, months):
+            raise ValueError(f"Tier price schedules must have {months} months")
+        if campaign_users.shape[-1] != months:
+            raise ValueError(f"Campaign users must have {months} columns")
+        
+        try:
+            n_scenarios = np.broadcast_shapes(
+                growth_rates.shape, churn_rates.shape, tier_prices.shape[:1],
+                tier_distributions.shape[:1], campaign_users.shape[:1]
+            )[0]
+        except ValueError:
+            raise ValueError("All batched parameters must have the same number of scenarios")
+        
+        growth_rates = np.broadcast_to(growth_rates, (n_scenarios,))
+        churn_rates = np.broadcast_to(churn_rates, (n_scenarios,))
+        tier_prices = np.broadcast_to(tier_prices, (n_scenarios, n_tiers, months))
+        tier_distributions = np.broadcast_to(tier_distributions, (n_scenarios, n_tiers))
+        campaign_users = np.broadcast_to(campaign_users, (n_scenarios, months))
+        
+        total_users = compound_with_inflows(growth_rates - churn_rates, campaign_users, DEFAULT_INITIAL_USERS)
+        revenue_per_user = np.einsum('nt,ntm->nm', tier_distributions, tier_prices)
+        
+        return BatchProjectionResult(
+            months=np.arange(1, months + 1),
+            tier_names=tuple(tier.name for tier in self.subscriptions),
+            growth_rates=growth_rates,
+            churn_rates=churn_rates,
+            tier_prices=tier_prices,
+            tier_distributions=tier_distributions,
+            base_users=total_users - campaign_users,
+            campaign_users=campaign_users,
+            total_users=total_users,
+            total_revenue=total_users * revenue_per_user,
+            initial_users=float(DEFAULT_INITIAL_USERS)
+        )
+    
+    def to_config(self) -> Dict[str, Any]:
+        """Return the full model configuration as plain, JSON-serializable data."""
+        return {
+            'subscriptions': [tier.model_dump() for tier in self.subscriptions],
+            'campaigns': self.campaigns.to_records(),
+            'growth_scenario': self.growth_scenario,
+            'custom_growth_rate': self.custom_growth_rate,
+            'enable_churn': self.enable_churn,
+            'churn_rate': self.churn_rate,
+            'churn_model': self.churn_model
+        }
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ProjectionService":
+        """
+        Build a service from to_config()-style data.
+        
+        Missing subscriptions fall back to the SUBSCRIPTION_TIERS defaults; other
+        missing fields keep the service defaults.
+        """
+        service = cls()
+        subscriptions = config.get('subscriptions')
+        if subscriptions is None:
+            subscriptions = [
+                {
+                    'name': name,
+                    'monthly_price': tier['price'],
+                    'features': tier['features'],
+                    'distribution_percentage': tier['default_distribution']
+                }
+                for name, tier in SUBSCRIPTION_TIERS.items()
+            ]
+        service.subscriptions = [SubscriptionTier(**tier) for tier in subscriptions]
+        service.campaigns = CampaignTable.from_records(config.get('campaigns', []))
+        
+        for field in ('growth_scenario', 'custom_growth_rate', 'enable_churn', 'churn_rate', 'churn_model'):
+            if field in config:
+                setattr(service, field, config[field])
+        
+        if service.growth_scenario == "Custom":
+            if service.custom_growth_rate is None:
+                raise ValueError("The Custom growth scenario requires a custom_growth_rate")
+        elif service.growth_scenario not in GROWTH_SCENARIOS:
+            raise ValueError(f"Unknown growth scenario '{service.growth_scenario}'")
+        if service.churn_model not in CHURN_MODELS:
+            raise ValueError(f"Churn model must be one of {', '.join(CHURN_MODELS)}")
+        return service
+    
+    def config_hash(self, months: int = 12) -> str:
+        """Stable hash of the configuration and horizon, used as a result cache key."""
+        payload = json.dumps(
+            {'config': self.to_config(), 'months': months},
+            sort_keys=True,
+            separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
     
     def _validate_inputs(self, months: int) -> None:
         """Validate input parameters."""
+        if months < 1:
+            raise ValueError("Projection months must be at least 1")
+        
         if months > MAX_PROJECTION_MONTHS:
             raise ValueError(f"Projection months cannot exceed {MAX_PROJECTION_MONTHS}")
         
         if not self.subscriptions:
             raise ValueError("At least one subscription tier must be configured")
     
+    def _validate_period_inputs(self, months: int, granularity: str, dtype: str) -> None:
+        if granularity not in PROJECTION_GRANULARITIES:
+            raise ValueError(f"Granularity must be one of {', '.join(PROJECTION_GRANULARITIES)}")
+        if dtype not in PROJECTION_DTYPES:
+            raise ValueError(f"dtype must be one of {', '.join(PROJECTION_DTYPES)}")
+        self._validate_inputs(months)
+    
     def _get_growth_rate(self) -> float:
         """Determine the appropriate growth rate based on scenario."""
         if self.growth_scenario == "Custom" and self.custom_growth_rate is not None:
             return self.custom_growth_rate / 100  # Convert percentage to decimal
         return GROWTH_SCENARIOS[self.growth_scenario]
     
-    def _add_campaign_impacts(self, df: pd.DataFrame) -> None:
+    def _is_cohort(self) -> bool:
+        return self.enable_churn and self.churn_model == "cohort"
+    
+    def retention_curve(self, tier: SubscriptionTier) -> RetentionCurve:
+        """The tier's own retention curve, or the COHORT_RETENTION_DEFAULTS for its name."""
+        if tier.retention is not None:
+            return tier.retention
+        return RetentionCurve(**COHORT_RETENTION_DEFAULTS.get(tier.name, {}))
+    
+    def _retained_users(self, campaign_inflows: np.ndarray, ages_in_months: np.ndarray,
+                        period_fractions: Optional[np.ndarray] = None) -> tuple:
         """
-        Add campaign impacts to the projection with proper growth handling:
+        Apply each tier's retention curve to every period's acquisitions.
+        
+        Organic acquisitions grow from the users still active, so churned users
+        stop contributing growth; a constant retention curve reduces to the flat
+        churn model. The initial users form one cohort acquired just before the
+        first period. ages_in_months holds the age of each lag 0..periods, and
+        period_fractions the length of each period in months (default: 1).
+        
+        Returns:
+            Tuple of (users per tier (tiers, periods), total users, retained
+            campaign users), where total users weight tiers by their share of
+            the distribution.
+        """
+        survival = np.stack([
+            self.retention_curve(tier).survival_at(ages_in_months) for tier in self.subscriptions
+        ])
+        distribution = np.array([[tier.distribution_percentage] for tier in self.subscriptions])
+        if distribution.sum() > 0:
+            weights = distribution / distribution.sum()
+        else:
+            weights = np.full_like(distribution, 1 / len(distribution))
+        
+        growth_rate = self.net_growth_rate
+        if period_fractions is None:
+            growth_rates = growth_rate
+        else:
+            growth_rates = (1 + growth_rate) ** period_fractions - 1
+        blended_survival = (weights * survival).sum(axis=0)
+        acquisitions = renewal_acquisitions(
+            growth_rates, campaign_inflows, blended_survival[:-1], DEFAULT_INITIAL_USERS * blended_survival
+        )
+        retained = (retention_convolve(acquisitions, survival[:, :-1], COHORT_FFT_MIN_PERIODS)
+                    + DEFAULT_INITIAL_USERS * survival[:, 1:])
+        retained_campaign = retention_convolve(campaign_inflows, survival[:, :-1], COHORT_FFT_MIN_PERIODS)
+        # The FFT path leaves round-off around zero before the first campaign
+        retained_campaign = np.maximum(retained_campaign, 0.0)
+        return distribution * retained, (weights * retained).sum(axis=0), (weights * retained_campaign).sum(axis=0)
+    
+    def _project_users(self, months: int, net_growth_rate: float) -> tuple:
+        """
+        Return cumulative campaign users and total users for each month.
+        
+        Only the suffix from the dependency frontier is recomputed; earlier months
+        are copied from the previous calculation.
+        """
+        campaign_keys = Counter(self._campaign_keys())
+        state = self._state
+        frontier = self._dependency_frontier(months, net_growth_rate, campaign_keys)
+        
+        if frontier >= months:
+            self.recomputed_from_month = None
+            return state.campaign_users[:months], state.total_users[:months]
+        
+        if state is None or campaign_keys != state.campaign_keys or months != state.months:
+            campaign_users = self._campaign_users(months)
+        else:
+            campaign_users = state.campaign_users
+        
+        # Each month grows the previous total and adds the cumulative campaign users
+        total_users = np.empty(months)
+        if frontier > 0:
+            total_users[:frontier] = state.total_users[:frontier]
+            initial_users = total_users[frontier - 1]
+        else:
+            initial_users = DEFAULT_INITIAL_USERS
+        total_users[frontier:] = compound_with_inflows(
+            net_growth_rate, campaign_users[frontier:], initial_users
+        )
+        
+        self.recomputed_from_month = frontier + 1
+        self._state = _ProjectionState(
+            months=months,
+            net_growth_rate=net_growth_rate,
+            campaign_keys=campaign_keys,
+            campaign_users=campaign_users,
+            total_users=total_users
+        )
+        return campaign_users, total_users
+    
+    def _dependency_frontier(self, months: int, net_growth_rate: float, campaign_keys: Counter) -> int:
+        """Earliest zero-based month whose users can differ from the last calculation."""
+        state = self._state
+        if state is None or net_growth_rate != state.net_growth_rate:
+            return 0
+        
+        # A campaign only affects months from its start onwards
+        changed = (campaign_keys - state.campaign_keys) + (state.campaign_keys - campaign_keys)
+        frontier = min((start_month - 1 for start_month, _, _ in changed), default=months)
+        return min(frontier, state.months, months)
+    
+    def _campaign_keys(self) -> List[tuple]:
+        """The inputs of each campaign that influence the projection."""
+        start_months, duration_months, new_users = self._campaign_arrays()
+        return list(zip(start_months.tolist(), duration_months.tolist(), new_users.tolist()))
+    
+    def campaign_contributions(self, months: int) -> np.ndarray:
+        """Cumulative users contributed by each campaign, shape (campaigns, months)."""
+        start_months, duration_months, new_users = self._campaign_arrays()
+        return campaign_schedule(start_months, duration_months, months) * new_users[:, None]
+    
+    def _campaign_users(self, months: int) -> np.ndarray:
+        """
+        Cumulative campaign-driven users for each month:
         1. Campaign users are added gradually during campaign
         2. Existing users from campaign remain after campaign ends
         3. Growth rate is applied to total user base
         """
-        cumulative_campaign_users = pd.Series(0.0, index=df.index)
-        
-        for campaign in self.campaigns:
-            # Calculate total new users from this campaign
-            new_users = float(campaign.expected_reach * 
-                             campaign.reach_to_download_rate * 
-                             campaign.download_to_active_rate * 
-                             campaign.active_to_subscriber_rate)
-            
-            # Calculate monthly user acquisition during campaign
-            monthly_users = new_users / campaign.duration_months
-            
-            # Add users during campaign months
-            campaign_period = range(
-                campaign.start_month - 1,
-                min(campaign.start_month - 1 + campaign.duration_months, len(df))
-            )
-            
-            # Accumulate users during campaign
-            for month in campaign_period:
-                cumulative_campaign_users.iloc[month:] += monthly_users
-        
-        df['campaign_users'] = cumulative_campaign_users
\ No newline at end of file
+        start_months, duration_months, new_users = self._campaign_arrays()
+        return cumulative_campaign_users(start_months, duration_months, new_users, months)
+    
+    def _campaign_arrays(self) -> tuple:
+        """Start months, durations and total new users of every campaign as arrays."""
+        campaigns = self.campaigns
+        return campaigns.start_month, campaigns.duration_months, campaigns.new_users
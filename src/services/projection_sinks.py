@@ -0,0 +1,97 @@
+"""
+Consumers for ProjectionService.iter_projections chunks.
+
+Each sink writes chunks as they arrive, so a stream of any length is written
+with one chunk in memory. Text sinks take a path or an open text stream, such
+as a file or socket.makefile("w"); streams are flushed but left open.
+"""
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Union
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from services.projection_service import ProjectionService
+
+TextTarget = Union[str, Path, IO[str]]
+
+
+def write_csv(chunks: Iterable[pd.DataFrame], target: TextTarget) -> int:
+    """Write chunks as one CSV with a single header row; returns the rows written."""
+    rows = 0
+    with _text_stream(target) as stream:
+        for chunk in chunks:
+            chunk.to_csv(stream, header=rows == 0, date_format='%Y-%m-%d')
+            rows += len(chunk)
+    return rows
+
+
+def write_jsonl(chunks: Iterable[pd.DataFrame], target: TextTarget) -> int:
+    """Write chunks as JSON lines, one record per period; returns the rows written."""
+    rows = 0
+    with _text_stream(target) as stream:
+        for chunk in chunks:
+            chunk.reset_index().to_json(stream, orient='records', lines=True, date_format='iso')
+            rows += len(chunk)
+    return rows
+
+
+def write_parquet(chunks: Iterable[pd.DataFrame], path: Union[str, Path]) -> int:
+    """Write chunks as row groups of one Parquet file; returns the rows written."""
+    rows = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=True)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def iter_monthly(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """
+    Streaming ProjectionService.resample_monthly: yield the months each chunk completes.
+
+    A month's periods may span chunks, so the periods of the latest month are held
+    back until a later chunk (or the end of the stream) shows the month is over.
+    Stopping iteration early, say at the first month whose revenue crosses a
+    target, stops the upstream projection too.
+    """
+    start = None
+    pending = None
+    for chunk in chunks:
+        if start is None:
+            start = chunk.index[0]
+        if pending is not None:
+            chunk = pd.concat([pending, chunk])
+        complete = (chunk['month'] < chunk['month'].iat[-1]).to_numpy()
+        pending = chunk[~complete]
+        if complete.any():
+            yield _resample(chunk[complete], start)
+    if pending is not None:
+        yield _resample(pending, start)
+
+
+def _resample(period_projections: pd.DataFrame, start: pd.Timestamp) -> pd.DataFrame:
+    # Label months from the stream's start date, as resample_monthly does for a whole run
+    monthly = ProjectionService.resample_monthly(period_projections)
+    month_starts = pd.date_range(
+        start, periods=int(monthly['month'].iat[-1]), freq=pd.DateOffset(months=1), name='date'
+    )
+    monthly.index = month_starts[int(monthly['month'].iat[0]) - 1:]
+    return monthly
+
+
+@contextmanager
+def _text_stream(target: TextTarget):
+    if isinstance(target, (str, Path)):
+        with open(target, "w", encoding="utf-8", newline="") as stream:
+            yield stream
+    else:
+        yield target
+        target.flush()
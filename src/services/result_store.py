@@ -0,0 +1,113 @@
+import uuid
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs
+from models.projection_results import BatchProjectionResult
+from config.constants import RESULT_STORE_PARTITION_SIZE, RESULT_STORE_FORMATS
+
+RESULT_SCHEMA = pa.schema([
+    ('scenario_id', pa.int64()),
+    ('month', pa.int32()),
+    ('tier', pa.dictionary(pa.int32(), pa.string())),
+    ('users', pa.float64()),
+    ('revenue', pa.float64())
+])
+
+
+class ProjectionResultStore:
+    """
+    Columnar store of batch projections as (scenario_id, month, tier) rows.
+
+    Scenarios are grouped into hive-style partition=<scenario_id // partition_size>
+    directories. The default Arrow IPC format is written uncompressed so reads are
+    memory-mapped and zero-copy; Parquet trades that for smaller files. Reads prune
+    partitions and push scenario and month filters down to the scan.
+    """
+
+    def __init__(self, root: str, file_format: str = "ipc",
+                 partition_size: int = RESULT_STORE_PARTITION_SIZE):
+        if file_format not in RESULT_STORE_FORMATS:
+            raise ValueError(f"Format must be one of {', '.join(RESULT_STORE_FORMATS)}")
+        self.root = Path(root)
+        self.file_format = file_format
+        self.partition_size = partition_size
+
+    def write_batch(self, result: BatchProjectionResult,
+                    scenario_ids: Optional[Sequence[int]] = None) -> None:
+        """Append a batch result; scenario ids default to 0..N-1."""
+        if scenario_ids is None:
+            scenario_ids = np.arange(result.n_scenarios)
+        scenario_ids = np.asarray(scenario_ids, dtype=np.int64)
+        if scenario_ids.shape != (result.n_scenarios,):
+            raise ValueError(f"Expected {result.n_scenarios} scenario ids")
+
+        partitions = scenario_ids // self.partition_size
+        for partition in np.unique(partitions):
+            rows = np.flatnonzero(partitions == partition)
+            table = self._to_table(result, rows, scenario_ids[rows])
+            self._write_file(table, int(partition))
+
+    def read(self, scenario_ids: Optional[Sequence[int]] = None,
+             months: Optional[Tuple[int, int]] = None,
+             columns: Optional[List[str]] = None) -> pa.Table:
+        """
+        Read a slice of the store as an Arrow table.
+
+        Args:
+            scenario_ids: Scenarios to load; None loads all.
+            months: Inclusive (first, last) month range; None loads all.
+            columns: Columns to load; None loads every result column.
+        """
+        dataset = ds.dataset(
+            self.root,
+            format=self.file_format,
+            partitioning="hive",
+            filesystem=fs.LocalFileSystem(use_mmap=True)
+        )
+
+        expression = None
+        if scenario_ids is not None:
+            scenario_ids = np.asarray(scenario_ids, dtype=np.int64)
+            partitions = np.unique(scenario_ids // self.partition_size)
+            expression = (ds.field('partition').isin(partitions.tolist()) &
+                          ds.field('scenario_id').isin(scenario_ids.tolist()))
+        if months is not None:
+            month_filter = (ds.field('month') >= months[0]) & (ds.field('month') <= months[1])
+            expression = month_filter if expression is None else expression & month_filter
+
+        return dataset.to_table(columns=columns or RESULT_SCHEMA.names, filter=expression)
+
+    def read_pandas(self, *args, **kwargs) -> pd.DataFrame:
+        return self.read(*args, **kwargs).to_pandas()
+
+    def _to_table(self, result: BatchProjectionResult, rows: np.ndarray,
+                  scenario_ids: np.ndarray) -> pa.Table:
+        """Flatten the (scenarios, tiers, months) block for the given rows into long rows."""
+        n_tiers, n_months = len(result.tier_names), result.months.shape[0]
+        tier_users = result.total_users[rows, None, :] * result.tier_distributions[rows, :, None]
+        tier_revenue = tier_users * result.tier_prices[rows]
+
+        tier_indices = np.broadcast_to(np.arange(n_tiers, dtype=np.int32)[None, :, None], tier_users.shape)
+        return pa.table({
+            'scenario_id': np.repeat(scenario_ids, n_tiers * n_months),
+            'month': np.broadcast_to(result.months.astype(np.int32), tier_users.shape).ravel(),
+            'tier': pa.DictionaryArray.from_arrays(tier_indices.ravel(), list(result.tier_names)),
+            'users': tier_users.ravel(),
+            'revenue': tier_revenue.ravel()
+        }, schema=RESULT_SCHEMA)
+
+    def _write_file(self, table: pa.Table, partition: int) -> None:
+        directory = self.root / f"partition={partition}"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"part-{uuid.uuid4().hex}.{'arrow' if self.file_format == 'ipc' else 'parquet'}"
+
+        if self.file_format == "ipc":
+            with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        else:
+            pq.write_table(table, path)
@@ -0,0 +1,26 @@
+import numpy as np
+from models.projection_results import ScenarioComparison
+from services.projection_service import ProjectionService
+from config.constants import GROWTH_SCENARIOS
+
+
+def compare_scenarios(projection_service: ProjectionService, months: int = 12) -> ScenarioComparison:
+    """
+    Project every GROWTH_SCENARIOS preset and saved custom scenario side by side.
+
+    Scenarios differ only in their growth rate; tiers, campaigns and churn come
+    from the service. All of them are evaluated in one
+    calculate_projections_batch call, which applies churn as a flat rate.
+    """
+    scenarios = {**GROWTH_SCENARIOS, **projection_service.saved_scenarios}
+    result = projection_service.calculate_projections_batch(
+        months,
+        growth_rates=np.fromiter(scenarios.values(), dtype=float, count=len(scenarios))
+    )
+    return ScenarioComparison(
+        names=tuple(scenarios),
+        growth_rates=result.growth_rates,
+        months=result.months,
+        total_users=result.total_users,
+        total_revenue=result.total_revenue
+    )
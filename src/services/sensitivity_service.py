@@ -0,0 +1,95 @@
+from typing import List, Tuple
+import numpy as np
+from models.projection_results import SensitivityResult
+from models.tier_matrix import TierMatrix
+from services.projection_service import ProjectionService
+from config.constants import SENSITIVITY_STEP
+
+SENSITIVITY_METRICS = ('revenue', 'arr', 'users')
+_CAMPAIGN_INPUTS = (
+    ('expected_reach', 'Reach'),
+    ('reach_to_download_rate', 'Reach→Download'),
+    ('download_to_active_rate', 'Download→Active'),
+    ('active_to_subscriber_rate', 'Active→Subscriber')
+)
+
+
+def run_sensitivity(
+    projection_service: ProjectionService,
+    months: int = 12,
+    step: float = SENSITIVITY_STEP
+) -> SensitivityResult:
+    """
+    Perturb every projection input by ±step and measure Month-N revenue, ARR and users.
+
+    Scenario 0 is the base case and each input adds a low and a high scenario.
+    Tier prices scale the tier's whole price schedule; a campaign input scales
+    that campaign's new users, which shifts the cumulative campaign users by its
+    contribution row. All scenarios are evaluated in one
+    calculate_projections_batch call, which applies churn as a flat rate.
+    """
+    if not 0 < step < 1:
+        raise ValueError("Sensitivity step must be between 0 and 1")
+
+    service = projection_service
+    growth_rate = service.growth_rate
+    churn_rate = service.churn_rate if service.enable_churn else 0.0
+    tiers = TierMatrix.from_tiers(service.subscriptions, months)
+    contributions = service.campaign_contributions(months)
+
+    # (label, group, base value, index) for every input
+    inputs: List[Tuple[str, str, float, int]] = [('Growth Rate', 'growth', growth_rate, 0)]
+    if churn_rate > 0:
+        inputs.append(('Churn Rate', 'churn', churn_rate, 0))
+    for idx, tier in enumerate(service.subscriptions):
+        inputs.append((f'{tier.name} Price', 'tier_price', tier.monthly_price, idx))
+        inputs.append((f'{tier.name} Distribution', 'tier_distribution', tier.distribution_percentage, idx))
+    for idx, name in enumerate(service.campaigns.name):
+        for column, label in _CAMPAIGN_INPUTS:
+            value = float(getattr(service.campaigns, column)[idx])
+            inputs.append((f'{name} {label}', 'campaign', value, idx))
+
+    n_scenarios = 1 + 2 * len(inputs)
+    factors = np.tile([1 - step, 1 + step], len(inputs))
+    growth_rates = np.full(n_scenarios, growth_rate)
+    churn_rates = np.full(n_scenarios, churn_rate)
+    tier_prices = np.repeat(tiers.prices[None], n_scenarios, axis=0)
+    tier_distributions = np.repeat(tiers.distribution[None, :, 0], n_scenarios, axis=0)
+    campaign_users = np.repeat(contributions.sum(axis=0)[None], n_scenarios, axis=0)
+
+    for position, (_, group, _, idx) in enumerate(inputs):
+        rows = slice(1 + 2 * position, 3 + 2 * position)
+        scale = factors[2 * position:2 * position + 2]
+        if group == 'growth':
+            growth_rates[rows] *= scale
+        elif group == 'churn':
+            churn_rates[rows] *= scale
+        elif group == 'tier_price':
+            tier_prices[rows, idx] *= scale[:, None]
+        elif group == 'tier_distribution':
+            tier_distributions[rows, idx] *= scale
+        else:
+            campaign_users[rows] += (scale - 1)[:, None] * contributions[idx]
+
+    result = service.calculate_projections_batch(
+        months,
+        growth_rates=growth_rates,
+        churn_rates=churn_rates,
+        tier_prices=tier_prices,
+        tier_distributions=tier_distributions,
+        campaign_users=campaign_users
+    )
+
+    last_revenue = result.total_revenue[:, -1]
+    metrics = np.column_stack([last_revenue, last_revenue * 12, result.total_users[:, -1]])
+    return SensitivityResult(
+        months=months,
+        step=step,
+        parameters=tuple(label for label, _, _, _ in inputs),
+        groups=tuple(group.split('_')[0] for _, group, _, _ in inputs),
+        base_values=np.array([value for _, _, value, _ in inputs], dtype=float),
+        metrics=SENSITIVITY_METRICS,
+        base=metrics[0],
+        low=metrics[1::2],
+        high=metrics[2::2]
+    )
@@ -0,0 +1,143 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+import numpy as np
+from models.projection_results import MonteCarloResult
+from models.simulation import SimulationConfig
+from services.projection_kernel import compound_with_inflows, campaign_schedule
+from services.projection_service import ProjectionService
+from config.constants import MONTE_CARLO_PERCENTILES
+
+# Keeps net growth strictly above -100% when sampled churn meets sampled growth
+_MIN_NET_GROWTH_RATE = -0.999
+
+
+@dataclass(frozen=True)
+class _ChunkTask:
+    """Everything a worker needs to simulate paths [start, stop) into the shared buffers."""
+    users_buffer: str
+    revenue_buffer: str
+    shape: Tuple[int, int]           # (months, paths) so percentiles run over contiguous rows
+    start: int
+    stop: int
+    seed_sequence: np.random.SeedSequence
+    config: SimulationConfig
+    growth_rate: float
+    churn_rate: float
+    revenue_per_user: np.ndarray     # (months,)
+    initial_users: float
+    expected_reach: np.ndarray       # (campaigns,)
+    conversion_rates: np.ndarray     # (3, campaigns)
+    schedule: np.ndarray             # (campaigns, months)
+
+
+def run_monte_carlo(
+    projection_service: ProjectionService,
+    months: int = 12,
+    config: Optional[SimulationConfig] = None
+) -> MonteCarloResult:
+    """
+    Simulate projections with uncertain growth, churn and campaign conversion rates.
+
+    Paths are split into fixed-size chunks, each with its own child of the seeded
+    SeedSequence, so the bands are identical for any number of workers. Sampled
+    churn is applied as a flat rate, as in calculate_projections_batch.
+    """
+    config = config or SimulationConfig()
+    point = projection_service.calculate_projections_batch(months)
+    campaigns = projection_service.campaigns
+
+    shape = (months, config.paths)
+    nbytes = int(np.prod(shape)) * np.dtype(float).itemsize
+    users_shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    revenue_shm = shared_memory.SharedMemory(create=True, size=nbytes)
+
+    try:
+        starts = range(0, config.paths, config.chunk_size)
+        seeds = np.random.SeedSequence(config.seed).spawn(len(starts))
+        tasks = [
+            _ChunkTask(
+                users_buffer=users_shm.name,
+                revenue_buffer=revenue_shm.name,
+                shape=shape,
+                start=start,
+                stop=min(start + config.chunk_size, config.paths),
+                seed_sequence=seed,
+                config=config,
+                growth_rate=float(point.growth_rates[0]),
+                churn_rate=float(point.churn_rates[0]),
+                revenue_per_user=point.tier_distributions[0] @ point.tier_prices[0],
+                initial_users=point.initial_users,
+                expected_reach=campaigns.expected_reach.astype(float),
+                conversion_rates=np.stack([
+                    campaigns.reach_to_download_rate,
+                    campaigns.download_to_active_rate,
+                    campaigns.active_to_subscriber_rate
+                ]),
+                schedule=campaign_schedule(campaigns.start_month, campaigns.duration_months, months)
+            )
+            for start, seed in zip(starts, seeds)
+        ]
+
+        workers = min(config.workers or os.cpu_count() or 1, len(tasks))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_simulate_chunk, tasks))
+        else:
+            for task in tasks:
+                _simulate_chunk(task)
+
+        users = np.ndarray(shape, dtype=float, buffer=users_shm.buf)
+        revenue = np.ndarray(shape, dtype=float, buffer=revenue_shm.buf)
+        result = MonteCarloResult(
+            months=point.months,
+            percentiles=tuple(MONTE_CARLO_PERCENTILES),
+            users=np.percentile(users, MONTE_CARLO_PERCENTILES, axis=1),
+            revenue=np.percentile(revenue, MONTE_CARLO_PERCENTILES, axis=1),
+            paths=config.paths,
+            seed=config.seed
+        )
+        del users, revenue
+        return result
+    finally:
+        for shm in (users_shm, revenue_shm):
+            shm.close()
+            shm.unlink()
+
+
+def _simulate_chunk(task: _ChunkTask) -> None:
+    """Simulate one chunk of paths and write users and revenue into the shared buffers."""
+    config = task.config
+    size = task.stop - task.start
+    rng = np.random.default_rng(task.seed_sequence)
+
+    growth_rates = config.growth_rate.sample(rng, task.growth_rate, size)
+    churn_rates = config.churn_rate.sample(rng, task.churn_rate, size)
+
+    n_campaigns = task.expected_reach.shape[0]
+    funnel = (size, n_campaigns)
+    new_users = (
+        task.expected_reach
+        * config.reach_to_download_rate.sample(rng, task.conversion_rates[0], funnel)
+        * config.download_to_active_rate.sample(rng, task.conversion_rates[1], funnel)
+        * config.active_to_subscriber_rate.sample(rng, task.conversion_rates[2], funnel)
+    )
+    campaign_users = new_users @ task.schedule
+
+    net_growth_rates = np.maximum(growth_rates - churn_rates, _MIN_NET_GROWTH_RATE)
+    total_users = compound_with_inflows(net_growth_rates, campaign_users, task.initial_users)
+
+    users_shm = shared_memory.SharedMemory(name=task.users_buffer)
+    revenue_shm = shared_memory.SharedMemory(name=task.revenue_buffer)
+    try:
+        users = np.ndarray(task.shape, dtype=float, buffer=users_shm.buf)
+        revenue = np.ndarray(task.shape, dtype=float, buffer=revenue_shm.buf)
+        users[:, task.start:task.stop] = total_users.T
+        revenue[:, task.start:task.stop] = total_users.T * task.revenue_per_user[:, None]
+        del users, revenue
+    finally:
+        users_shm.close()
+        revenue_shm.close()
+
@@ -0,0 +1,76 @@
+import json
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from typing import Deque, Iterator, List, Optional
+from config.constants import PROFILE_HISTORY_LENGTH
+
+_log_lock = threading.Lock()
+
+
+@dataclass
+class StageTiming:
+    stage: str
+    start_ms: float     # Offset from the start of the rerun
+    duration_ms: float
+
+
+@dataclass
+class RerunProfile:
+    run_id: str
+    started_at: str
+    stages: List[StageTiming] = field(default_factory=list)
+    total_ms: float = 0.0
+
+
+class RerunProfiler:
+    """Collects per-stage timing spans for each rerun and keeps the last N reruns."""
+
+    def __init__(self, history: int = PROFILE_HISTORY_LENGTH, log_path: Optional[str] = None):
+        self.history: Deque[RerunProfile] = deque(maxlen=history)
+        self.log_path = log_path
+        self._current: Optional[RerunProfile] = None
+        self._started: float = 0.0
+
+    def start(self) -> None:
+        self._current = RerunProfile(
+            run_id=uuid.uuid4().hex,
+            started_at=datetime.now(timezone.utc).isoformat()
+        )
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as one stage of the current rerun."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._current is not None:
+                end = time.perf_counter()
+                self._current.stages.append(StageTiming(
+                    stage=stage,
+                    start_ms=(start - self._started) * 1000,
+                    duration_ms=(end - start) * 1000
+                ))
+
+    def finish(self) -> Optional[RerunProfile]:
+        """Close the current rerun, store it in the history and append it to the log."""
+        profile, self._current = self._current, None
+        if profile is None:
+            return None
+
+        profile.total_ms = (time.perf_counter() - self._started) * 1000
+        self.history.append(profile)
+        if self.log_path:
+            self._write_log(profile)
+        return profile
+
+    def _write_log(self, profile: RerunProfile) -> None:
+        line = json.dumps(asdict(profile), separators=(',', ':'))
+        with _log_lock, open(self.log_path, "a", encoding="utf-8") as log_file:
+            log_file.write(line + "\n")
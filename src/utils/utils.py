@@ -1,6 +1,27 @@
 import base64
+from functools import lru_cache
+from typing import Any, Callable, Hashable
 
+@lru_cache(maxsize=8)
 def get_image_base64(image_path):
-    """Convert image to base64 string"""
+    """Convert image to base64 string (cached, the assets do not change while the app runs)"""
     with open(image_path, "rb") as img_file:
-        return base64.b64encode(img_file.read()).decode('utf-8') 
\ No newline at end of file
+        return base64.b64encode(img_file.read()).decode('utf-8') 
+
+def session_memo(name: str, version: Hashable, build: Callable[[], Any]) -> Any:
+    """Return the value stored in session state under name, rebuilding it when version changes."""
+    import streamlit as st
+    
+    memo = st.session_state.setdefault("_session_memo", {})
+    cached = memo.get(name)
+    if cached is None or cached[0] != version:
+        cached = (version, build())
+        memo[name] = cached
+    return cached[1]
+
+def in_fragment_rerun() -> bool:
+    """Whether the current script run reruns only fragments rather than the whole app."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    
+    ctx = get_script_run_ctx()
+    return bool(ctx is not None and ctx.fragment_ids_this_run)
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# Modules import each other as top-level packages (services, models, config),
+# the way Streamlit runs src/main.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
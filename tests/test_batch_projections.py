@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+from models.subscription import PriceChange
+from models.tier_matrix import TierMatrix
+from services.projection_service import ProjectionService
+
+MONTHS = 24
+
+
+def random_scenario(rng, idx: int) -> ProjectionService:
+    """A single-scenario service with its own growth, churn, tiers, price changes and campaigns."""
+    service = ProjectionService.from_config({
+        'growth_scenario': 'Custom',
+        'custom_growth_rate': float(rng.uniform(1, 20)),
+        'enable_churn': True,
+        'churn_rate': float(rng.uniform(0, 0.1)),
+        'campaigns': [
+            {
+                'name': f'Campaign {idx}.{campaign}', 'campaign_id': f'c{idx}_{campaign}',
+                'start_month': int(rng.integers(1, 13)), 'duration_months': int(rng.integers(1, 13)),
+                'budget': 1000, 'expected_reach': int(rng.integers(1000, 100000)),
+                'reach_to_download_rate': 0.05, 'download_to_active_rate': 0.3, 'active_to_subscriber_rate': 0.5
+            }
+            for campaign in range(rng.integers(0, 4))
+        ]
+    })
+    distribution = rng.dirichlet(np.ones(len(service.subscriptions)))
+    for tier, share in zip(list(service.subscriptions), distribution):
+        schedule = [PriceChange(start_month=int(rng.integers(2, MONTHS + 1)), monthly_price=float(rng.uniform(1, 40)))]
+        service.set_tier(tier.name, float(rng.uniform(1, 40)), float(share), tier.features, price_schedule=schedule)
+    return service
+
+
+@pytest.fixture
+def scenarios():
+    rng = np.random.default_rng(7)
+    return [random_scenario(rng, idx) for idx in range(8)]
+
+
+@pytest.fixture
+def batch(scenarios):
+    return scenarios[0].calculate_projections_batch(
+        MONTHS,
+        growth_rates=[service.growth_rate for service in scenarios],
+        churn_rates=[service.churn_rate for service in scenarios],
+        tier_prices=[TierMatrix.from_tiers(service.subscriptions, MONTHS).prices for service in scenarios],
+        tier_distributions=[[tier.distribution_percentage for tier in service.subscriptions] for service in scenarios],
+        campaign_users=[service._campaign_users(MONTHS) for service in scenarios]
+    )
+
+
+def test_batch_rows_match_single_projections(scenarios, batch):
+    assert batch.n_scenarios == len(scenarios)
+    for row, service in enumerate(scenarios):
+        result = service.project(MONTHS)
+        np.testing.assert_allclose(batch.total_users[row], result.total_users, rtol=1e-12)
+        np.testing.assert_allclose(batch.campaign_users[row], result.campaign_users, rtol=1e-12)
+        np.testing.assert_allclose(batch.total_revenue[row], result.total_revenue, rtol=1e-12)
+        np.testing.assert_allclose(batch.tier_revenue[row], result.tier_revenue, rtol=1e-12)
+
+
+def test_to_frame_matches_calculate_projections(scenarios, batch):
+    for row, service in enumerate(scenarios):
+        projections = service.calculate_projections(MONTHS)
+        pd.testing.assert_frame_equal(batch.to_frame(row), projections, check_exact=False, rtol=1e-12)
+        pd.testing.assert_frame_equal(
+            batch.tier_frame(row), service.calculate_tier_projections(projections), check_exact=False, rtol=1e-12
+        )
+
+
+def test_defaults_reproduce_the_service(scenarios):
+    service = scenarios[0]
+    pd.testing.assert_frame_equal(
+        service.calculate_projections_batch(MONTHS).to_frame(0), service.calculate_projections(MONTHS),
+        check_exact=False, rtol=1e-12
+    )
+
+
+def test_scalar_and_flat_prices_broadcast(scenarios):
+    service = scenarios[0]
+    batch = service.calculate_projections_batch(MONTHS, growth_rates=[0.02, 0.05, 0.1], tier_prices=[10.0, 20.0, 30.0])
+
+    assert batch.total_users.shape == (3, MONTHS)
+    np.testing.assert_array_equal(batch.tier_prices[:, :, 0], np.broadcast_to([10.0, 20.0, 30.0], (3, 3)))
+    assert np.all(np.diff(batch.total_users[:, -1]) > 0)
+
+
+def test_mismatched_scenario_counts_are_rejected(scenarios):
+    with pytest.raises(ValueError, match="same number of scenarios"):
+        scenarios[0].calculate_projections_batch(MONTHS, growth_rates=[0.1, 0.2], churn_rates=[0.01, 0.02, 0.03])
+    with pytest.raises(ValueError, match="columns"):
+        scenarios[0].calculate_projections_batch(MONTHS, campaign_users=np.zeros(MONTHS - 1))
@@ -0,0 +1,97 @@
+import sqlite3
+import time
+import numpy as np
+import pandas as pd
+import pytest
+from services.cache_service import DiskProjectionCache, ProjectionCache
+from services.projection_service import ProjectionService
+
+
+@pytest.fixture
+def result():
+    return ProjectionService.from_config({'enable_churn': True, 'churn_rate': 0.02}).project(12)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "cache" / "projections.sqlite3"
+
+
+def test_round_trip(cache_path, result):
+    cache = DiskProjectionCache(cache_path)
+    assert cache.get("key") is None
+    cache.put("key", result)
+    stored = cache.get("key")
+
+    pd.testing.assert_frame_equal(stored.to_pandas(), result.to_pandas())
+    pd.testing.assert_frame_equal(stored.tier_frame(), result.tier_frame())
+    assert stored.campaign_names == result.campaign_names
+    assert cache.stats['hits'] == 1 and cache.stats['misses'] == 1
+
+
+def test_nothing_is_created_before_first_use(cache_path):
+    DiskProjectionCache(cache_path)
+
+    assert not cache_path.parent.exists()
+
+
+def test_expired_entries_are_misses(cache_path, result):
+    cache = DiskProjectionCache(cache_path, ttl_seconds=0.05)
+    cache.put("old", result)
+    time.sleep(0.1)
+
+    assert cache.get("old") is None
+
+
+def test_evicts_least_recently_read(cache_path, result):
+    cache = DiskProjectionCache(cache_path, max_entries=3)
+    for index in range(6):
+        cache.put(f"key{index}", result)
+        cache.get("key0")
+
+    assert cache.stats['entries'] == 3
+    assert cache.get("key0") is not None
+    assert cache.get("key1") is None
+
+
+def test_reads_do_not_wait_for_writers(cache_path, result):
+    DiskProjectionCache(cache_path).put("key", result)
+    writer = sqlite3.connect(cache_path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        reader = DiskProjectionCache(cache_path, busy_timeout=2)
+        started = time.perf_counter()
+        assert reader.get("key") is not None
+        assert time.perf_counter() - started < 1
+    finally:
+        writer.execute("COMMIT")
+
+
+def test_corrupt_entry_counts_as_error(cache_path, result):
+    cache = DiskProjectionCache(cache_path)
+    cache.put("key", result)
+    with sqlite3.connect(cache_path) as connection:
+        connection.execute("UPDATE projections SET value = X'00'")
+
+    assert cache.get("key") is None
+    assert cache.errors == 1
+
+
+def test_unusable_directory_never_fails_projection(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = ProjectionCache(backing=DiskProjectionCache(blocker / "projections.sqlite3"))
+    service = ProjectionService.from_config({})
+
+    np.testing.assert_array_equal(cache.get_or_compute(service).total_users, service.project(12).total_users)
+    assert cache.stats['disk']['errors'] > 0
+
+
+def test_memory_cache_falls_through_to_disk(cache_path):
+    service = ProjectionService.from_config({})
+    ProjectionCache(backing=DiskProjectionCache(cache_path)).get_or_compute(service)
+    backing = DiskProjectionCache(cache_path)
+    warm = ProjectionCache(backing=backing)
+    warm.get_or_compute(service)
+
+    assert backing.stats['hits'] == 1
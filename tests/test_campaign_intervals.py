@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from models.campaign_intervals import CampaignIntervalIndex
+
+
+def random_index(seed: int, campaigns: int = 40):
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(1, 25, campaigns)
+    durations = rng.integers(1, 13, campaigns)
+    return CampaignIntervalIndex.from_arrays(starts, durations), starts, starts + durations
+
+
+def shares_a_month(start_a, end_a, start_b, end_b) -> bool:
+    return bool(set(range(start_a, end_a)) & set(range(start_b, end_b)))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_overlaps_matches_brute_force(seed):
+    index, starts, ends = random_index(seed)
+    for start_month in range(1, 30):
+        for duration in (1, 3, 12):
+            expected = [row for row in range(len(index))
+                        if shares_a_month(start_month, start_month + duration, starts[row], ends[row])]
+            np.testing.assert_array_equal(index.overlaps(start_month, duration), expected)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_overlapping_pairs_matches_brute_force(seed):
+    index, starts, ends = random_index(seed)
+    expected = {
+        (i, j) for i in range(len(index)) for j in range(i + 1, len(index))
+        if shares_a_month(starts[i], ends[i], starts[j], ends[j])
+    }
+    left, right = index.overlapping_pairs()
+
+    assert len(left) == len(expected)
+    assert set(zip(left.tolist(), right.tolist())) == expected
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_overlap_counts_match_brute_force(seed):
+    index, starts, ends = random_index(seed)
+    expected = [
+        sum(shares_a_month(starts[i], ends[i], starts[j], ends[j]) for j in range(len(index)) if j != i)
+        for i in range(len(index))
+    ]
+    np.testing.assert_array_equal(index.overlap_counts(), expected)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_active_in_and_concurrency_match_brute_force(seed):
+    index, starts, ends = random_index(seed)
+    months = 30
+    concurrency = index.concurrency(months)
+    for month in range(1, months + 1):
+        expected = [row for row in range(len(index)) if starts[row] <= month < ends[row]]
+        np.testing.assert_array_equal(index.active_in(month), expected)
+        assert concurrency[month - 1] == len(expected)
+
+
+def test_back_to_back_campaigns_do_not_overlap():
+    index = CampaignIntervalIndex.from_arrays([1, 4], [3, 2])
+
+    assert index.overlaps(4, 2).tolist() == [1]
+    assert index.overlap_counts().tolist() == [0, 0]
+    assert index.last_month == 5
+
+
+def test_empty_index():
+    index = CampaignIntervalIndex.from_arrays([], [])
+    left, right = index.overlapping_pairs()
+
+    assert len(index) == 0 and index.last_month == 0
+    assert left.size == right.size == 0
+    assert index.overlaps(1, 12).size == 0
+    np.testing.assert_array_equal(index.concurrency(12), np.zeros(12))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 50, 10_000])
+def test_iter_overlapping_pairs_streams_every_pair(chunk_size):
+    index, _, _ = random_index(3, campaigns=200)
+    left, right = index.overlapping_pairs()
+    chunks = list(index.iter_overlapping_pairs(chunk_size))
+    longest_run = int(index.overlap_counts().max())
+
+    assert all(0 < len(chunk_left) <= max(chunk_size, longest_run) for chunk_left, _ in chunks)
+    np.testing.assert_array_equal(np.concatenate([chunk[0] for chunk in chunks]), left)
+    np.testing.assert_array_equal(np.concatenate([chunk[1] for chunk in chunks]), right)
+
+
+def test_overlapping_pairs_refuses_dense_plans():
+    # 2,000 campaigns running at once have about two million pairs
+    index = CampaignIntervalIndex.from_arrays(np.ones(2000, dtype=int), np.full(2000, 12))
+
+    with pytest.raises(ValueError, match="iter_overlapping_pairs"):
+        index.overlapping_pairs(max_pairs=1_000_000)
+    assert sum(len(left) for left, _ in index.iter_overlapping_pairs(100_000)) == 2000 * 1999 // 2
+    assert len(index.overlapping_pairs(max_pairs=None)[0]) == 2000 * 1999 // 2
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+from models.campaign import MarketingCampaign
+from models.campaign_table import CampaignTable, CampaignValidationError
+
+RECORD = {
+    'name': 'Launch', 'campaign_id': 'launch', 'start_month': 3, 'duration_months': 4,
+    'expected_reach': 50000, 'budget': 1000.0, 'reach_to_download_rate': 0.05,
+    'download_to_active_rate': 0.3, 'active_to_subscriber_rate': 0.5
+}
+
+INVALID_VALUES = [
+    ('start_month', 0), ('start_month', 13), ('duration_months', 0), ('duration_months', 13),
+    ('budget', -1.0), ('expected_reach', -100),
+    ('reach_to_download_rate', -3.0), ('download_to_active_rate', 1.5), ('active_to_subscriber_rate', -0.1)
+]
+
+
+def records(count: int):
+    return [{**RECORD, 'name': f'Campaign {idx}', 'campaign_id': f'c{idx}'} for idx in range(count)]
+
+
+def test_valid_records_and_frames_load():
+    table = CampaignTable.from_records(records(3))
+
+    assert len(table) == 3
+    assert table == CampaignTable.from_frame(pd.DataFrame.from_records(records(3)))
+    assert table == CampaignTable.from_campaigns([MarketingCampaign(**record) for record in records(3)])
+    assert table.to_records() == records(3)
+    np.testing.assert_allclose(table.new_users, 50000 * 0.05 * 0.3 * 0.5)
+
+
+def test_boundary_values_are_accepted():
+    record = {**RECORD, 'budget': 0.0, 'expected_reach': 0, 'reach_to_download_rate': 0.0,
+              'download_to_active_rate': 1.0, 'active_to_subscriber_rate': 1.0}
+    assert len(CampaignTable.from_records([record])) == 1
+    MarketingCampaign(**record)
+
+
+@pytest.mark.parametrize("column, value", INVALID_VALUES)
+def test_out_of_range_values_are_rejected(column, value):
+    rows = records(4)
+    rows[2][column] = value
+    with pytest.raises(CampaignValidationError) as error:
+        CampaignTable.from_records(rows)
+    assert [(row, field) for row, field, _ in error.value.errors] == [(2, column)]
+
+    # The table accepts exactly what a single MarketingCampaign accepts
+    with pytest.raises(ValidationError):
+        MarketingCampaign(**rows[2])
+
+
+def test_every_failure_is_reported_by_row():
+    rows = records(5)
+    rows[0]['reach_to_download_rate'] = -3
+    rows[1]['budget'] = 'lots'
+    rows[3]['expected_reach'] = 10.5
+    rows[3]['duration_months'] = 20
+    frame = pd.DataFrame.from_records(rows)
+
+    with pytest.raises(CampaignValidationError) as error:
+        CampaignTable.from_frame(frame)
+    assert [(row, field) for row, field, _ in error.value.errors] == [
+        (0, 'reach_to_download_rate'), (1, 'budget'), (3, 'duration_months'), (3, 'expected_reach')
+    ]
+    assert "4 invalid campaign values" in str(error.value)
+
+
+def test_missing_columns_are_rejected():
+    with pytest.raises(ValueError, match="budget"):
+        CampaignTable.from_frame(pd.DataFrame.from_records(records(2)).drop(columns='budget'))
+
+
+def test_validate_checks_the_current_rows():
+    table = CampaignTable.from_records(records(3))
+    assert table.validate() == []
+
+    table.reach_to_download_rate[1] = 2.0
+    assert table.validate() == [(1, 'reach_to_download_rate', "must be between 0 and 1")]
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from components.charts import _build_revenue_figure, _build_users_figure
+from config.constants import CHART_MAX_POINTS
+from services.projection_service import ProjectionService
+from utils.downsampling import lttb_indices
+
+
+@pytest.fixture
+def cohort_service():
+    return ProjectionService.from_config({'enable_churn': True, 'churn_model': 'cohort'})
+
+
+def test_figures_plot_the_result_tiers_without_recomputing(cohort_service, monkeypatch):
+    result = cohort_service.project(12)
+    projections, tier_projections = result.to_pandas(), result.tier_frame()
+
+    def no_recompute(*args, **kwargs):
+        raise AssertionError("figures must reuse the result's tier frame")
+    monkeypatch.setattr(cohort_service, "calculate_tier_projections", no_recompute)
+    monkeypatch.setattr(cohort_service, "tier_matrix", no_recompute)
+
+    revenue = _build_revenue_figure(projections, tier_projections, cohort_service, "svg")
+    users = _build_users_figure(projections, tier_projections, cohort_service, "svg")
+
+    for idx in range(len(result.tier_names)):
+        np.testing.assert_allclose(revenue['data'][idx]['y'], result.tier_revenue[idx])
+        np.testing.assert_allclose(users['data'][idx]['y'], result.tier_users[idx])
+    np.testing.assert_allclose(users['data'][len(result.tier_names)]['y'], result.total_users)
+
+
+@pytest.mark.parametrize("render_mode", ["svg", "webgl"])
+def test_tiers_reuse_the_indices_picked_from_the_total(render_mode):
+    service = ProjectionService.from_config({'enable_churn': True, 'churn_rate': 0.02})
+    periods = service.calculate_period_projections(240, "day", start_date="2025-01-01")
+    projections = periods.reset_index(drop=True)
+    projections['month'] = np.arange(1, len(projections) + 1)
+    tier_projections = service.calculate_tier_projections(projections)
+    tier_revenue = tier_projections['revenue'].unstack('tier').to_numpy().T
+    months = projections['month'].to_numpy()
+
+    figure = _build_revenue_figure(projections, tier_projections, service, render_mode)
+    indices = lttb_indices(months, projections['total_revenue'].to_numpy(), CHART_MAX_POINTS)
+    for idx in range(len(service.subscriptions)):
+        trace = figure['data'][idx]
+        np.testing.assert_array_equal(trace['x'], months[indices])
+        revenue = trace['customdata'] if render_mode == "webgl" else trace['y']
+        np.testing.assert_allclose(revenue, tier_revenue[idx, indices])
+
+    figure = _build_users_figure(projections, tier_projections, service, render_mode)
+    indices = lttb_indices(months, projections['total_users'].to_numpy(), CHART_MAX_POINTS)
+    assert len(indices) == CHART_MAX_POINTS
+    for trace in figure['data'][:len(service.subscriptions) + 1]:
+        np.testing.assert_array_equal(trace['x'], months[indices])
@@ -0,0 +1,30 @@
+import json
+import pandas as pd
+from cli import ConfigParseError, iter_configs, main
+
+
+def test_malformed_entries_fail_only_their_own_id(tmp_path, capsys):
+    configs = tmp_path / "configs"
+    configs.mkdir()
+    (configs / "good.json").write_text(json.dumps({"id": "good", "months": 3}))
+    (configs / "list.json").write_text("[1, 2]")
+    (configs / "batch.jsonl").write_text('{"id": "a", "months": 2}\n{bad\n"text"\n')
+    output = tmp_path / "results.csv"
+
+    assert main([str(configs), "-o", str(output), "--workers", "1"]) == 1
+
+    results = pd.read_csv(output)
+    assert sorted(results['config_id'].unique()) == ["a", "good"]
+    errors = capsys.readouterr().err
+    assert "batch:2: Invalid JSON" in errors
+    assert "batch:3: Expected a JSON object" in errors
+    assert "list: Expected a JSON object, got list" in errors
+
+
+def test_iter_configs_keeps_ids(tmp_path):
+    source = tmp_path / "configs.jsonl"
+    source.write_text('{"id": "first"}\n\n[]\n')
+
+    items = list(iter_configs(str(source)))
+    assert items[0] == ("first", {"id": "first"})
+    assert items[1][0] == "configs:3" and isinstance(items[1][1], ConfigParseError)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from models.retention import RetentionCurve
+from services.projection_service import ProjectionService
+
+CAMPAIGN = {
+    'name': 'Launch', 'campaign_id': 'launch', 'start_month': 3, 'duration_months': 4,
+    'budget': 1000, 'expected_reach': 50000, 'reach_to_download_rate': 0.05,
+    'download_to_active_rate': 0.3, 'active_to_subscriber_rate': 0.5
+}
+
+
+def make_service(churn_model: str, churn_rate: float = 0.05) -> ProjectionService:
+    service = ProjectionService.from_config({
+        'enable_churn': True, 'churn_rate': churn_rate, 'campaigns': [CAMPAIGN]
+    })
+    constant = RetentionCurve(initial_churn=churn_rate, long_term_churn=churn_rate)
+    service.subscriptions = [tier.model_copy(update={'retention': constant}) for tier in service.subscriptions]
+    service.update(churn_model=churn_model)
+    return service
+
+
+@pytest.mark.parametrize("churn_rate", [0.0, 0.05, 0.2])
+def test_constant_retention_matches_flat_churn(churn_rate):
+    cohort = make_service("cohort", churn_rate).project(36)
+    flat = make_service("flat", churn_rate).project(36)
+
+    np.testing.assert_allclose(cohort.total_users, flat.total_users, rtol=1e-12)
+    np.testing.assert_allclose(cohort.total_revenue, flat.total_revenue, rtol=1e-12)
+
+
+def test_churned_users_stop_driving_growth():
+    # Heavy early churn must leave fewer users than the churn-free projection
+    service = ProjectionService.from_config({'enable_churn': True, 'churn_rate': 0.0})
+    service.update(churn_model="cohort")
+    gross = ProjectionService.from_config({}).project(36)
+
+    assert np.all(service.project(36).total_users < gross.total_users)
+
+
+def test_month_granularity_matches_monthly_cohort_model():
+    service = make_service("cohort")
+    service.subscriptions[0] = service.subscriptions[0].model_copy(update={'retention': RetentionCurve()})
+    monthly = service.project(24)
+    periods = service.calculate_period_projections(24, "month", start_date="2025-01-01")
+
+    np.testing.assert_allclose(periods['total_users'], monthly.total_users, rtol=1e-12)
+    np.testing.assert_allclose(periods['total_revenue'], monthly.total_revenue, rtol=1e-12)
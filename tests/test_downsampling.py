@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from config.constants import CHART_MAX_POINTS
+from utils.downsampling import lttb_indices
+
+
+def reference_lttb(x, y, threshold):
+    """Straightforward per-point LTTB with the same bucket edges."""
+    n = len(x)
+    edges = [int(bucket * (n - 2) / (threshold - 2)) + 1 for bucket in range(threshold - 1)]
+    edges[-1] = n - 1
+    indices = [0]
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < threshold - 1 else n
+        avg_x = sum(x[end:next_end]) / (next_end - end)
+        avg_y = sum(y[end:next_end]) / (next_end - end)
+        previous = indices[-1]
+        areas = [
+            abs((x[previous] - avg_x) * (y[point] - y[previous]) - (x[previous] - x[point]) * (avg_y - y[previous]))
+            for point in range(start, end)
+        ]
+        indices.append(start + areas.index(max(areas)))
+    return indices + [n - 1]
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    x = np.arange(10_000, dtype=float)
+    return x, np.cumsum(rng.normal(size=x.shape))
+
+
+def test_keeps_endpoints_and_returns_max_points(series):
+    x, y = series
+    indices = lttb_indices(x, y, CHART_MAX_POINTS)
+
+    assert len(indices) == CHART_MAX_POINTS
+    assert indices[0] == 0 and indices[-1] == len(x) - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+@pytest.mark.parametrize("threshold", [3, 10, 257, CHART_MAX_POINTS])
+def test_matches_reference_implementation(series, threshold):
+    x, y = series[0][:3000], series[1][:3000]
+    np.testing.assert_array_equal(lttb_indices(x, y, threshold), reference_lttb(x.tolist(), y.tolist(), threshold))
+
+
+def test_keeps_isolated_peaks():
+    y = np.zeros(5000)
+    y[1234] = 100.0
+    y[4321] = -50.0
+    indices = lttb_indices(np.arange(5000), y, 100)
+
+    assert 1234 in indices and 4321 in indices
+
+
+@pytest.mark.parametrize("threshold", [2, 36, 100])
+def test_short_series_and_tiny_thresholds_are_kept_whole(threshold):
+    x = np.arange(36)
+    np.testing.assert_array_equal(lttb_indices(x, np.sqrt(x), threshold), x)
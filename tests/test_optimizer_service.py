@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from models.campaign import MarketingCampaign
+from models.optimization import OptimizationConfig
+from services import optimizer_service
+from services.optimizer_service import optimize_campaigns, _floor_shares
+from services.projection_service import ProjectionService
+
+
+@pytest.fixture
+def service():
+    service = ProjectionService.from_config({})
+    service.campaigns = [
+        MarketingCampaign(
+            name=f"Campaign {idx}", campaign_id=f"camp_{idx}", start_month=idx + 1, duration_months=3,
+            budget=budget, expected_reach=reach, reach_to_download_rate=0.05,
+            download_to_active_rate=0.3, active_to_subscriber_rate=0.5
+        )
+        for idx, (budget, reach) in enumerate([(5000, 10000), (5000, 200000), (5000, 20000)])
+    ]
+    return service
+
+
+def test_default_population_runs_without_a_pool(service, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("default optimizer runs must not start a process pool")
+    monkeypatch.setattr(optimizer_service, "ProcessPoolExecutor", no_pool)
+
+    result = optimize_campaigns(service, OptimizationConfig(total_budget=15000))
+    assert result.value >= result.baseline_value
+
+
+def test_every_campaign_keeps_a_minimum_share(service):
+    config = OptimizationConfig(total_budget=15000, seed=1)
+    for _ in range(2):
+        result = optimize_campaigns(service, config)
+        assert np.all(result.budgets >= 0.01 * config.total_budget * (1 - 1e-9))
+        service.update(campaigns=result.to_table(service.campaigns))
+
+    assert np.all(service.campaigns.budget > 0)
+
+
+def test_floor_shares_keeps_valid_shares():
+    shares = np.random.default_rng(0).dirichlet(np.ones(5), 50)
+    floored = _floor_shares(shares, 0.05)
+
+    np.testing.assert_allclose(floored.sum(axis=1), 1)
+    assert np.all(floored[:, :-1] >= 0.05 - 1e-12)
+    np.testing.assert_allclose(_floor_shares(floored, 0.05), floored)
+
+
+@pytest.mark.parametrize("churn_model", ["flat", "cohort"])
+def test_scores_match_project(service, churn_model):
+    service.update(enable_churn=True, churn_rate=0.05, churn_model=churn_model)
+    current_revenue = service.project(12).total_revenue[-1]
+    result = optimize_campaigns(service, OptimizationConfig(total_budget=15000, seed=3))
+
+    np.testing.assert_allclose(result.baseline_value, current_revenue, rtol=1e-9)
+    service.update(campaigns=result.to_table(service.campaigns))
+    # to_table rounds reach to whole users, so allow for that rounding
+    np.testing.assert_allclose(result.value, service.project(12).total_revenue[-1], rtol=1e-4)
+
+
+@pytest.mark.parametrize("churn_model", ["flat", "cohort"])
+def test_revenue_response_matches_project(service, churn_model):
+    service.update(enable_churn=True, churn_rate=0.05, churn_model=churn_model)
+    baseline, response = service.revenue_response(24)
+    # Cumulative campaign users before any churn model is applied
+    campaign_users = service._campaign_users(24)
+
+    np.testing.assert_allclose(baseline + campaign_users @ response, service.project(24).total_revenue, rtol=1e-9)
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+from services.projection_service import ProjectionService
+
+START_DATE = "2025-01-01"
+CAMPAIGNS = [
+    {
+        'name': 'Launch', 'campaign_id': 'launch', 'start_month': 2, 'duration_months': 2,
+        'budget': 1000, 'expected_reach': 500000, 'reach_to_download_rate': 0.1,
+        'download_to_active_rate': 0.5, 'active_to_subscriber_rate': 0.8
+    },
+    {
+        'name': 'Retarget', 'campaign_id': 'retarget', 'start_month': 7, 'duration_months': 5,
+        'budget': 500, 'expected_reach': 80000, 'reach_to_download_rate': 0.05,
+        'download_to_active_rate': 0.3, 'active_to_subscriber_rate': 0.6
+    }
+]
+CONFIGS = {
+    'flat': {'campaigns': CAMPAIGNS},
+    'churn': {'campaigns': CAMPAIGNS, 'enable_churn': True, 'churn_rate': 0.05},
+    'cohort': {'campaigns': CAMPAIGNS, 'enable_churn': True, 'churn_model': 'cohort'}
+}
+
+
+@pytest.fixture(params=sorted(CONFIGS))
+def service(request):
+    return ProjectionService.from_config(CONFIGS[request.param])
+
+
+def test_month_granularity_matches_monthly_model(service):
+    monthly = service.calculate_projections(24)
+    periods = service.calculate_period_projections(24, "month", start_date=START_DATE)
+
+    for column in ('base_users', 'campaign_users', 'total_users', 'total_revenue'):
+        np.testing.assert_allclose(periods[column], monthly[column], rtol=1e-12, atol=1e-9)
+
+
+@pytest.mark.parametrize("granularity", ["day", "week", "month"])
+def test_users_split_without_negative_base(service, granularity):
+    periods = service.calculate_period_projections(12, granularity, start_date=START_DATE)
+
+    assert (periods['base_users'] >= 0).all()
+    assert (periods['campaign_users'] >= 0).all()
+    np.testing.assert_allclose(periods['base_users'] + periods['campaign_users'], periods['total_users'])
+
+
+@pytest.mark.parametrize("config", ["flat", "churn"])
+def test_daily_campaign_users_reach_monthly_values(config):
+    service = ProjectionService.from_config(CONFIGS[config])
+    monthly = service.calculate_projections(12)
+    resampled = service.resample_monthly(service.calculate_period_projections(12, "day", start_date=START_DATE))
+
+    np.testing.assert_allclose(resampled['campaign_users'], monthly['campaign_users'], rtol=1e-9, atol=1e-6)
+
+
+@pytest.mark.parametrize("granularity", ["day", "week", "month"])
+def test_stream_matches_period_projections(service, granularity):
+    periods = service.calculate_period_projections(12, granularity, start_date=START_DATE)
+    streamed = pd.concat(service.iter_projections(12, granularity, start_date=START_DATE, chunk_size=10))
+
+    pd.testing.assert_frame_equal(streamed, periods, check_exact=False, rtol=1e-10)
+
+
+@pytest.mark.parametrize("config", [
+    {},
+    {'campaigns': CAMPAIGNS, 'growth_scenario': 'Custom', 'custom_growth_rate': 5.0,
+     'enable_churn': True, 'churn_rate': 0.05}
+])
+def test_daily_month_ends_match_without_campaigns_or_net_growth(config):
+    service = ProjectionService.from_config(config)
+    monthly = service.calculate_projections(12)
+    resampled = service.resample_monthly(service.calculate_period_projections(12, "day", start_date=START_DATE))
+
+    np.testing.assert_allclose(resampled['total_users'], monthly['total_users'], rtol=1e-12)
+
+
+def test_daily_campaign_users_compound_from_arrival():
+    service = ProjectionService.from_config(CONFIGS['flat'])
+    monthly = service.calculate_projections(12)['total_users'].to_numpy()
+    resampled = service.resample_monthly(
+        service.calculate_period_projections(12, "day", start_date=START_DATE)
+    )['total_users'].to_numpy()
+
+    # Identical before the first campaign in month 2, then ahead by the growth on mid-month arrivals
+    np.testing.assert_allclose(resampled[0], monthly[0], rtol=1e-12)
+    assert np.all(resampled[1:] > monthly[1:])
+
+
+@pytest.mark.parametrize("config", ["flat", "churn"])
+def test_daily_revenue_is_the_average_users_of_each_month(config):
+    service = ProjectionService.from_config(CONFIGS[config])
+    periods = service.calculate_period_projections(12, "day", start_date=START_DATE)
+    resampled = service.resample_monthly(periods)
+    revenue_per_user = service.tier_matrix(12).revenue_per_user
+
+    average_users = periods.groupby('month')['total_users'].mean().to_numpy()
+    np.testing.assert_allclose(resampled['total_revenue'], average_users * revenue_per_user, rtol=1e-12)
+    # With growth, the month's average users sit below its closing users
+    assert np.all(resampled['total_revenue'].to_numpy() < service.calculate_projections(12)['total_revenue'].to_numpy())
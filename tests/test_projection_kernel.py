@@ -0,0 +1,159 @@
+import numpy as np
+import pytest
+from config.constants import DEFAULT_INITIAL_USERS, GROWTH_SCENARIOS, MAX_PROJECTION_MONTHS
+from services.projection_kernel import (
+    compound_with_inflows, cumulative_campaign_users, batch_cumulative_campaign_users
+)
+from services.projection_service import ProjectionService
+
+
+def random_config(rng) -> dict:
+    distribution = rng.dirichlet(np.ones(3))
+    campaigns = []
+    for idx in range(rng.integers(0, 6)):
+        campaigns.append({
+            'name': f'Campaign {idx}', 'campaign_id': f'c{idx}',
+            'start_month': int(rng.integers(1, 13)), 'duration_months': int(rng.integers(1, 13)),
+            'budget': 1000, 'expected_reach': int(rng.integers(1000, 100000)),
+            'reach_to_download_rate': float(rng.uniform(0.01, 0.2)),
+            'download_to_active_rate': float(rng.uniform(0.1, 0.8)),
+            'active_to_subscriber_rate': float(rng.uniform(0.1, 0.8))
+        })
+    config = {
+        'subscriptions': [
+            {'name': name, 'monthly_price': float(rng.uniform(1, 50)),
+             'distribution_percentage': float(share), 'features': []}
+            for name, share in zip(('Basic', 'Standard', 'Premium'), distribution)
+        ],
+        'campaigns': campaigns,
+        'enable_churn': bool(rng.integers(0, 2)),
+        'churn_rate': float(rng.uniform(0, 0.3))
+    }
+    if rng.integers(0, 2):
+        config['growth_scenario'] = str(rng.choice(list(GROWTH_SCENARIOS)))
+    else:
+        config.update(growth_scenario="Custom", custom_growth_rate=float(rng.uniform(1, 50)))
+    return config
+
+
+def month_loop(config: dict, months: int) -> dict:
+    """The original month-by-month projection, written as plain Python loops."""
+    if config['growth_scenario'] == "Custom":
+        growth_rate = config['custom_growth_rate'] / 100
+    else:
+        growth_rate = GROWTH_SCENARIOS[config['growth_scenario']]
+    net_growth_rate = growth_rate - config['churn_rate'] if config['enable_churn'] else growth_rate
+
+    campaign_users = [0.0] * months
+    for campaign in config['campaigns']:
+        new_users = (campaign['expected_reach'] * campaign['reach_to_download_rate']
+                     * campaign['download_to_active_rate'] * campaign['active_to_subscriber_rate'])
+        monthly_users = new_users / campaign['duration_months']
+        start = campaign['start_month'] - 1
+        for month in range(start, min(start + campaign['duration_months'], months)):
+            for later in range(month, months):
+                campaign_users[later] += monthly_users
+
+    total_users, base_users = [], []
+    previous = DEFAULT_INITIAL_USERS
+    for month in range(months):
+        base_users.append(previous * (1 + net_growth_rate))
+        total_users.append(base_users[-1] + campaign_users[month])
+        previous = total_users[-1]
+
+    revenue_per_user = sum(tier['monthly_price'] * tier['distribution_percentage'] for tier in config['subscriptions'])
+    return {
+        'base_users': np.array(base_users),
+        'campaign_users': np.array(campaign_users),
+        'total_users': np.array(total_users),
+        'total_revenue': np.array(total_users) * revenue_per_user
+    }
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_project_matches_month_loop(seed):
+    rng = np.random.default_rng(seed)
+    config = random_config(rng)
+    months = int(rng.integers(1, 37))
+    expected = month_loop(config, months)
+    result = ProjectionService.from_config(config).project(months)
+
+    for column, values in expected.items():
+        np.testing.assert_allclose(getattr(result, column), values, rtol=1e-9, atol=1e-9, err_msg=column)
+
+
+@pytest.mark.parametrize("months", [120, MAX_PROJECTION_MONTHS])
+def test_long_horizons_match_month_loop_and_month_periods(months):
+    config = random_config(np.random.default_rng(1))
+    config.update(growth_scenario="Custom", custom_growth_rate=2.0)
+    service = ProjectionService.from_config(config)
+    result = service.project(months)
+    expected = month_loop(config, months)
+
+    np.testing.assert_allclose(result.total_users, expected['total_users'], rtol=1e-9)
+    np.testing.assert_allclose(result.total_revenue, expected['total_revenue'], rtol=1e-9)
+    periods = service.calculate_period_projections(months, "month", start_date="2025-01-01")
+    np.testing.assert_allclose(periods['total_revenue'].to_numpy(), result.total_revenue, rtol=1e-9)
+
+
+def test_both_engines_share_the_month_limit():
+    service = ProjectionService.from_config({})
+    with pytest.raises(ValueError, match=str(MAX_PROJECTION_MONTHS)):
+        service.project(MAX_PROJECTION_MONTHS + 1)
+    with pytest.raises(ValueError, match=str(MAX_PROJECTION_MONTHS)):
+        service.calculate_period_projections(MAX_PROJECTION_MONTHS + 1, "month")
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_compound_with_inflows_matches_month_loop(seed):
+    rng = np.random.default_rng(seed)
+    periods = int(rng.integers(1, 400))
+    growth_rate = rng.uniform(-0.5, 0.5)
+    inflows = rng.uniform(0, 100, periods)
+    initial_users = rng.uniform(1, 1000)
+
+    expected = np.empty(periods)
+    previous = initial_users
+    for t in range(periods):
+        previous = (1 + growth_rate) * previous + inflows[t]
+        expected[t] = previous
+
+    np.testing.assert_allclose(compound_with_inflows(growth_rate, inflows, initial_users), expected, rtol=1e-9)
+
+
+def test_compound_with_inflows_broadcasts_scenarios():
+    rng = np.random.default_rng(0)
+    growth_rates = rng.uniform(-0.2, 0.3, 5)
+    inflows = rng.uniform(0, 50, 24)
+    totals = compound_with_inflows(growth_rates, inflows, 100.0)
+
+    assert totals.shape == (5, 24)
+    for row, growth_rate in enumerate(growth_rates):
+        np.testing.assert_allclose(totals[row], compound_with_inflows(growth_rate, inflows, 100.0), rtol=1e-12)
+
+
+def test_compound_with_inflows_survives_long_horizons():
+    # 10% monthly growth over 50 years overflows a single block of growth factors
+    totals = compound_with_inflows(0.1, np.zeros(600), 1.0)
+
+    assert np.all(np.isfinite(totals))
+    np.testing.assert_allclose(np.log(totals[-1]), 600 * np.log(1.1), rtol=1e-12)
+
+
+def test_compound_with_inflows_rejects_total_loss():
+    with pytest.raises(ValueError):
+        compound_with_inflows(-1.0, np.ones(3), 100.0)
+
+
+def test_cumulative_campaign_users_drops_acquisition_past_horizon():
+    # 1200 users over 12 months starting in month 6: only months 6..8 land in a 8-month horizon
+    users = cumulative_campaign_users([6], [12], [1200.0], 8)
+
+    np.testing.assert_allclose(users, [0, 0, 0, 0, 0, 100, 200, 300])
+
+
+def test_campaign_users_are_float_without_campaigns():
+    assert cumulative_campaign_users([], [], [], 6).dtype == np.float64
+    empty = np.zeros((3, 0), dtype=np.int64)
+    assert batch_cumulative_campaign_users(empty, empty, empty.astype(float), 6).dtype == np.float64
+    assert ProjectionService.from_config({}).project(6).campaign_users.dtype == np.float64
@@ -0,0 +1,61 @@
+import io
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from models.projection_results import ProjectionResult
+from services.projection_service import ProjectionService
+
+CAMPAIGNS = [
+    {
+        'name': 'Launch', 'campaign_id': 'launch', 'start_month': 2, 'duration_months': 3,
+        'budget': 1000, 'expected_reach': 50000, 'reach_to_download_rate': 0.05,
+        'download_to_active_rate': 0.3, 'active_to_subscriber_rate': 0.5
+    },
+    {
+        'name': 'Été', 'campaign_id': 'ete', 'start_month': 6, 'duration_months': 2,
+        'budget': 500, 'expected_reach': 20000, 'reach_to_download_rate': 0.04,
+        'download_to_active_rate': 0.25, 'active_to_subscriber_rate': 0.4
+    }
+]
+
+
+@pytest.fixture(params=["flat", "cohort"])
+def result(request):
+    service = ProjectionService.from_config({
+        'enable_churn': True, 'churn_rate': 0.03, 'churn_model': request.param, 'campaigns': CAMPAIGNS
+    })
+    tier = service.subscriptions[0]
+    service.set_tier(tier.name, tier.monthly_price, tier.distribution_percentage, tier.features,
+                     price_schedule=[{'start_month': 5, 'monthly_price': tier.monthly_price + 2}])
+    return service.project(12)
+
+
+def assert_same_result(restored, result):
+    pd.testing.assert_frame_equal(restored.to_pandas(), result.to_pandas(), check_exact=True)
+    pd.testing.assert_frame_equal(restored.tier_frame(), result.tier_frame(), check_exact=True)
+    assert restored.tier_names == result.tier_names
+    assert restored.campaign_names == result.campaign_names
+
+
+def test_from_arrays_inverts_to_arrays(result):
+    assert_same_result(ProjectionResult.from_arrays(result.to_arrays()), result)
+
+
+def test_arrays_survive_an_npz_archive(result):
+    buffer = io.BytesIO()
+    np.savez(buffer, **result.to_arrays())
+    buffer.seek(0)
+    with np.load(buffer, allow_pickle=False) as archive:
+        restored = ProjectionResult.from_arrays({name: archive[name] for name in archive.files})
+
+    assert_same_result(restored, result)
+    assert restored.nbytes == result.nbytes
+
+
+def test_to_arrow_matches_the_pandas_frame(result):
+    table = result.to_arrow()
+
+    pd.testing.assert_frame_equal(table.to_pandas(), result.to_pandas(), check_exact=True)
+    assert json.loads(table.schema.metadata[b'tiers']) == list(result.tier_names)
+    assert json.loads(table.schema.metadata[b'campaigns']) == ['Launch', 'Été']
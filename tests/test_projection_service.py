@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from models.campaign import MarketingCampaign
+from services.projection_service import ProjectionService
+
+
+def make_campaign(rng, idx: int) -> MarketingCampaign:
+    return MarketingCampaign(
+        name=f'Campaign {idx}', campaign_id=f'c{idx}',
+        start_month=int(rng.integers(1, 13)), duration_months=int(rng.integers(1, 13)),
+        budget=1000, expected_reach=int(rng.integers(1000, 100000)),
+        reach_to_download_rate=0.05, download_to_active_rate=0.3, active_to_subscriber_rate=0.5
+    )
+
+
+def assert_matches_full_recompute(service: ProjectionService, months: int):
+    incremental = service.project(months)
+    fresh = ProjectionService.from_config(service.to_config()).project(months)
+
+    np.testing.assert_allclose(incremental.total_users, fresh.total_users, rtol=1e-12)
+    np.testing.assert_allclose(incremental.campaign_users, fresh.campaign_users, rtol=1e-12)
+    np.testing.assert_allclose(incremental.total_revenue, fresh.total_revenue, rtol=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_edits_match_full_recompute(seed):
+    rng = np.random.default_rng(seed)
+    service = ProjectionService.from_config({'enable_churn': True, 'churn_rate': 0.03})
+    added = []
+    for step in range(30):
+        action = rng.integers(0, 5)
+        if action <= 1 or not added:
+            added.append(make_campaign(rng, step))
+            service.add_campaign(added[-1])
+        elif action == 2:
+            service.remove_campaign(added.pop(int(rng.integers(0, len(added)))))
+        elif action == 3:
+            service.update(growth_scenario="Custom", custom_growth_rate=float(rng.uniform(1, 20)))
+        else:
+            service.update(churn_rate=float(rng.uniform(0, 0.1)))
+        assert_matches_full_recompute(service, int(rng.choice([12, 24, 36])))
+
+
+def test_recompute_starts_at_the_changed_campaign():
+    rng = np.random.default_rng(0)
+    service = ProjectionService.from_config({})
+    service.project(24)
+
+    campaign = make_campaign(rng, 0).model_copy(update={'start_month': 7})
+    service.add_campaign(campaign)
+    assert_matches_full_recompute(service, 24)
+    assert service.recomputed_from_month == 7
+
+    service.project(24)
+    assert service.recomputed_from_month is None
+
+    service.remove_campaign(campaign)
+    assert_matches_full_recompute(service, 24)
+    assert service.recomputed_from_month == 7
+
+
+def test_growth_change_recomputes_every_month():
+    service = ProjectionService.from_config({})
+    service.project(12)
+    service.update(growth_scenario="Custom", custom_growth_rate=15.0)
+
+    assert_matches_full_recompute(service, 12)
+    assert service.recomputed_from_month == 1
@@ -0,0 +1,104 @@
+import io
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from services.projection_service import ProjectionService
+from services.projection_sinks import iter_monthly, write_csv, write_jsonl, write_parquet
+
+START_DATE = "2025-01-01"
+MONTHS = 6
+CHUNK_SIZE = 25
+
+
+@pytest.fixture(params=["flat", "cohort"])
+def service(request):
+    return ProjectionService.from_config({
+        'enable_churn': True,
+        'churn_rate': 0.03,
+        'churn_model': request.param,
+        'campaigns': [{
+            'name': 'Launch', 'campaign_id': 'launch', 'start_month': 2, 'duration_months': 3,
+            'budget': 1000, 'expected_reach': 50000, 'reach_to_download_rate': 0.05,
+            'download_to_active_rate': 0.3, 'active_to_subscriber_rate': 0.5
+        }]
+    })
+
+
+def chunks(service, granularity="day", chunk_size=CHUNK_SIZE):
+    return service.iter_projections(MONTHS, granularity, start_date=START_DATE, chunk_size=chunk_size)
+
+
+def assert_same_frame(frame, service, rtol):
+    expected = service.calculate_period_projections(MONTHS, "day", start_date=START_DATE)
+    pd.testing.assert_frame_equal(frame, expected, check_dtype=False, check_freq=False, check_exact=False, rtol=rtol)
+
+
+def test_csv_round_trip(tmp_path, service):
+    path = tmp_path / "projections.csv"
+    rows = write_csv(chunks(service), path)
+    frame = pd.read_csv(path, index_col='date', parse_dates=['date'])
+
+    assert rows == len(frame)
+    assert_same_frame(frame, service, rtol=1e-12)
+
+
+def test_csv_to_an_open_stream_has_one_header(service):
+    stream = io.StringIO()
+    write_csv(chunks(service), stream)
+
+    assert not stream.closed
+    assert stream.getvalue().count('date,') == 1
+    stream.seek(0)
+    assert_same_frame(pd.read_csv(stream, index_col='date', parse_dates=['date']), service, rtol=1e-12)
+
+
+def test_jsonl_round_trip(tmp_path, service):
+    path = tmp_path / "projections.jsonl"
+    rows = write_jsonl(chunks(service), path)
+    frame = pd.read_json(path, lines=True, convert_dates=['date']).set_index('date')
+
+    assert rows == len(frame)
+    # to_json keeps ten significant decimals
+    assert_same_frame(frame, service, rtol=1e-9)
+
+
+def test_parquet_round_trip(tmp_path, service):
+    path = tmp_path / "projections.parquet"
+    rows = write_parquet(chunks(service), path)
+    file = pq.ParquetFile(path)
+
+    assert rows == file.metadata.num_rows
+    assert file.metadata.num_row_groups == -(-rows // CHUNK_SIZE)
+    assert_same_frame(file.read().to_pandas(), service, rtol=0)
+
+
+@pytest.mark.parametrize("granularity,chunk_size", [("day", 10), ("day", 45), ("week", 3), ("month", 1)])
+def test_iter_monthly_matches_resample_monthly(service, granularity, chunk_size):
+    periods = service.calculate_period_projections(MONTHS, granularity, start_date=START_DATE)
+    monthly = list(iter_monthly(chunks(service, granularity, chunk_size)))
+
+    pd.testing.assert_frame_equal(
+        pd.concat(monthly), service.resample_monthly(periods), check_freq=False, check_exact=False, rtol=1e-10
+    )
+    assert all(len(frame) for frame in monthly)
+
+
+def test_iter_monthly_stops_the_stream_early(service):
+    pulled = []
+
+    def counted(stream):
+        for chunk in stream:
+            pulled.append(len(chunk))
+            yield chunk
+
+    monthly = iter_monthly(counted(chunks(service, chunk_size=10)))
+    first = next(monthly)
+    monthly.close()
+
+    assert first['month'].tolist() == [1]
+    # January completes once a chunk reaches February: 40 of the ~181 days
+    assert sum(pulled) == 40
+    periods = service.calculate_period_projections(MONTHS, "day", start_date=START_DATE)
+    pd.testing.assert_frame_equal(
+        first, service.resample_monthly(periods).iloc[:1], check_freq=False, check_exact=False, rtol=1e-10
+    )
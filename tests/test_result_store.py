@@ -0,0 +1,87 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+from services.projection_service import ProjectionService
+from services.result_store import ProjectionResultStore
+
+MONTHS = 12
+FORMATS = ["ipc", "parquet"]
+
+
+@pytest.fixture
+def batch():
+    service = ProjectionService.from_config({'enable_churn': True, 'churn_rate': 0.02})
+    return service.calculate_projections_batch(MONTHS, growth_rates=np.linspace(0.01, 0.2, 25))
+
+
+def expected_rows(batch, scenario_ids, rows, months=(1, MONTHS)):
+    """(scenario_id, month, tier) -> (users, revenue) straight from the batch arrays."""
+    expected = {}
+    for scenario_id, row in zip(scenario_ids, rows):
+        for tier_idx, tier in enumerate(batch.tier_names):
+            for month in range(months[0], months[1] + 1):
+                expected[(scenario_id, month, tier)] = (
+                    batch.tier_users[row, tier_idx, month - 1], batch.tier_revenue[row, tier_idx, month - 1]
+                )
+    return expected
+
+
+def assert_rows(table, expected):
+    frame = table.to_pandas()
+    keys = list(zip(frame['scenario_id'], frame['month'], frame['tier']))
+    assert sorted(keys) == sorted(expected)
+    values = np.array([expected[key] for key in keys])
+    np.testing.assert_allclose(frame['users'], values[:, 0], rtol=1e-12)
+    np.testing.assert_allclose(frame['revenue'], values[:, 1], rtol=1e-12)
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+def test_round_trip(tmp_path, batch, file_format):
+    store = ProjectionResultStore(tmp_path, file_format, partition_size=10)
+    store.write_batch(batch)
+    table = store.read()
+
+    assert table.num_rows == batch.n_scenarios * len(batch.tier_names) * MONTHS
+    assert_rows(table, expected_rows(batch, range(25), range(25)))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["partition=0", "partition=1", "partition=2"]
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+def test_scenario_and_month_filters(tmp_path, batch, file_format):
+    store = ProjectionResultStore(tmp_path, file_format, partition_size=10)
+    store.write_batch(batch)
+    table = store.read(scenario_ids=[3, 17], months=(4, 6))
+
+    assert_rows(table, expected_rows(batch, [3, 17], [3, 17], months=(4, 6)))
+    assert store.read(scenario_ids=[3], columns=['users']).column_names == ['users']
+    assert len(store.read_pandas(scenario_ids=[24])) == len(batch.tier_names) * MONTHS
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+def test_reads_prune_other_partitions(tmp_path, batch, file_format):
+    store = ProjectionResultStore(tmp_path, file_format, partition_size=10)
+    store.write_batch(batch)
+    # Corrupt partition 2; reads of other partitions must never open it
+    for path in (tmp_path / "partition=2").iterdir():
+        path.write_bytes(b"not a table")
+
+    assert_rows(store.read(scenario_ids=[1, 12]), expected_rows(batch, [1, 12], [1, 12]))
+    with pytest.raises(pa.ArrowInvalid):
+        store.read()
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+def test_appended_batches_keep_their_ids(tmp_path, batch, file_format):
+    store = ProjectionResultStore(tmp_path, file_format, partition_size=10)
+    store.write_batch(batch)
+    store.write_batch(batch, scenario_ids=np.arange(100, 125))
+
+    assert store.read().num_rows == 2 * batch.n_scenarios * len(batch.tier_names) * MONTHS
+    assert_rows(store.read(scenario_ids=[105]), expected_rows(batch, [105], [5]))
+
+
+def test_invalid_arguments(tmp_path, batch):
+    with pytest.raises(ValueError, match="Format"):
+        ProjectionResultStore(tmp_path, "csv")
+    with pytest.raises(ValueError, match="25 scenario ids"):
+        ProjectionResultStore(tmp_path).write_batch(batch, scenario_ids=[1, 2])
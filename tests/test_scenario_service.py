@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from config.constants import GROWTH_SCENARIOS
+from services.projection_service import ProjectionService
+from services.scenario_service import compare_scenarios
+
+MONTHS = 24
+
+
+@pytest.fixture
+def service():
+    service = ProjectionService.from_config({
+        'enable_churn': True,
+        'churn_rate': 0.02,
+        'campaigns': [{
+            'name': 'Launch', 'campaign_id': 'launch', 'start_month': 3, 'duration_months': 6,
+            'budget': 1000, 'expected_reach': 50000, 'reach_to_download_rate': 0.05,
+            'download_to_active_rate': 0.3, 'active_to_subscriber_rate': 0.5
+        }]
+    })
+    service.save_scenario('Stretch', 0.15)
+    service.save_scenario('Flat', 0.0)
+    return service
+
+
+def test_rows_match_single_scenario_projections(service):
+    comparison = compare_scenarios(service, MONTHS)
+    config = service.to_config()
+
+    assert comparison.names == (*GROWTH_SCENARIOS, 'Stretch', 'Flat')
+    np.testing.assert_array_equal(comparison.months, np.arange(1, MONTHS + 1))
+    for row, (name, growth_rate) in enumerate(zip(comparison.names, comparison.growth_rates)):
+        single = ProjectionService.from_config({
+            **config, 'growth_scenario': 'Custom', 'custom_growth_rate': growth_rate * 100
+        }).calculate_projections(MONTHS)
+        np.testing.assert_allclose(comparison.total_users[row], single['total_users'], rtol=1e-12, err_msg=name)
+        np.testing.assert_allclose(comparison.total_revenue[row], single['total_revenue'], rtol=1e-12, err_msg=name)
+
+
+def test_summary_is_relative_to_the_baseline(service):
+    comparison = compare_scenarios(service, MONTHS)
+    summary = comparison.summary('Stretch')
+    base = comparison.index('Stretch')
+
+    np.testing.assert_allclose(summary['final_users'], comparison.total_users[:, -1])
+    np.testing.assert_allclose(summary['arr_delta'], comparison.total_revenue[:, -1] / comparison.total_revenue[base, -1] - 1)
+    assert summary.loc[base, 'total_revenue_delta'] == 0
+    with pytest.raises(ValueError, match="Unknown scenario"):
+        comparison.index('Missing')
@@ -0,0 +1,110 @@
+import copy
+import numpy as np
+import pytest
+from services.projection_service import ProjectionService
+from services.sensitivity_service import run_sensitivity
+
+MONTHS = 18
+STEP = 0.05
+CAMPAIGN_COLUMNS = ('expected_reach', 'reach_to_download_rate', 'download_to_active_rate', 'active_to_subscriber_rate')
+
+
+@pytest.fixture
+def config():
+    service = ProjectionService.from_config({
+        'growth_scenario': 'Custom',
+        'custom_growth_rate': 6.0,
+        'enable_churn': True,
+        'churn_rate': 0.03,
+        'campaigns': [
+            {
+                'name': 'Launch', 'campaign_id': 'launch', 'start_month': 2, 'duration_months': 4,
+                'budget': 1000, 'expected_reach': 50000, 'reach_to_download_rate': 0.05,
+                'download_to_active_rate': 0.3, 'active_to_subscriber_rate': 0.5
+            },
+            {
+                'name': 'Summer', 'campaign_id': 'summer', 'start_month': 7, 'duration_months': 3,
+                'budget': 2000, 'expected_reach': 80000, 'reach_to_download_rate': 0.04,
+                'download_to_active_rate': 0.25, 'active_to_subscriber_rate': 0.4
+            }
+        ]
+    })
+    tier = service.subscriptions[1]
+    service.set_tier(tier.name, tier.monthly_price, tier.distribution_percentage, tier.features,
+                     price_schedule=[{'start_month': 6, 'monthly_price': tier.monthly_price * 1.5}])
+    return service.to_config()
+
+
+def perturbations(config):
+    """Every input run_sensitivity perturbs, as a function scaling it in a config copy."""
+    def growth(config, factor):
+        config['custom_growth_rate'] *= factor
+
+    def churn(config, factor):
+        config['churn_rate'] *= factor
+
+    def tier_price(idx):
+        def apply(config, factor):
+            tier = config['subscriptions'][idx]
+            tier['monthly_price'] *= factor
+            for change in tier['price_schedule']:
+                change['monthly_price'] *= factor
+        return apply
+
+    def tier_distribution(idx):
+        def apply(config, factor):
+            config['subscriptions'][idx]['distribution_percentage'] *= factor
+        return apply
+
+    def campaign(idx, column):
+        def apply(config, factor):
+            config['campaigns'][idx][column] *= factor
+        return apply
+
+    inputs = [growth, churn]
+    for idx in range(len(config['subscriptions'])):
+        inputs += [tier_price(idx), tier_distribution(idx)]
+    for idx in range(len(config['campaigns'])):
+        inputs += [campaign(idx, column) for column in CAMPAIGN_COLUMNS]
+    return inputs
+
+
+def month_n_metrics(config, perturb=None, factor=1.0):
+    config = copy.deepcopy(config)
+    if perturb is not None:
+        perturb(config, factor)
+    last = ProjectionService.from_config(config).calculate_projections(MONTHS).iloc[-1]
+    return np.array([last['total_revenue'], last['total_revenue'] * 12, last['total_users']])
+
+
+def test_elasticities_match_finite_differences(config):
+    result = run_sensitivity(ProjectionService.from_config(config), MONTHS, STEP)
+    inputs = perturbations(config)
+    base = month_n_metrics(config)
+
+    assert len(result.parameters) == len(inputs)
+    np.testing.assert_allclose(result.base, base, rtol=1e-10)
+    for idx, perturb in enumerate(inputs):
+        low = month_n_metrics(config, perturb, 1 - STEP)
+        high = month_n_metrics(config, perturb, 1 + STEP)
+        np.testing.assert_allclose(result.low[idx], low, rtol=1e-10, err_msg=result.parameters[idx])
+        np.testing.assert_allclose(result.high[idx], high, rtol=1e-10, err_msg=result.parameters[idx])
+        np.testing.assert_allclose(
+            result.elasticities[idx], (high - low) / (2 * STEP * base), rtol=1e-8, atol=1e-12,
+            err_msg=result.parameters[idx]
+        )
+
+
+def test_churn_is_only_perturbed_when_enabled(config):
+    config['enable_churn'] = False
+    result = run_sensitivity(ProjectionService.from_config(config), MONTHS, STEP)
+
+    assert 'Churn Rate' not in result.parameters
+    assert result.groups[0] == 'growth'
+    assert set(result.groups) == {'growth', 'tier', 'campaign'}
+
+
+@pytest.mark.parametrize("step", [0.0, 1.0, -0.1])
+def test_invalid_step_is_rejected(config, step):
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        run_sensitivity(ProjectionService.from_config(config), MONTHS, step)
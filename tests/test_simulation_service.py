@@ -0,0 +1,88 @@
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from models.simulation import SimulationConfig
+from services import simulation_service
+from services.projection_service import ProjectionService
+from services.simulation_service import run_monte_carlo
+
+
+@pytest.fixture
+def service():
+    return ProjectionService.from_config({
+        'enable_churn': True,
+        'churn_rate': 0.03,
+        'campaigns': [{
+            'name': 'Launch', 'campaign_id': 'launch', 'start_month': 2, 'duration_months': 4,
+            'budget': 1000, 'expected_reach': 50000, 'reach_to_download_rate': 0.05,
+            'download_to_active_rate': 0.3, 'active_to_subscriber_rate': 0.5
+        }]
+    })
+
+
+@pytest.fixture
+def created_buffers(monkeypatch):
+    """Names of every shared memory block the simulation creates."""
+    names = []
+
+    def recording(*args, **kwargs):
+        shm = shared_memory.SharedMemory(*args, **kwargs)
+        if kwargs.get('create'):
+            names.append(shm.name)
+        return shm
+    monkeypatch.setattr(simulation_service, "shared_memory", SimpleNamespace(SharedMemory=recording))
+    return names
+
+
+def assert_unlinked(names):
+    assert names
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+def test_bands_do_not_depend_on_worker_count(service):
+    config = SimulationConfig.with_spread(0.2, paths=2000, chunk_size=250, seed=11)
+    serial = run_monte_carlo(service, 12, config.model_copy(update={'workers': 1}))
+    parallel = run_monte_carlo(service, 12, config.model_copy(update={'workers': 2}))
+
+    np.testing.assert_array_equal(serial.users, parallel.users)
+    np.testing.assert_array_equal(serial.revenue, parallel.revenue)
+    assert serial.users.shape == (len(serial.percentiles), 12)
+
+
+def test_seed_changes_the_bands(service):
+    config = SimulationConfig.with_spread(0.2, paths=500, chunk_size=100, workers=1)
+    first = run_monte_carlo(service, 12, config.model_copy(update={'seed': 1}))
+    second = run_monte_carlo(service, 12, config.model_copy(update={'seed': 2}))
+
+    assert not np.array_equal(first.users, second.users)
+
+
+def test_zero_spread_collapses_to_the_projection(service):
+    simulation = run_monte_carlo(service, 12, SimulationConfig.with_spread(0.0, paths=64, workers=1))
+    projection = service.project(12)
+
+    for percentile in simulation.percentiles:
+        np.testing.assert_allclose(simulation.band('users', percentile), projection.total_users, rtol=1e-12)
+        np.testing.assert_allclose(simulation.band('revenue', percentile), projection.total_revenue, rtol=1e-12)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_shared_buffers_are_unlinked(service, created_buffers, workers):
+    config = SimulationConfig.with_spread(0.2, paths=400, chunk_size=100, workers=workers)
+    run_monte_carlo(service, 12, config)
+
+    assert len(created_buffers) == 2
+    assert_unlinked(created_buffers)
+
+
+def test_shared_buffers_are_unlinked_when_a_chunk_fails(service, created_buffers, monkeypatch):
+    def fail(task):
+        raise RuntimeError("chunk failed")
+    monkeypatch.setattr(simulation_service, "_simulate_chunk", fail)
+
+    with pytest.raises(RuntimeError, match="chunk failed"):
+        run_monte_carlo(service, 12, SimulationConfig(paths=100, workers=1))
+    assert_unlinked(created_buffers)
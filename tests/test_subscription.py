@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from models.subscription import PriceChange
+from models.tier_matrix import TierMatrix
+from services.projection_service import ProjectionService
+
+
+def test_price_changes_apply_past_the_monthly_horizon():
+    service = ProjectionService.from_config({})
+    basic = service.subscriptions[0]
+    service.set_tier(basic.name, basic.monthly_price, basic.distribution_percentage, basic.features,
+                     price_schedule=[PriceChange(start_month=100, monthly_price=9.0)])
+
+    prices = TierMatrix.from_tiers(service.subscriptions, 120).prices[0]
+    assert prices[98] == basic.monthly_price and prices[99] == 9.0
+
+    monthly = service.resample_monthly(service.calculate_period_projections(120, "day", start_date="2025-01-01"))
+    jump = monthly['total_revenue'].to_numpy()[99] / monthly['total_revenue'].to_numpy()[98]
+    assert jump > 1.1
+
+
+def test_changes_past_the_horizon_are_ignored():
+    service = ProjectionService.from_config({})
+    basic = service.subscriptions[0]
+    baseline = service.project(12).total_revenue
+    service.set_tier(basic.name, basic.monthly_price, basic.distribution_percentage, basic.features,
+                     price_schedule=[PriceChange(start_month=48, monthly_price=9.0)])
+
+    np.testing.assert_array_equal(service.project(12).total_revenue, baseline)
+
+
+@pytest.mark.parametrize("start_month", [0, 601])
+def test_price_change_month_bounds(start_month):
+    with pytest.raises(ValueError):
+        PriceChange(start_month=start_month, monthly_price=5.0)